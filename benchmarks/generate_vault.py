@@ -0,0 +1,330 @@
+"""
+Synthetic Vault Generator for AI Employee
+
+This script builds a throwaway vault that looks like one that has been in use
+for a while, so the tiers can be benchmarked at realistic scale:
+
+- Needs_Action: file drops (with .original.* attachments), emails, WhatsApp
+  messages and social requests waiting to be processed
+- Done: completed actions in the dated Done/YYYY/MM/DD archive
+- Plans/Pending_Approval: approval requests, including social media approvals
+- Plans/Approved/Social_Media: approved social posts ready to publish
+- Social_Posts: social media drafts
+- Logs: a week of audit logs
+
+Body sizes follow a log-normal distribution (median around 1.5 KB with a long
+tail), which matches what email and document-extraction action files look
+like. Output is deterministic for a given seed.
+
+Usage:
+    python generate_vault.py <vault_dir> [num_files] [--seed N]
+"""
+import os
+import sys
+import json
+import math
+import random
+import logging
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict
+
+# Add the gold tier directory to path for shared modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gold'))
+
+from done_archive import DoneArchive
+from vault_fs import get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Share of the generated files that goes to each folder
+FOLDER_SHARES = {
+    "Needs_Action": 0.20,
+    "Done": 0.45,
+    "Plans/Pending_Approval": 0.10,
+    "Social_Posts": 0.10,
+    "Logs": 0.15,
+}
+
+# Log-normal body size parameters (bytes): median ~1.5 KB, capped at 256 KB
+BODY_SIZE_MU = math.log(1500)
+BODY_SIZE_SIGMA = 1.1
+MAX_BODY_SIZE = 256 * 1024
+
+# Log-normal attachment size parameters (bytes): median ~8 KB, capped at 512 KB
+ATTACHMENT_SIZE_MU = math.log(8000)
+ATTACHMENT_SIZE_SIGMA = 1.3
+MAX_ATTACHMENT_SIZE = 512 * 1024
+
+# Audit events written per generated "Logs" file slot
+EVENTS_PER_LOG_SLOT = 20
+
+WORDS = (
+    "the a to and of for on with please review update team meeting report "
+    "schedule project client invoice payment business personal family work "
+    "linkedin post tweet social facebook instagram urgent asap critical "
+    "confidential salary bank money financial office appointment vacation "
+    "question help deadline budget proposal contract launch campaign draft"
+).split()
+
+ACTION_KINDS = [
+    # (name prefix, frontmatter type, weight)
+    ("ACTION", "file_drop", 0.45),
+    ("EMAIL", "email", 0.30),
+    ("ACTION", "whatsapp_message", 0.15),
+    ("ACTION", "social_media_request", 0.10),
+]
+
+ATTACHMENT_EXTENSIONS = [".pdf", ".docx", ".csv", ".xlsx", ".png", ".jpg", ".txt", ".zip", ".eml"]
+
+PLATFORMS = ["twitter", "facebook", "instagram", "linkedin"]
+PRIORITIES = ["low", "medium", "medium", "high"]
+
+
+def _body(rng: random.Random) -> str:
+    """Random markdown body with a log-normal size."""
+    size = min(int(rng.lognormvariate(BODY_SIZE_MU, BODY_SIZE_SIGMA)), MAX_BODY_SIZE)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    lines = [' '.join(words[i:i + 14]) for i in range(0, len(words), 14)]
+    return '\n'.join(lines) + '\n'
+
+
+def _created(rng: random.Random, now: datetime, max_days: int = 30) -> datetime:
+    return now - timedelta(seconds=rng.randint(0, max_days * 86400))
+
+
+def _split(total: int) -> Dict[str, int]:
+    counts = {folder: int(total * share) for folder, share in FOLDER_SHARES.items()}
+    counts["Needs_Action"] += total - sum(counts.values())
+    return counts
+
+
+def _write_action(folder: Path, index: int, rng: random.Random, now: datetime,
+                  status: str = "pending") -> Path:
+    prefix, action_type, _ = rng.choices(ACTION_KINDS, weights=[k[2] for k in ACTION_KINDS])[0]
+    created = _created(rng, now)
+    stamp = created.strftime('%Y%m%d_%H%M%S')
+    extra = ""
+
+    if action_type == "file_drop":
+        ext = rng.choice(ATTACHMENT_EXTENSIONS)
+        name = f"{prefix}_{stamp}_{index:07d}_document{ext}.md"
+        attachment = (folder / name).with_suffix('.original' + ext)
+        attachment_size = min(int(rng.lognormvariate(ATTACHMENT_SIZE_MU, ATTACHMENT_SIZE_SIGMA)),
+                              MAX_ATTACHMENT_SIZE)
+        block = rng.randbytes(4096)
+        attachment.write_bytes((block * (attachment_size // 4096 + 1))[:attachment_size])
+        extra = (f"original_name: document{ext}\n"
+                 f"extension: {ext}\n"
+                 f"original_file: {attachment.name}\n"
+                 f"original_size: {attachment.stat().st_size}\n")
+    elif action_type == "email":
+        name = f"{prefix}_GMAIL_{stamp}_{index:07d}.md"
+        extra = f"from: sender{index % 500}@example.com\nsubject: Re: {' '.join(rng.sample(WORDS, 4))}\n"
+    elif action_type == "social_media_request":
+        name = f"{prefix}_{stamp}_{index:07d}_social_request.md"
+        extra = f"platform: {rng.choice(PLATFORMS)}\n"
+    else:
+        name = f"{prefix}_{stamp}_{index:07d}_whatsapp.md"
+
+    path = folder / name
+    path.write_text(f"""---
+type: {action_type}
+{extra}priority: {rng.choice(PRIORITIES)}
+status: {status}
+created: {created.isoformat()}
+---
+
+# {action_type.replace('_', ' ').title()}
+
+{_body(rng)}""", encoding='utf-8')
+    return path
+
+
+def _write_social_post(folder: Path, index: int, rng: random.Random, now: datetime) -> Path:
+    platform = rng.choice(PLATFORMS)
+    created = _created(rng, now)
+    path = folder / f"{platform.upper()}_POST_{created.strftime('%Y%m%d_%H%M%S')}_{index:07d}.md"
+    text = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(10, 45)))
+    path.write_text(f"""---
+type: social_media_post
+platform: {platform}
+status: draft
+created: {created.isoformat()}
+---
+
+# {platform.title()} Post
+
+## Content
+{text}
+
+## Hashtags
+#Business #Growth
+""", encoding='utf-8')
+    return path
+
+
+def _write_social_approval(folder: Path, post: Path, index: int, now: datetime) -> Path:
+    platform = post.name.split('_', 1)[0].lower()
+    path = folder / f"SOCIAL_APPROVAL_{platform.upper()}_{index:07d}.md"
+    path.write_text(f"""---
+type: social_media_approval
+platform: {platform}
+status: pending
+created: {now.isoformat()}
+source_file: {post}
+reason: Scheduled social media post
+requires_api: {platform in ('twitter', 'linkedin')}
+---
+
+# Social Media Approval Request
+
+## Platform
+**{platform.upper()}**
+""", encoding='utf-8')
+    return path
+
+
+def _write_approval(folder: Path, index: int, rng: random.Random, now: datetime) -> Path:
+    created = _created(rng, now, max_days=7)
+    path = folder / f"APPROVAL_ACTION_{created.strftime('%Y%m%d_%H%M%S')}_{index:07d}.md"
+    path.write_text(f"""---
+type: approval_request
+action_source: ACTION_{index:07d}.md
+created: {created.isoformat()}
+status: pending
+---
+
+# Approval Required
+
+{_body(rng)}""", encoding='utf-8')
+    return path
+
+
+def _write_audit_logs(logs_dir: Path, events: int, rng: random.Random, now: datetime):
+    event_types = ["action_processing_start", "action_processing_success", "file_operation",
+                   "approval_action", "external_action", "action_processing_failed"]
+    days = 7
+    handles = {}
+    try:
+        for i in range(events):
+            day = now - timedelta(days=i % days)
+            log_file = logs_dir / f"audit_log_{day.strftime('%Y%m%d')}.jsonl"
+            if log_file not in handles:
+                handles[log_file] = log_file.open('a', encoding='utf-8')
+            event_type = rng.choice(event_types)
+            handles[log_file].write(json.dumps({
+                "timestamp": day.isoformat(),
+                "event_id": f"event_{i}",
+                "event_type": event_type,
+                "description": f"Synthetic {event_type}",
+                "actor": rng.choice(["orchestrator", "system", "user"]),
+                "target": None,
+                "result": "failed" if event_type.endswith("failed") else "success",
+                "parameters": {},
+                "metadata": {},
+                "session_id": "benchmark"
+            }) + "\n")
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+
+def generate_vault(vault_path: Path, num_files: int, seed: int = 0) -> Dict[str, int]:
+    """
+    Generate a synthetic vault.
+
+    Args:
+        vault_path: Directory to create the vault in (a VaultPath, or a path
+            registered with vault_fs, to generate into an in-memory vault)
+        num_files: Total number of files to spread across the vault folders
+        seed: Random seed (same seed, same vault)
+
+    Returns:
+        Number of generated files per folder
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    vault_path = get_vault_fs(vault_path).root
+    counts = _split(num_files)
+
+    needs_action = vault_path / "Needs_Action"
+    pending = vault_path / "Plans" / "Pending_Approval"
+    social_pending = pending / "Social_Media"
+    social_approved = vault_path / "Plans" / "Approved" / "Social_Media"
+    social_posts = vault_path / "Social_Posts"
+    logs = vault_path / "Logs"
+    for folder in [needs_action, social_pending, social_approved, social_posts, logs,
+                   vault_path / "Inbox", vault_path / "Plans" / "Rejected"]:
+        folder.mkdir(parents=True, exist_ok=True)
+
+    for i in range(counts["Needs_Action"]):
+        _write_action(needs_action, i, rng, now)
+
+    # Completed actions go through the real archive layout, then get indexed once
+    archive = DoneArchive(vault_path)
+    for i in range(counts["Done"]):
+        created = _created(rng, now, max_days=365)
+        partition = archive.done / created.strftime('%Y') / created.strftime('%m') / created.strftime('%d')
+        partition.mkdir(parents=True, exist_ok=True)
+        _write_action(partition, i, rng, now, status="done")
+    archive.rebuild_index()
+
+    for i in range(counts["Plans/Pending_Approval"]):
+        _write_approval(pending, i, rng, now)
+
+    # Half of the social drafts have been approved and are waiting to be published
+    for i in range(counts["Social_Posts"]):
+        post = _write_social_post(social_posts, i, rng, now)
+        target = social_approved if i % 2 == 0 else social_pending
+        _write_social_approval(target, post, i, now)
+
+    _write_audit_logs(logs, counts["Logs"] * EVENTS_PER_LOG_SLOT, rng, now)
+
+    (vault_path / "Dashboard.md").write_text("""# AI Employee Dashboard
+
+## Executive Summary
+This dashboard provides an overview of your AI Employee's activities and status.
+
+## Recent Activity
+- [ ] System initialization in progress
+
+## System Status
+- Watchers: Active
+- Last Update: never
+
+## Quick Stats
+- Files Processed: 0
+- Actions Taken: 0
+- Approval Requests: 0
+""", encoding='utf-8')
+
+    logger.info(f"Generated vault at {vault_path}: {counts}")
+    return counts
+
+
+def main():
+    """Generate a synthetic vault from the command line."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic AI Employee vault")
+    parser.add_argument("vault_dir", help="Directory to create the vault in")
+    parser.add_argument("num_files", nargs="?", type=int, default=1000, help="Total number of files")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    counts = generate_vault(Path(args.vault_dir), args.num_files, args.seed)
+    print(json.dumps(counts, indent=2))
+
+
+if __name__ == "__main__":
+    main()
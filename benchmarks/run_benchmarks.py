@@ -0,0 +1,253 @@
+"""
+Benchmark Runner for AI Employee
+
+This script times the main processing entry points of each tier against
+synthetic vaults (see generate_vault.py) and prints the results as JSON, so
+runs can be saved and compared across commits:
+
+    python run_benchmarks.py --sizes 1000 10000 --output results_$(git rev-parse --short HEAD).json
+
+Every benchmark gets a freshly generated vault, either in a temporary
+directory (--backend local) or held entirely in memory (--backend memory).
+Comparing the two separates processing overhead from filesystem cost. The
+token bucket that paces the bronze and silver orchestrators is given an
+effectively unlimited rate, and everything that would reach an external
+service (Twitter, LinkedIn, email) is replaced with a stub that reports
+success.
+"""
+import os
+import sys
+import json
+import time
+import types
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+import importlib.util
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(os.path.dirname(os.path.abspath(__file__))).parent
+
+# Add the gold tier directory to path for shared modules
+sys.path.append(str(REPO_ROOT / 'gold'))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from generate_vault import generate_vault
+from vault_fs import MemoryVaultFS, register_vault_fs, unregister_vault_fs
+from vault_index import get_vault_index
+from change_journal import active_change_journal
+from token_bucket import TokenBucket
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+BACKENDS = ["local", "memory"]
+
+# Token bucket rate and burst that never make an orchestrator wait
+UNTHROTTLED = 1e9
+
+
+def _load_module(name: str, path: Path) -> types.ModuleType:
+    """Load a tier script as a module under a unique name."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _unthrottled() -> TokenBucket:
+    """Token bucket that lets every file through at once."""
+    return TokenBucket(UNTHROTTLED, UNTHROTTLED)
+
+
+def _stub_publish(*args, **kwargs) -> Dict[str, Any]:
+    return {'success': True, 'post_id': 'BENCHMARK', 'note': 'stubbed publisher'}
+
+
+def _stub_publishers():
+    """Keep benchmarks off the network."""
+    from social_media_approval import SocialMediaApprovalWorkflow
+    from twitter_integration import TwitterIntegrator
+    import agent_skills.email_skill as email_skill
+
+    SocialMediaApprovalWorkflow._publish_post = lambda self, platform, text, content: _stub_publish()
+    TwitterIntegrator.post_tweet = lambda self, *args, **kwargs: _stub_publish()
+    email_skill.send_email = _stub_publish
+
+
+def bench_bronze_main(vault_path: Path) -> Any:
+    """bronze/orchestrator.main() (resolves the vault from VAULT_PATH), one unthrottled cycle."""
+    orchestrator = _load_module("bench_bronze_orchestrator", REPO_ROOT / "bronze" / "orchestrator.py")
+
+    overrides = {"VAULT_PATH": str(vault_path), "ORCHESTRATOR_MODE": "once",
+                 "ORCHESTRATOR_RATE": str(UNTHROTTLED), "ORCHESTRATOR_BURST": str(UNTHROTTLED)}
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        return orchestrator.main()
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+
+
+def bench_silver_process_needs_action(vault_path: Path) -> Any:
+    """silver_tier_orchestrator.process_needs_action_files(), unthrottled."""
+    orchestrator = _load_module("bench_silver_orchestrator",
+                                REPO_ROOT / "silver" / "silver_tier_orchestrator.py")
+    return orchestrator.process_needs_action_files(vault_path, pace=_unthrottled())
+
+
+def bench_gold_cycle(vault_path: Path) -> Any:
+    """GoldTierOrchestrator.run_complete_gold_tier_cycle()."""
+    from gold_tier_orchestrator import GoldTierOrchestrator
+    results = GoldTierOrchestrator(vault_path).run_complete_gold_tier_cycle()
+    return {"processed_actions": results.get("processed_actions")}
+
+
+def bench_social_approved_posts(vault_path: Path) -> Any:
+    """SocialMediaApprovalWorkflow.process_approved_posts()."""
+    from social_media_approval import SocialMediaApprovalWorkflow
+    results = SocialMediaApprovalWorkflow(vault_path).process_approved_posts()
+    return {key: value for key, value in results.items() if key != 'details'}
+
+
+def bench_audit_summary(vault_path: Path) -> Any:
+    """AuditLogger.get_audit_summary()."""
+    from audit_logger import AuditLogger
+    summary = AuditLogger(vault_path).get_audit_summary(days=7)
+    return {"total_events": summary["total_events"]}
+
+
+BENCHMARKS: Dict[str, Callable[[Path], Any]] = {
+    "bronze_main": bench_bronze_main,
+    "silver_process_needs_action": bench_silver_process_needs_action,
+    "gold_complete_cycle": bench_gold_cycle,
+    "social_process_approved_posts": bench_social_approved_posts,
+    "audit_get_summary": bench_audit_summary,
+}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _run_on_vault(name: str, vault_path: Path, size: int, seed: int) -> Dict[str, Any]:
+    """Generate a vault at vault_path, then time one benchmark on it."""
+    start = time.perf_counter()
+    counts = generate_vault(vault_path, size, seed)
+    generate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    error = None
+    try:
+        outcome = BENCHMARKS[name](vault_path)
+    except Exception as e:
+        outcome = None
+        error = f"{type(e).__name__}: {e}"
+    seconds = time.perf_counter() - start
+
+    # Release the shared index and journal before the vault goes away
+    get_vault_index(vault_path).close()
+    journal = active_change_journal(vault_path)
+    if journal is not None:
+        journal.close()
+
+    return {
+        "files": counts,
+        "seconds": round(seconds, 4),
+        "generate_seconds": round(generate_seconds, 4),
+        "outcome": outcome,
+        "error": error
+    }
+
+
+def run_benchmark(name: str, size: int, seed: int = 0, backend: str = "local") -> Dict[str, Any]:
+    """
+    Run one benchmark against a freshly generated vault.
+
+    Args:
+        name: Benchmark name (key of BENCHMARKS)
+        size: Number of files in the generated vault
+        seed: Vault generator seed
+        backend: "local" for a temporary directory, "memory" for an in-memory vault
+
+    Returns:
+        Result record with generation and run timings
+    """
+    result = {"benchmark": name, "backend": backend, "size": size}
+
+    if backend == "memory":
+        fs = register_vault_fs(MemoryVaultFS())
+        try:
+            result.update(_run_on_vault(name, fs.root, size, seed))
+        finally:
+            unregister_vault_fs(fs)
+    else:
+        with tempfile.TemporaryDirectory(prefix="ai_employee_bench_") as tmp:
+            result.update(_run_on_vault(name, Path(tmp) / "AI_Employee_Vault", size, seed))
+
+    return result
+
+
+def main():
+    """Run the selected benchmarks and print JSON results."""
+    parser = argparse.ArgumentParser(description="Benchmark the AI Employee tiers on synthetic vaults")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Vault sizes (total files) to benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--seed", type=int, default=0, help="Vault generator seed")
+    parser.add_argument("--backend", nargs="+", choices=BACKENDS, default=["local"],
+                        help="Vault backends to run on (memory skips disk I/O entirely)")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    parser.add_argument("--verbose", action="store_true", help="Keep INFO logging from the tiers")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        # Per-file INFO logging would dominate the timings at larger sizes
+        logging.disable(logging.INFO)
+
+    _stub_publishers()
+
+    results: List[Dict[str, Any]] = []
+    for backend in args.backend:
+        for size in args.sizes:
+            for name in args.only or BENCHMARKS:
+                result = run_benchmark(name, size, args.seed, backend)
+                results.append(result)
+                print(f"{name:32s} {backend:6s} size={size:<7d} {result['seconds']:>10.3f}s"
+                      + (f"  ERROR {result['error']}" if result['error'] else ""), file=sys.stderr)
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results
+    }
+
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding='utf-8')
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
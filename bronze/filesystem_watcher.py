@@ -3,15 +3,79 @@ File System Watcher for AI Employee
 
 This script monitors a designated drop folder and creates action files
 when new files are detected, moving them to the /Needs_Action folder.
+
+A drop is only picked up once it has been completely written: events for a
+path are debounced, and the file must either have been closed by its writer
+(IN_CLOSE_WRITE on Linux) or keep the same size and mtime for a settle
+interval (see gold/quiescence.py).
+
+Completed drops are handed to a pool of worker threads through a bounded
+queue (see gold/worker_pool.py), so moving files and writing action files
+never holds up event handling. When the queue is full, handing over blocks
+and drops keep waiting in the quiescence tracker. Set INBOX_WORKERS and
+INBOX_QUEUE_SIZE to size the pool.
+
+At startup, and whenever the observer has to be restarted, a catch-up scan
+hands files that arrived while nobody was watching to the same pipeline. An
+ingest marker (Inbox/.ingest_marker.jsonl, see gold/ingest_marker.py) lets it
+finish ingests that were interrupted and skip drops that were already handled.
+
+Originals are moved next to their action file with VaultFS.relocate(), which
+renames when it can and otherwise copies while hashing. The size, SHA-256 and
+routing header come from that single pass, so a drop is never read again just
+to fingerprint it.
+
+A drop whose content was dropped before (same SHA-256) does not become a new
+action: it is recorded as a repeat of the first one in the content index
+(.blobs/, see gold/content_index.py) and removed, since the blob already
+holds its content. The first drop's action file gets a `repeats:` count and
+`last_repeat:` time in its frontmatter, unless a tier is part-way through it.
+
+PDF, DOCX, CSV and XLSX drops are summarised into their action file by an
+extraction process pool with per-job time and memory limits (see
+gold/extraction.py; EXTRACT_WORKERS, EXTRACT_TIMEOUT, EXTRACT_MEMORY_MB).
+
+On network shares (NFS, SMB), where inotify events never arrive, the folder is
+watched by snapshot polling instead (see gold/snapshot_observer.py). Set
+INBOX_OBSERVER to native, polling or auto (the default, which checks the
+mount type), and INBOX_POLL_INTERVAL / INBOX_POLL_MAX_INTERVAL for the tick.
+
+Subfolders of the Inbox are watched too. A subfolder can set the priority,
+action type, auto-approval and target tier of its drops with a
+.inbox_policy.json file, inherited by its own subfolders (see
+gold/folder_policy.py); the fields end up in the action file's frontmatter.
 """
+import os
+import sys
 import time
 import logging
+import posixpath
+import threading
 from pathlib import Path
-import shutil
 from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# Add the gold tier directory to path for shared modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gold'))
+from vault_fs import Fingerprint, get_vault_fs
+from change_journal import get_change_journal
+from quiescence import DEBOUNCE_SECONDS, SETTLE_SECONDS, QuiescenceTracker
+from worker_pool import DEFAULT_QUEUE_SIZE, DEFAULT_WORKERS, WorkerPool
+from config_loader import get_env_variable
+from ingest_marker import IngestMarker, ingest_key
+from action_ids import create_new_file, new_id
+from drop_routing import ROUTE_FIELDS, SNIFF_BYTES, RoutingTable
+from folder_policy import POLICY_FILENAME, FolderPolicies
+from content_index import ContentIndex
+from action_ledger import ActionLedger
+from done_archive import DoneArchive
+from frontmatter import update_frontmatter
+from snapshot_observer import (MAX_INTERVAL as POLL_MAX_INTERVAL, MIN_INTERVAL as POLL_MIN_INTERVAL,
+                               SnapshotPollingObserver, is_network_path)
+from extraction import (DEFAULT_MEMORY_MB as EXTRACT_MEMORY_MB, DEFAULT_TIMEOUT as EXTRACT_TIMEOUT,
+                        DEFAULT_WORKERS as EXTRACT_WORKERS, Extractor, format_summary)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,11 +87,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Partial downloads and editor/sync-client temp files; they are picked up when
+# renamed to their final name. Suffixes must match exactly (a .tmpl template is
+# a real drop); name prefixes cover Office lock files (~$report.docx),
+# LibreOffice locks (.~lock.report.odt#) and other hidden files
+TEMP_SUFFIXES = ('.tmp', '.part', '.partial', '.crdownload', '.download')
+TEMP_PREFIXES = ('~', '.')
+
 class DropFolderHandler(FileSystemEventHandler):
     """Handles file system events in the drop folder"""
 
-    def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+    def __init__(self, vault_path: str, debounce: float = DEBOUNCE_SECONDS,
+                 settle: float = SETTLE_SECONDS, workers: int = DEFAULT_WORKERS,
+                 max_queue: int = DEFAULT_QUEUE_SIZE, routes_path: str = None,
+                 extract_workers: int = EXTRACT_WORKERS, extract_timeout: int = EXTRACT_TIMEOUT,
+                 extract_memory_mb: int = EXTRACT_MEMORY_MB):
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
         self.needs_action = self.vault_path / 'Needs_Action'
         self.drop_folder = self.vault_path / 'Inbox'
 
@@ -35,62 +111,300 @@ class DropFolderHandler(FileSystemEventHandler):
         self.needs_action.mkdir(exist_ok=True)
         self.drop_folder.mkdir(exist_ok=True)
 
-    def on_created(self, event):
-        if event.is_directory:
-            return
-        source = Path(event.src_path)
+        # New action files are journaled for the gold consumers
+        self.journal = get_change_journal(self.vault_path)
 
-        # Skip temporary files that may be in the process of being written
-        if source.suffix.startswith('.tmp') or source.name.startswith('~'):
-            return
+        # Drops become action files only once they are completely written
+        self.settle = settle
+        self.quiescence = QuiescenceTracker(self._on_quiescent, self.vault_path, debounce, settle)
+
+        # Action files are created on worker threads; a path is claimed from
+        # hand-over until its worker is done, so it is never processed twice
+        self.pool = WorkerPool(self._process_drop, workers, max_queue, name="inbox-worker")
+        self._claimed = set()
+        self._claimed_lock = threading.Lock()
+
+        # Persistent record of ingested drops, for the catch-up scan
+        self.marker = IngestMarker(self.drop_folder)
 
-        # Check if file exists and is accessible
-        if not source.exists():
-            logger.warning(f"File no longer exists: {source.name}")
+        # Content seen in earlier drops; repeats do not become new actions but
+        # are counted on the first drop's action file, wherever it is now
+        self.contents = ContentIndex(self.vault_path)
+        self.ledger = ActionLedger(self.vault_path)
+        self.archive = DoneArchive(self.vault_path)
+
+        # Document and data extraction on a separate, resource-limited process pool
+        self.extractor = Extractor(self.vault_path, extract_workers, extract_timeout, extract_memory_mb)
+
+        # Routing table, compiled once (the bundled one unless routes_path is given)
+        self.routes = RoutingTable.from_file(routes_path)
+
+        # Per-subfolder policies (routing table "folders" and .inbox_policy.json files)
+        self.policies = FolderPolicies(self.drop_folder, self.routes.folders)
+
+    def _is_temporary(self, source: Path) -> bool:
+        return (source.name.startswith(TEMP_PREFIXES)
+                or source.suffix.lower() in TEMP_SUFFIXES)
+
+    def _relative(self, path) -> str:
+        """Path relative to the drop folder, or "" if it is outside or in a hidden folder."""
+        try:
+            relative = self.fs.path(path).relative_to(self.drop_folder).as_posix()
+        except ValueError:
+            return ""
+        if relative == "." or any(part.startswith('.') for part in relative.split('/')[:-1]):
+            return ""
+        return relative
+
+    def _track(self, path: str, closed: bool = False):
+        source = self.fs.path(path)
+        if not self._relative(source):
+            return
+        if source.name == POLICY_FILENAME:
+            self.policies.reload(source)
+            return
+        if self._is_temporary(source):
             return
+        self.quiescence.touch(source, closed)
 
-        logger.info(f"New file detected: {source.name}")
+    def _untrack(self, path: str):
+        if os.path.basename(path) == POLICY_FILENAME and self._relative(path):
+            self.policies.forget(path)
+        else:
+            self.quiescence.forget(path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._track(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._track(event.src_path)
 
-        # Create an action file in Needs_Action folder
-        self.create_action_file(source)
+    def on_closed(self, event):
+        if not event.is_directory:
+            self._track(event.src_path, closed=True)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._untrack(event.src_path)
 
     def on_moved(self, event):
         if event.is_directory:
+            # Its files are reported as moved one by one
             return
-        source = Path(event.src_path)
-        logger.info(f"File moved to drop folder: {source.name}")
-        self.create_action_file(source)
+        # e.g. a download renamed from its .part name once complete
+        self._untrack(event.src_path)
+        self._track(event.dest_path)
+
+    def _on_quiescent(self, source: Path, st: os.stat_result):
+        with self._claimed_lock:
+            if source in self._claimed:
+                # Changed again while still queued or in progress; look at it
+                # once more after the current hand-over is done
+                self.quiescence.touch(source)
+                return
+            self._claimed.add(source)
+        logger.info(f"New file detected: {source.name} ({st.st_size} bytes)")
+        # Blocks while the queue is full
+        self.pool.submit(source)
+
+    def _process_drop(self, source: Path):
+        try:
+            if not source.exists():
+                logger.warning(f"File no longer exists: {source.name}")
+                return
+            self.create_action_file(source)
+        finally:
+            with self._claimed_lock:
+                self._claimed.discard(source)
+
+    def catch_up(self) -> int:
+        """
+        Reconcile the Inbox with what has been ingested.
+
+        Finishes ingests that were interrupted after their drop was moved,
+        then hands every file still in the Inbox to the same pipeline as new
+        drops. Files the marker shows as already ingested are left alone.
+
+        Returns:
+            Number of files handed to the pipeline
+        """
+        with self._claimed_lock:
+            in_progress = {self._relative(source) for source in self._claimed}
+
+        for claim in self.marker.unfinished():
+            if claim["name"] in in_progress:
+                continue
+            action_path = self.needs_action / claim["action"]
+            original_copy = self.needs_action / claim["original"]
+            if action_path.exists():
+                self.marker.done(claim["action"])
+            elif original_copy.exists():
+                logger.info(f"Finishing interrupted ingest of {claim['name']}")
+                folder, original_name = posixpath.split(claim["name"])
+                self._finish_ingest(action_path, original_copy, original_name, folder)
+                self.marker.done(claim["action"])
+            else:
+                # The drop was never moved; it is picked up from the Inbox below
+                self.marker.abandon(claim["action"])
+
+        handled = set()
+        queued = 0
+        now = time.time()
+        pending = [self.drop_folder]
+        while pending:
+            folder = pending.pop()
+            try:
+                entries = self.fs.scandir(folder)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                source = folder / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.'):
+                        pending.append(source)
+                    continue
+                if not entry.is_file(follow_symlinks=False) or self._is_temporary(source):
+                    continue
+                relative = self._relative(source)
+                st = entry.stat(follow_symlinks=False)
+                if self.marker.is_done(relative, st):
+                    handled.add(ingest_key(relative, st))
+                    logger.warning(f"{relative} was already ingested; leaving it in the Inbox")
+                    continue
+                # A file unchanged for a settle interval already needs no watching
+                self.quiescence.touch(source, closed=now - st.st_mtime >= self.settle)
+                queued += 1
+
+        self.marker.compact(lambda key: key in handled)
+        logger.info(f"Catch-up scan found {queued} file(s) waiting in the Inbox")
+        return queued
+
+    def metrics(self) -> dict:
+        """Queue depth, per-file latency and quiescence counters."""
+        return {
+            "pending_quiescence": self.quiescence.pending,
+            "quiescence": dict(self.quiescence.stats),
+            "pool": self.pool.metrics()
+        }
+
+    def start(self):
+        """Start handing completely written drops to the worker pool."""
+        self.pool.start()
+        self.quiescence.start()
+
+    def stop(self):
+        """Stop taking new drops and finish the ones already handed over."""
+        self.quiescence.stop()
+        self.pool.stop()
+        self.extractor.shutdown()
 
     def create_action_file(self, source: Path):
         """Create an action file in Needs_Action folder"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        action_filename = f"ACTION_{timestamp}_{source.name}.md"
+        # Unique and time-sorted even for same-named drops in the same second
+        action_filename = f"ACTION_{new_id()}_{source.name}.md"
         action_path = self.needs_action / action_filename
 
-        # Create metadata with file information
-        file_size = source.stat().st_size
-        file_ext = source.suffix.lower()
-
-        # Determine action type based on file extension
-        if file_ext in ['.pdf', '.doc', '.docx']:
-            action_type = "document_review"
-            priority = "medium"
-        elif file_ext in ['.jpg', '.png', '.gif']:
-            action_type = "image_review"
-            priority = "low"
-        elif file_ext in ['.csv', '.xlsx']:
-            action_type = "data_analysis"
-            priority = "high"
+        # Move the original file next to the action file first so it's available during processing
+        # This preserves the original file but removes it from the Inbox
+        original_copy = action_path.with_suffix('.original' + source.suffix)
+
+        # Claimed before the move, so a restart can finish an interrupted ingest
+        self.marker.claim(self._relative(source), source.stat(), action_path.name, original_copy.name)
+        # Move instead of copy, never over an existing file; the size, hash and
+        # header for routing come from the same pass over the content
+        fingerprint = self.fs.relocate(source, original_copy, head=SNIFF_BYTES)
+        if fingerprint is None:
+            raise FileExistsError(f"{original_copy.name} already exists in Needs_Action")
+        logger.info(f"Moved original file to: {original_copy.name}")
+
+        # Subfolder of the Inbox, for its folder policy ("" for the Inbox itself)
+        folder = self.policies.folder_of(source)
+        self._finish_ingest(action_path, original_copy, source.name, folder, fingerprint)
+        self.marker.done(action_path.name)
+
+    def _finish_ingest(self, action_path: Path, original_copy: Path, original_name: str,
+                       folder: str = "", fingerprint: Fingerprint = None):
+        """Write the action file for a moved drop, unless its content was dropped before"""
+        if fingerprint is None:
+            # Resumed ingest: the move happened before a restart
+            fingerprint = self.fs.fingerprint(original_copy, head=SNIFF_BYTES)
+
+        first = self.contents.claim(fingerprint, original_name, action_path.name)
+        if first is not None:
+            # The content is already kept as a blob; the repeat is only recorded
+            original_copy.unlink()
+            logger.info(f"{original_name} repeats {first['name']} ({first['action']}); no new action created")
+            self._record_repeat(first, fingerprint)
+            return
+
+        try:
+            self._write_action_file(action_path, original_copy, original_name, folder, fingerprint)
+        except BaseException:
+            self.contents.release(fingerprint)
+            raise
+        self.contents.add(fingerprint, original_copy)
+
+    def _record_repeat(self, first: dict, fingerprint: Fingerprint) -> bool:
+        """Count a repeat drop in the frontmatter of the first drop's action file"""
+        action_name = first["action"]
+        action_file = self.needs_action / action_name
+        if action_file.exists():
+            if self.ledger.started(action_file.stem):
+                # Rewriting it now would make the tier's ledger start it over
+                return False
         else:
-            action_type = "general_file"
-            priority = "medium"
+            # Archived, or claimed by a tier (then it is left alone)
+            action_file = self.archive.locate(action_name)
+            if action_file is None:
+                return False
+        try:
+            return update_frontmatter(action_file, {
+                "repeats": str(self.contents.repeats(fingerprint.sha256)),
+                "last_repeat": datetime.now().isoformat()
+            })
+        except OSError as e:
+            # The repeat is in the content index either way
+            logger.warning(f"Could not record the repeat on {action_name}: {e}")
+            return False
+
+    def _write_action_file(self, action_path: Path, original_copy: Path, original_name: str,
+                           folder: str, fingerprint: Fingerprint):
+        """Write the action file describing a moved drop"""
+        # Create metadata with file information
+        file_size = fingerprint.size
+        file_ext = original_copy.suffix.lower()
+        file_sha256 = fingerprint.sha256
+
+        # Route by content, extension and size (gold/drop_routes.json), then
+        # apply the policy of the Inbox subfolder
+        route = self.routes.route(original_name, fingerprint.head, file_size)
+        policy = self.policies.resolve(folder)
+        route = route._replace(**{field: policy[field] for field in ROUTE_FIELDS if field in policy})
+        action_type = route.action_type
+        priority = route.priority
+        policy_fields = ''.join(f"{field}: {str(policy[field]).lower()}\n"
+                                for field in ("auto_approve", "target_tier") if field in policy)
+        if folder:
+            policy_fields = f"inbox_folder: {folder}\n" + policy_fields
+
+        # Text, tables and sheet sizes of documents and data files (cached by hash)
+        extraction = self.extractor.extract(original_copy, route.kind, file_sha256)
+        extraction_field = f"extraction: {extraction['status']}\n" if extraction else ""
+        extraction_section = f"\n## Extracted Content\n{format_summary(extraction)}" if extraction else ""
 
         content = f"""---
 type: file_drop
-original_name: {source.name}
+original_name: {original_name}
 size: {file_size} bytes
 extension: {file_ext}
-priority: {priority}
+original_file: {original_copy.name}
+original_size: {file_size}
+original_sha256: {file_sha256}
+content_type: {route.kind}
+handler: {route.handler}
+{extraction_field}{policy_fields}priority: {priority}
 status: pending
 created: {datetime.now().isoformat()}
 ---
@@ -98,11 +412,13 @@ created: {datetime.now().isoformat()}
 # File Processing Request
 
 ## File Information
-- **Original Name:** {source.name}
+- **Original Name:** {original_name}
 - **Size:** {file_size} bytes
-- **Type:** {file_ext}
+- **Type:** {file_ext} ({route.kind})
 - **Detected Action:** {action_type}
-
+- **Handler:** {route.handler}
+- **Inbox Folder:** {folder or "(top level)"}
+{extraction_section}
 ## Processing Status
 - [ ] File reviewed
 - [ ] Action determined
@@ -117,38 +433,79 @@ created: {datetime.now().isoformat()}
 ## Notes
 New file dropped in the Inbox folder for processing.
 """
-        action_path.write_text(content)
+        # Written last, so the orchestrator never sees an action file without its attachment
+        create_new_file(action_path, content)
         logger.info(f"Created action file: {action_path.name}")
 
-        # Move the original file to the action file's directory so it's available during processing
-        # This preserves the original file but removes it from the Inbox
-        original_copy = action_path.with_suffix('.original' + source.suffix)
-        shutil.move(str(source), str(original_copy))  # Move instead of copy
-        logger.info(f"Moved original file to: {original_copy.name}")
+def start_observer(event_handler: DropFolderHandler, mode: str = "auto") -> Observer:
+    """
+    Start a watchdog observer on the handler's drop folder.
+
+    Args:
+        event_handler: Handler whose drop folder is watched
+        mode: "native" (inotify and friends), "polling" (snapshot polling for
+            network shares) or "auto" (polling when the folder is on NFS/SMB)
+    """
+    if mode == "auto":
+        mode = "polling" if is_network_path(str(event_handler.drop_folder)) else "native"
+    if mode == "polling":
+        observer = SnapshotPollingObserver(
+            min_interval=float(get_env_variable('INBOX_POLL_INTERVAL', str(POLL_MIN_INTERVAL))),
+            max_interval=float(get_env_variable('INBOX_POLL_MAX_INTERVAL', str(POLL_MAX_INTERVAL)))
+        )
+        logger.info("Watching the drop folder by snapshot polling")
+    else:
+        observer = Observer()
+    try:
+        # Subfolders are watched too; inotify needs one watch per directory, not per file
+        observer.schedule(event_handler, str(event_handler.drop_folder), recursive=True)
+    except OSError as e:
+        if mode == "polling":
+            raise
+        # e.g. fs.inotify.max_user_watches exhausted by a very large tree
+        logger.warning(f"Cannot watch the drop folder natively ({e}); falling back to snapshot polling")
+        return start_observer(event_handler, "polling")
+    observer.start()
+    return observer
 
 def main():
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create the vault structure if it doesn't exist
     (vault_path / "Inbox").mkdir(exist_ok=True)
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
     (vault_path / "Done").mkdir(exist_ok=True)
 
-    event_handler = DropFolderHandler(str(vault_path))
-    observer = Observer()
-    observer.schedule(event_handler, str(vault_path / "Inbox"), recursive=False)
-
+    event_handler = DropFolderHandler(
+        vault_path,
+        workers=int(get_env_variable('INBOX_WORKERS', str(DEFAULT_WORKERS))),
+        max_queue=int(get_env_variable('INBOX_QUEUE_SIZE', str(DEFAULT_QUEUE_SIZE))),
+        routes_path=get_env_variable('DROP_ROUTES_PATH', None),
+        extract_workers=int(get_env_variable('EXTRACT_WORKERS', str(EXTRACT_WORKERS))),
+        extract_timeout=int(get_env_variable('EXTRACT_TIMEOUT', str(EXTRACT_TIMEOUT))),
+        extract_memory_mb=int(get_env_variable('EXTRACT_MEMORY_MB', str(EXTRACT_MEMORY_MB)))
+    )
     logger.info(f"Starting file system watcher for {vault_path}/Inbox")
     logger.info("Press Ctrl+C to stop the watcher")
 
-    observer.start()
+    event_handler.start()
+    observer_mode = get_env_variable('INBOX_OBSERVER', 'auto')
+    observer = start_observer(event_handler, observer_mode)
+    # Files that arrived while the watcher was down (the observer is already
+    # running, so nothing dropped from now on is missed)
+    event_handler.catch_up()
     try:
         while True:
             time.sleep(1)
+            if not observer.is_alive():
+                logger.warning("Observer stopped unexpectedly; restarting it and catching up")
+                observer = start_observer(event_handler, observer_mode)
+                event_handler.catch_up()
     except KeyboardInterrupt:
         observer.stop()
         logger.info("Watcher stopped by user")
     observer.join()
+    event_handler.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,13 +4,34 @@ Orchestrator for AI Employee
 This script demonstrates Claude Code's ability to read from and write to the vault.
 It simulates the basic flow of checking for items in Needs_Action, processing them,
 and moving them to Done.
+
+By default it runs one cycle and exits. With --daemon (or ORCHESTRATOR_MODE=daemon)
+it keeps running and processes items as they arrive in Needs_Action and
+Plans/Approved (see gold/orchestrator_daemon.py). Processing is paced by a
+token bucket: ORCHESTRATOR_RATE items per second after a burst of
+ORCHESTRATOR_BURST.
 """
-import time
 import logging
 from pathlib import Path
 from datetime import datetime
-import json
-import re
+import sys
+import os
+
+# Add the gold tier directory to path for shared modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gold'))
+from keyword_classifier import classify_text
+from dashboard_writer import DashboardWriter
+from done_archive import DoneArchive
+from vault_fs import get_vault_fs
+from change_journal import get_change_journal
+from action_ids import create_new_file, new_id
+from frontmatter import parse_frontmatter
+from config_loader import get_env_variable
+from token_bucket import DEFAULT_BURST, DEFAULT_RATE, TokenBucket
+from action_scheduler import ActionScheduler
+from orchestrator_daemon import OrchestratorDaemon
+from action_ledger import ActionLedger
+from pipeline import BATCH_SIZE, ApprovalGate, Archive, Classify, Ingest, Pace, Pipeline, Plan
 
 # Configure logging
 logging.basicConfig(
@@ -19,10 +40,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def process_needs_action_files(vault_path: Path):
-    """Process all files in the Needs_Action folder"""
+# Appended to an action file before it is moved to Done
+PROCESSING_LOG = "\n\n## Processing Log\n- [x] Processed at {time}\n- [x] Plan created and moved to Done folder"
+
+def process_needs_action_files(vault_path: Path, dashboard: DashboardWriter = None,
+                               pace: TokenBucket = None, scheduler: ActionScheduler = None):
+    """Process all files in the Needs_Action folder
+
+    Dashboard updates are collected in `dashboard` and written when the caller
+    flushes it; without one, a writer is created and flushed here. Files are
+    processed at the rate `pace` allows (a default token bucket without one),
+    most urgent first by priority, age and due date; a `scheduler` kept across
+    cycles only reads the frontmatter of new files. Files go through the bronze
+    configuration of the shared stage pipeline (see gold/pipeline.py) in batches.
+    """
+    vault_path = get_vault_fs(vault_path).root
+    # Journal the moves to Done so the gold consumers see them
+    get_change_journal(vault_path)
+    owns_dashboard = dashboard is None
+    if owns_dashboard:
+        dashboard = DashboardWriter(vault_path)
+
     needs_action_dir = vault_path / "Needs_Action"
-    done_dir = vault_path / "Done"
+    archive = DoneArchive(vault_path)
     plans_dir = vault_path / "Plans"
 
     # Create Plans directory if it doesn't exist
@@ -31,77 +71,51 @@ def process_needs_action_files(vault_path: Path):
     # Only process files that start with "ACTION_" and are .md files (not the .original files)
     action_files = [f for f in needs_action_dir.glob("*.md") if f.name.startswith("ACTION_") and ".original." not in f.name]
 
+    if scheduler is None:
+        scheduler = ActionScheduler()
+    scheduler.sync(action_files)
+
     if not action_files:
         logger.info("No action files to process")
         return
 
-    for action_file in action_files:
-        logger.info(f"Processing action file: {action_file.name}")
+    if pace is None:
+        pace = TokenBucket(DEFAULT_RATE, DEFAULT_BURST)
+
+    # Stages that already went through for a file (before a crash or a failed
+    # run) are not repeated, so no second plan or approval request is written
+    pipeline = Pipeline("bronze", [
+        Ingest("bronze"),
+        # Paced by the token bucket rather than a fixed delay per file
+        Pace(pace),
+        Classify(),
+        Plan(lambda record: write_plan_file(record.path, record.content, plans_dir)),
+        ApprovalGate(lambda record: create_approval_request(record.path, plans_dir, record.content,
+                                                            record.categories), dashboard),
+        Archive(archive, PROCESSING_LOG, dashboard),
+    ], ledger=ActionLedger(vault_path))
+    for batch in scheduler.batches(BATCH_SIZE):
+        pipeline.run(batch)
+
+    logger.info(f"Needs_Action queue by priority: {scheduler.stats()}")
+    logger.info(f"Pipeline stage timings: {pipeline.stats()}")
+
+    if owns_dashboard:
+        dashboard.flush()
+
+def create_plan_file(action_file: Path, content: str, plans_dir: Path) -> bool:
+    """Create a Plan.md file based on the action file content
+
+    Returns True if an approval request was also created.
+    """
+    write_plan_file(action_file, content, plans_dir)
 
-        # Read the action file
-        content = action_file.read_text()
+    # Also create an approval request for sensitive actions
+    return create_approval_request(action_file, plans_dir, content)
 
-        # Create a Plan.md file based on the action file content
-        create_plan_file(action_file, content, plans_dir)
-
-        # Update the content to mark as processed
-        updated_content = content + f"\n\n## Processing Log\n- [x] Processed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n- [x] Plan created and moved to Done folder"
-
-        # Update Dashboard.md with this activity
-        dashboard_path = vault_path / "Dashboard.md"
-        if dashboard_path.exists():
-            dashboard_content = dashboard_path.read_text()
-            activity_marker = "## Recent Activity"
-            if activity_marker in dashboard_content:
-                activity_section_start = dashboard_content.find(activity_marker)
-                next_section_start = dashboard_content.find("\n## ", activity_section_start + len(activity_marker))
-                if next_section_start == -1:  # If it's the last section
-                    next_section_start = len(dashboard_content)
-
-                current_activity = dashboard_content[activity_section_start:next_section_start]
-
-                # Add new activity
-                new_activity = f"- [x] {datetime.now().strftime('%Y-%m-%d %H:%M')} - Processed {action_file.name}"
-
-                if new_activity not in current_activity:
-                    updated_dashboard = (
-                        dashboard_content[:activity_section_start + len(activity_marker)] +
-                        f"\n{new_activity}" +
-                        dashboard_content[activity_section_start + len(activity_marker):]
-                    )
-                    dashboard_path.write_text(updated_dashboard)
-                    logger.info(f"Updated Dashboard.md with activity: {new_activity}")
-
-        # Write the updated content back to the file
-        action_file.write_text(updated_content)
-
-        # Look for associated original file (with .original extension)
-        original_extensions = ['.original.txt', '.original.md', '.original.pdf', '.original.doc', '.original.docx',
-                              '.original.jpg', '.original.png', '.original.gif', '.original.csv', '.original.xlsx']
-        original_file = None
-        for ext in original_extensions:
-            potential_file = action_file.with_suffix(ext)
-            if potential_file.exists():
-                original_file = potential_file
-                break
-
-        # Move the action file to Done folder
-        done_file = done_dir / action_file.name
-        action_file.rename(done_file)
-        logger.info(f"Moved {action_file.name} to Done folder")
-
-        # Move the original file to Done folder if it exists
-        if original_file and original_file.exists():
-            final_done_file = done_dir / original_file.name
-            original_file.rename(final_done_file)
-            logger.info(f"Moved original file {original_file.name} to Done folder")
-
-        # Add a delay to simulate processing time
-        time.sleep(0.5)
-
-def create_plan_file(action_file: Path, content: str, plans_dir: Path):
-    """Create a Plan.md file based on the action file content"""
-    plan_filename = f"PLAN_{action_file.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+def write_plan_file(action_file: Path, content: str, plans_dir: Path) -> Path:
+    """Write the Plan.md file for an action file, returning its path"""
+    plan_filename = f"PLAN_{action_file.stem}_{new_id()}.md"
     plan_path = plans_dir / plan_filename
 
     # Extract relevant information from action file to create a plan
@@ -141,20 +155,25 @@ Process the request from the action file: {action_file.name}
 ## Notes
 This plan was automatically generated by the AI Employee based on the action file {action_file.name}.
 """
-    plan_path.write_text(plan_content)
+    create_new_file(plan_path, plan_content)
     logger.info(f"Created plan file: {plan_path.name}")
+    return plan_path
 
-    # Also create an approval request for sensitive actions
-    create_approval_request(action_file, plans_dir)
-
-def create_approval_request(action_file: Path, plans_dir: Path):
-    """Create an approval request for sensitive actions"""
+def create_approval_request(action_file: Path, plans_dir: Path, content: str = None,
+                            categories: dict = None) -> bool:
+    """Create an approval request for sensitive actions, returning True if one was created"""
     # Check if this is a sensitive action that requires approval
-    action_content = action_file.read_text()
-    requires_approval = any(keyword in action_content.lower() for keyword in ['payment', 'invoice', 'money', 'payment', 'bank', 'financial'])
+    if content is None:
+        content = action_file.read_text()
+    if categories is None:
+        categories = classify_text(content)
+    requires_approval = 'payment' in categories
+    if requires_approval and parse_frontmatter(content).get("auto_approve") == "true":
+        logger.info(f"{action_file.name} is auto-approved by its Inbox folder policy")
+        requires_approval = False
 
     if requires_approval:
-        approval_filename = f"APPROVAL_{action_file.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        approval_filename = f"APPROVAL_{action_file.stem}_{new_id()}.md"
         approval_path = plans_dir / "Pending_Approval" / approval_filename
 
         # Create Pending_Approval directory if it doesn't exist
@@ -185,11 +204,13 @@ Move this file to the /Rejected folder with reasons.
 ## Action Summary
 This action requires human approval before proceeding. Please review the source file and determine if the planned action is appropriate.
 """
-        approval_path.write_text(approval_content)
+        create_new_file(approval_path, approval_content)
         logger.info(f"Created approval request: {approval_path.name}")
 
+    return requires_approval
+
 def main():
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     logger.info(f"Starting orchestrator for vault: {vault_path}")
 
@@ -230,37 +251,37 @@ This dashboard provides an overview of your AI Employee's activities and status.
 """
         dashboard_path.write_text(dashboard_content)
 
+    pace = TokenBucket(float(get_env_variable('ORCHESTRATOR_RATE', str(DEFAULT_RATE))),
+                       float(get_env_variable('ORCHESTRATOR_BURST', str(DEFAULT_BURST))))
+    if '--daemon' in sys.argv[1:] or get_env_variable('ORCHESTRATOR_MODE', 'once') == 'daemon':
+        scheduler = ActionScheduler()
+        daemon = OrchestratorDaemon(vault_path, lambda: run_cycle(vault_path, pace, scheduler),
+                                    observer_mode=get_env_variable('INBOX_OBSERVER', 'auto'))
+        daemon.run()
+        return
+
+    run_cycle(vault_path, pace)
+    logger.info("Orchestrator completed one cycle")
+
+def run_cycle(vault_path: Path, pace: TokenBucket = None, scheduler: ActionScheduler = None):
+    """Process Needs_Action and the approval requests once, then update the dashboard"""
+    # Collect dashboard updates for the whole cycle
+    dashboard = DashboardWriter(vault_path)
+
     # Process any existing action files
-    process_needs_action_files(vault_path)
+    process_needs_action_files(vault_path, dashboard, pace, scheduler)
 
     # Process any approval requests
     process_approval_requests(vault_path)
 
-    # Update system status in dashboard
-    if dashboard_path.exists():
-        dashboard_content = dashboard_path.read_text()
-        status_marker = "## System Status"
-        if status_marker in dashboard_content:
-            # Find the "Last Update:" part and replace the entire line
-            import re
-            updated_dashboard = re.sub(
-                r'Last Update:.*$',
-                f'Last Update: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
-                dashboard_content,
-                flags=re.MULTILINE
-            )
-            # Also update the watchers status if needed
-            if "- Watchers: Inactive" in updated_dashboard:
-                updated_dashboard = updated_dashboard.replace(
-                    "- Watchers: Inactive",
-                    "- Watchers: Active"
-                )
-            dashboard_path.write_text(updated_dashboard)
-
-    logger.info("Orchestrator completed one cycle")
+    # Update system status in dashboard and write it once
+    dashboard.set_status("Last Update", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    dashboard.set_status("Watchers", "Active", only_if="Inactive")
+    dashboard.flush()
 
 def process_approval_requests(vault_path: Path):
     """Process approval request files in the Pending_Approval folder"""
+    vault_path = get_vault_fs(vault_path).root
     pending_approval_dir = vault_path / "Plans" / "Pending_Approval"
     approved_dir = vault_path / "Plans" / "Approved"
     rejected_dir = vault_path / "Plans" / "Rejected"
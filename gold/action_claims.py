@@ -0,0 +1,238 @@
+"""
+Action Claims for AI Employee
+
+This module lets several orchestrator processes (on one host or on several
+hosts sharing the vault) work through Needs_Action without handling a file
+twice. Before touching an action file, a worker claims it by renaming it into
+its own claim folder:
+
+    Needs_Action/ACTION_x.md  ->  Needs_Action/.processing/<worker-id>/ACTION_x.md
+
+A rename is atomic, so exactly one worker gets the file; the others find it
+gone and move on. The action file's attachment follows it into the claim
+folder, so the claimed file can be archived as usual.
+
+Each claim folder holds a .heartbeat file that its worker renews while it is
+running. A folder whose heartbeat is older than the lease belongs to a worker
+that died; any other worker reaps it by moving its files back to
+Needs_Action, where they are picked up again.
+
+    claims = ClaimStore(vault_path / "Needs_Action", lease=300)
+    claimed = claims.claim(action_file)     # None if another worker was first
+    ...                                     # process and archive `claimed`
+    claims.release(claimed)                 # or hand it back on failure
+"""
+import os
+import sys
+import json
+import time
+import socket
+import logging
+import threading
+from typing import List, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, VaultPath, get_vault_fs
+from done_archive import find_attachments
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+CLAIM_DIRNAME = ".processing"
+HEARTBEAT_FILENAME = ".heartbeat"
+
+DEFAULT_LEASE_SECONDS = 300.0
+
+
+def default_worker_id() -> str:
+    """Worker id that is unique across the hosts sharing a vault."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class ClaimStore:
+    """Claim-by-rename leases on the files of one folder"""
+
+    def __init__(self, folder: PathLike, worker_id: Optional[str] = None,
+                 lease: float = DEFAULT_LEASE_SECONDS):
+        """
+        Args:
+            folder: Folder whose files are claimed (Needs_Action)
+            worker_id: Name of this worker's claim folder (host and pid by default)
+            lease: Seconds without a heartbeat after which a worker's claims expire
+        """
+        self.fs = get_vault_fs(folder)
+        self.folder = self.fs.path(folder)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease = lease
+        self.claim_root = self.folder / CLAIM_DIRNAME
+        self.claim_dir = self.claim_root / self.worker_id
+        self.heartbeat = self.claim_dir / HEARTBEAT_FILENAME
+
+        self._renewer: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def renew(self):
+        """Renew this worker's lease."""
+        self.claim_dir.mkdir(parents=True, exist_ok=True)
+        # Replaced atomically, so a reaper never reads a half-written heartbeat
+        temp = self.claim_dir / f"{HEARTBEAT_FILENAME}.tmp"
+        self.fs.write_text(temp, json.dumps({"worker": self.worker_id, "renewed": time.time(),
+                                             "lease": self.lease}))
+        self.fs.rename(temp, self.heartbeat)
+
+    def _start_renewing(self):
+        with self._lock:
+            if self._renewer is not None:
+                return
+            self.renew()
+            self._stopping.clear()
+            self._renewer = threading.Thread(target=self._renew_loop, name="claim-lease", daemon=True)
+            self._renewer.start()
+
+    def _renew_loop(self):
+        while not self._stopping.wait(self.lease / 3):
+            try:
+                self.renew()
+            except OSError as e:
+                logger.warning(f"Cannot renew the claim lease of {self.worker_id}: {e}")
+
+    def claim(self, path: PathLike) -> Optional[VaultPath]:
+        """
+        Claim a file (and its attachments) for this worker.
+
+        Args:
+            path: File in the claimed folder
+
+        Returns:
+            The file's path in this worker's claim folder, or None if another
+            worker claimed it first
+        """
+        path = self.fs.path(path)
+        self._start_renewing()
+        try:
+            attachments = find_attachments(path)
+        except FileNotFoundError:
+            return None
+        claimed = self.claim_dir / path.name
+        try:
+            self.fs.rename(path, claimed)
+        except FileNotFoundError:
+            return None
+        for attachment in attachments:
+            try:
+                self.fs.rename(attachment, self.claim_dir / attachment.name)
+            except FileNotFoundError:
+                logger.warning(f"Attachment {attachment.name} of {path.name} disappeared while claiming it")
+        return claimed
+
+    def release(self, claimed: PathLike) -> Optional[VaultPath]:
+        """
+        Hand a claimed file (and its attachments) back to the folder, e.g. after a failure.
+
+        Args:
+            claimed: Path returned by claim()
+
+        Returns:
+            The file's path in the folder again, or None if it was no longer claimed
+        """
+        claimed = self.fs.path(claimed)
+        try:
+            attachments = find_attachments(claimed)
+        except FileNotFoundError:
+            return None
+        for attachment in attachments:
+            self._return(attachment)
+        return self._return(claimed)
+
+    def _return(self, claimed: VaultPath) -> Optional[VaultPath]:
+        target = self.folder / claimed.name
+        try:
+            if not self.fs.rename_no_clobber(claimed, target):
+                logger.warning(f"{claimed.name} is back in {self.folder.name} already; keeping the claimed copy")
+                return None
+        except FileNotFoundError:
+            return None
+        return target
+
+    def _is_stale(self, worker_dir: VaultPath) -> bool:
+        heartbeat = worker_dir / HEARTBEAT_FILENAME
+        try:
+            beat = json.loads(heartbeat.read_text())
+            return time.time() - beat["renewed"] > beat.get("lease", self.lease)
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Unreadable claim heartbeat in {worker_dir.name}; going by its mtime")
+            stamped = heartbeat
+        except FileNotFoundError:
+            # A worker that died before its first heartbeat, or a half-reaped folder
+            stamped = worker_dir
+        try:
+            return time.time() - stamped.stat().st_mtime > self.lease
+        except FileNotFoundError:
+            return False
+
+    def reap(self) -> List[VaultPath]:
+        """
+        Return the files of workers whose lease expired to the folder.
+
+        Returns:
+            Files moved back to the folder
+        """
+        returned = []
+        try:
+            entries = list(self.fs.scandir(self.claim_root))
+        except FileNotFoundError:
+            return returned
+        for entry in entries:
+            if entry.name == self.worker_id or not entry.is_dir(follow_symlinks=False):
+                continue
+            worker_dir = self.claim_root / entry.name
+            if not self._is_stale(worker_dir):
+                continue
+            expired = []
+            for claimed in list(self.fs.scandir(worker_dir)):
+                if claimed.name.startswith('.'):
+                    continue
+                target = self._return(worker_dir / claimed.name)
+                if target is not None:
+                    expired.append(target)
+            returned.extend(expired)
+            try:
+                for name in (HEARTBEAT_FILENAME, f"{HEARTBEAT_FILENAME}.tmp"):
+                    self.fs.unlink(worker_dir / name, missing_ok=True)
+                self.fs.rmdir(worker_dir)
+            except OSError:
+                # Another worker is reaping it too, or files are still arriving
+                pass
+            logger.warning(f"Claims of {entry.name} expired; returned {len(expired)} files to {self.folder.name}")
+        return returned
+
+    def claimed(self) -> List[VaultPath]:
+        """Files this worker currently holds."""
+        try:
+            return [self.claim_dir / entry.name for entry in self.fs.scandir(self.claim_dir)
+                    if not entry.name.startswith('.')]
+        except FileNotFoundError:
+            return []
+
+    def close(self):
+        """Stop renewing, hand back anything still claimed and remove the claim folder."""
+        with self._lock:
+            renewer, self._renewer = self._renewer, None
+        if renewer is None:
+            return
+        self._stopping.set()
+        renewer.join()
+        for claimed in self.claimed():
+            self._return(claimed)
+        try:
+            self.fs.unlink(self.heartbeat, missing_ok=True)
+            self.fs.rmdir(self.claim_dir)
+        except OSError as e:
+            logger.warning(f"Cannot remove claim folder {self.worker_id}: {e}")
@@ -0,0 +1,148 @@
+"""
+Action IDs for AI Employee
+
+This module generates the IDs used in the names of action, plan, approval and
+audit artifacts, and creates those files without ever replacing one.
+
+IDs are ULIDs: 26 Crockford base32 characters, a 48-bit millisecond timestamp
+followed by 80 random bits. They sort by creation time as plain strings, and
+the random part keeps IDs from different processes apart. Within a process,
+IDs are strictly increasing even when many are made in the same millisecond
+(the random part is incremented instead of redrawn) or the clock steps back.
+
+    01J5Z3K4Q8XGJ4T6W7YB2C9D0E
+    |--------||--------------|
+     ms time     randomness
+
+Timestamps with one-second resolution (ACTION_20260219_101500_scan.pdf.md)
+collide as soon as two files with the same name arrive in the same second,
+and plain write_text() then silently overwrites the first. create_new_file()
+opens with O_EXCL instead, so a collision fails loudly.
+"""
+import os
+import sys
+import time
+import secrets
+import logging
+import threading
+from datetime import datetime
+from typing import Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, VaultPath, to_vault_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ID_LENGTH = 26
+
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def _reset_after_fork():
+    # A forked child must not continue the parent's sequence
+    global _lock, _last_ms, _last_random
+    _lock = threading.Lock()
+    _last_ms = 0
+    _last_random = 0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        chars.append(CROCKFORD_ALPHABET[value & 31])
+        value >>= 5
+    return ''.join(reversed(chars))
+
+
+def new_id() -> str:
+    """
+    Return a new ULID.
+
+    Returns:
+        26-character ID that sorts after every ID this process made before
+    """
+    global _last_ms, _last_random
+    now_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _last_random = secrets.randbits(_RANDOM_BITS)
+        elif _last_random < _RANDOM_MAX:
+            # Same millisecond (or the clock went back): keep counting up
+            _last_random += 1
+        else:
+            _last_ms += 1
+            _last_random = secrets.randbits(_RANDOM_BITS - 1)
+        value = (_last_ms << _RANDOM_BITS) | _last_random
+    return _encode(value, ID_LENGTH)
+
+
+def id_time(action_id: str) -> Optional[datetime]:
+    """
+    Return the creation time encoded in an ID.
+
+    Args:
+        action_id: ULID as returned by new_id()
+
+    Returns:
+        Local creation time, or None if action_id is not a ULID
+    """
+    if len(action_id) != ID_LENGTH:
+        return None
+    value = 0
+    for char in action_id[:10].upper():
+        digit = CROCKFORD_ALPHABET.find(char)
+        if digit < 0:
+            return None
+        value = (value << 5) | digit
+    return datetime.fromtimestamp(value / 1000)
+
+
+def create_new_file(path: PathLike, content: str, encoding: str = 'utf-8') -> VaultPath:
+    """
+    Create a file that must not exist yet (O_EXCL).
+
+    Args:
+        path: File to create
+        content: Text to write
+        encoding: Text encoding
+
+    Returns:
+        The created path
+
+    Raises:
+        FileExistsError: If a file with this name already exists
+    """
+    path = to_vault_path(path)
+    with path.open('x', encoding=encoding) as f:
+        f.write(content)
+    return path
+
+
+def main():
+    """Print a few IDs and the time encoded in them."""
+    ids = [new_id() for _ in range(5)]
+    for action_id in ids:
+        print(f"{action_id}  {id_time(action_id).isoformat()}")
+    print(f"Sorted: {ids == sorted(ids)}")
+
+
+if __name__ == "__main__":
+    main()
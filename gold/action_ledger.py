@@ -0,0 +1,196 @@
+"""
+Action Ledger for AI Employee
+
+This module remembers which pipeline stages have finished for each action
+file, so a stage that already succeeded is not run again when the file is
+processed a second time: after a crash before the move to Done, a failed
+cycle that is retried, or a claim returned by a worker that died. Without it,
+every retry writes another PLAN_* and APPROVAL_* file for the same action.
+
+Each action file in flight has one small entry in the hidden .ledger folder,
+named after its action ID (the file's stem):
+
+    .ledger/ACTION_20260219_101500_scan.pdf.json
+    {"action": "ACTION_20260219_101500_scan.pdf", "hashes": ["9f2c..."],
+     "stages": {"plan": ".../Plans/PLAN_....md", "approval": true}, "updated": "..."}
+
+An entry only applies to the content it was made for: when the file's
+content hash is not among its hashes (the file was edited, or a new drop
+reused the name), the action starts over. A stage that rewrites the file
+itself adds the new content's hash before writing it. The entry is removed
+once the file is archived, so the ledger only holds unfinished actions.
+
+Entries are written through the caller's writer: replaced atomically right
+away with the plain VaultFS, or staged on a WriteBatch after the outputs they
+record, so in the gold cycle a stage is never marked done before its
+outputs are committed.
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, VaultFS, VaultPath, get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+LEDGER_DIR = ".ledger"
+
+# Entries not updated for this long belong to actions that were removed by
+# hand (or archived by a process that died before dropping the entry)
+RETENTION_SECONDS = 30 * 24 * 3600
+
+
+def content_hash(content: str) -> str:
+    """Hash identifying one version of an action file's content."""
+    return hashlib.sha256(content.encode('utf-8', 'surrogatepass')).hexdigest()[:32]
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_jsonable(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class ActionLedger:
+    """Durable record of the finished pipeline stages of each action file"""
+
+    def __init__(self, vault_path: PathLike):
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.ledger_dir = self.vault_path / LEDGER_DIR
+        # The VaultFS or a WriteBatch, like the gold components
+        self.writer = self.fs
+
+        self.ledger_dir.mkdir(parents=True, exist_ok=True)
+        # Entries of actions that disappeared without being archived
+        self.prune()
+
+    def _path(self, action_id: str) -> VaultPath:
+        return self.ledger_dir / f"{action_id}.json"
+
+    def _read(self, action_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(self.writer.read_text(self._path(action_id), encoding='utf-8'))
+            if not isinstance(entry, dict) or not isinstance(entry.get("stages"), dict):
+                raise ValueError("not a ledger entry")
+            return entry
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable ledger entry for {action_id}: {e}")
+            return None
+
+    def _write(self, action_id: str, entry: Dict[str, Any]):
+        entry["updated"] = datetime.now().isoformat()
+        content = json.dumps(entry, separators=(',', ':'))
+        if isinstance(self.writer, VaultFS):
+            with self.fs.atomic_write(self._path(action_id), encoding='utf-8') as f:
+                f.write(content)
+        else:
+            self.writer.write_text(self._path(action_id), content, encoding='utf-8')
+
+    def load(self, action_id: str, content: str) -> Dict[str, Any]:
+        """
+        Stages already finished for this version of an action file.
+
+        Args:
+            action_id: The action file's stem
+            content: Its content as read now
+
+        Returns:
+            Stage name -> the result recorded when it finished (empty for new work)
+        """
+        entry = self._read(action_id)
+        if entry is None:
+            return {}
+        if content_hash(content) not in entry.get("hashes", []):
+            logger.info(f"{action_id} changed since its ledger entry was written; starting over")
+            return {}
+        return dict(entry["stages"])
+
+    def complete(self, action_id: str, content: str, stage: str, result: Any = True,
+                 new_content: Optional[str] = None):
+        """
+        Record that a stage finished.
+
+        Args:
+            action_id: The action file's stem
+            content: The content the stage worked on
+            stage: Stage name
+            result: What later runs need instead of re-running the stage (JSON-able)
+            new_content: Content the stage is about to write to the action
+                file, which is then recognised as the same action
+        """
+        current = content_hash(content)
+        entry = self._read(action_id)
+        if entry is None or current not in entry.get("hashes", []):
+            entry = {"action": action_id, "hashes": [current], "stages": {}}
+        entry["stages"][stage] = _jsonable(result)
+        if new_content is not None:
+            written = content_hash(new_content)
+            if written not in entry["hashes"]:
+                entry["hashes"].append(written)
+        self._write(action_id, entry)
+
+    def started(self, action_id: str) -> bool:
+        """Whether a tier has finished a stage of an action file that is not archived yet."""
+        return self.fs.exists(self._path(action_id))
+
+    def forget(self, action_id: str):
+        """Drop the entry of an action that is finished (archived)."""
+        self.writer.unlink(self._path(action_id), missing_ok=True)
+
+    def prune(self, max_age: float = RETENTION_SECONDS) -> int:
+        """
+        Drop entries that were not updated for max_age seconds.
+
+        Returns:
+            Number of entries dropped
+        """
+        cutoff = time.time() - max_age
+        dropped = 0
+        for entry in list(self.fs.scandir(self.ledger_dir)):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    self.fs.unlink(self.ledger_dir / entry.name, missing_ok=True)
+                    dropped += 1
+            except FileNotFoundError:
+                continue
+        if dropped:
+            logger.info(f"Pruned {dropped} stale action ledger entries")
+        return dropped
+
+
+def main():
+    """List the unfinished actions of a vault and their finished stages."""
+    ledger = ActionLedger(get_vault_fs().root)
+    for entry in sorted(ledger.fs.scandir(ledger.ledger_dir), key=lambda entry: entry.name):
+        if entry.name.endswith(".json"):
+            action_id = entry.name[:-len(".json")]
+            recorded = ledger._read(action_id) or {}
+            print(f"{action_id}: {', '.join(recorded.get('stages', {})) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
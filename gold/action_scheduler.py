@@ -0,0 +1,390 @@
+"""
+Action Scheduler for AI Employee
+
+This module decides the order in which Needs_Action files are processed.
+Every file gets a score from its frontmatter, and the lowest score goes
+first:
+
+    score = created + PRIORITY_OFFSETS[priority]     (high +0, medium +15 min, low +1 h)
+    score = min(score, due - DUE_LEAD)               if it has a due:/due_date:/deadline:
+
+A high-priority message therefore goes ahead of every low-priority drop
+from the last hour, while a low-priority drop that has waited an hour is no
+longer overtaken by newer work, so nothing starves. A due date pulls a file
+forward so it is handled before it is due.
+
+The score depends only on the file, so the heap is maintained incrementally:
+sync() reads the frontmatter of new or changed files only, and files that are
+gone are dropped lazily when they reach the top of the heap.
+
+drain() hands files to a handler (on a thread pool if asked to), never
+running more files of one priority class at once than its limit allows,
+and stats() reports how long files of each class waited in the queue:
+
+    scheduler = ActionScheduler(limits={"low": 1})
+    scheduler.sync(needs_action.glob("ACTION_*.md"))
+    scheduler.drain(process_file, workers=4)
+    scheduler.stats()   # {"high": {"queued": 0, "running": 0, "wait": {...}}, ...}
+"""
+import os
+import sys
+import time
+import heapq
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from itertools import count
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, VaultPath, to_vault_path
+from frontmatter import Frontmatter, read_frontmatter
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+PRIORITY_CLASSES = ("high", "medium", "low")
+DEFAULT_CLASS = "medium"
+
+# Seconds added to a file's creation time per priority class
+PRIORITY_OFFSETS = {"high": 0.0, "medium": 15 * 60.0, "low": 60 * 60.0}
+
+# Frontmatter fields holding a due date, and how long before it a file is due for processing
+DUE_FIELDS = ("due", "due_date", "deadline")
+DUE_LEAD = 15 * 60.0
+
+# Wait-time samples kept per class for stats()
+WAIT_SAMPLES = 1024
+
+
+def _timestamp(value: str) -> Optional[float]:
+    """Seconds since the epoch for an ISO date or datetime, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.strip().strip('"\'')).timestamp()
+    except ValueError:
+        return None
+
+
+def _summary(samples: Iterable[float]) -> Dict[str, float]:
+    """Count, mean and percentiles (in seconds) of wait-time samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def percentile(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+    return {
+        "count": len(ordered),
+        "mean_s": round(sum(ordered) / len(ordered), 3),
+        "p50_s": percentile(0.50),
+        "p95_s": percentile(0.95),
+        "max_s": round(ordered[-1], 3)
+    }
+
+
+class ScheduledAction:
+    """A file waiting in (or taken from) the scheduler"""
+
+    __slots__ = ('path', 'priority', 'score', 'signature', 'queued_at', 'live')
+
+    def __init__(self, path: VaultPath, priority: str, score: float, signature: tuple, queued_at: float):
+        self.path = path
+        self.priority = priority
+        self.score = score
+        self.signature = signature
+        self.queued_at = queued_at
+        # False once replaced by a newer entry for the same file or discarded
+        self.live = True
+
+
+class ActionScheduler:
+    """Incrementally maintained priority/deadline heap of action files"""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None,
+                 offsets: Optional[Dict[str, float]] = None, clock: Callable[[], float] = None):
+        """
+        Args:
+            limits: Most files of a priority class processed at once (unlimited if absent)
+            offsets: Seconds added to the creation time per class (PRIORITY_OFFSETS by default)
+            clock: Wall clock (time.time), for tests and simulations
+        """
+        self.limits = dict(limits or {})
+        self.offsets = {**PRIORITY_OFFSETS, **(offsets or {})}
+        self._clock = clock or time.time
+        self._heap: List[tuple] = []
+        self._seq = count()
+        # File name -> its current entry (queued, running or finished but still present)
+        self._entries: Dict[str, ScheduledAction] = {}
+        self._retry: List[ScheduledAction] = []
+        self._running: Dict[str, int] = {}
+        self._waits: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def _score(self, meta: Frontmatter, mtime: float) -> Tuple[str, float, float]:
+        """Priority class, score and creation time of a file."""
+        priority = (meta.priority or DEFAULT_CLASS).lower()
+        if priority not in self.offsets:
+            priority = DEFAULT_CLASS
+        created = _timestamp(meta.created) or mtime
+        score = created + self.offsets[priority]
+        for field in DUE_FIELDS:
+            due = _timestamp(meta.get(field))
+            if due is not None:
+                score = min(score, due - DUE_LEAD)
+                break
+        return priority, score, created
+
+    def add(self, path: PathLike, meta: Optional[Frontmatter] = None) -> Optional[ScheduledAction]:
+        """
+        Queue a file, or re-queue it with a fresh score if it changed.
+
+        Args:
+            path: Action file
+            meta: Its frontmatter, if the caller has already read it
+
+        Returns:
+            The queued entry, or None if the file is gone
+        """
+        path = to_vault_path(path)
+        try:
+            st = path.stat()
+            meta = meta or read_frontmatter(path)
+        except FileNotFoundError:
+            self.discard(path.name)
+            return None
+        priority, score, created = self._score(meta, st.st_mtime)
+        # Waiting starts when the file was created, not when this process first saw it
+        entry = ScheduledAction(path, priority, score, (st.st_size, st.st_mtime_ns),
+                                min(created, self._clock()))
+        with self._lock:
+            old = self._entries.get(path.name)
+            if old is not None:
+                old.live = False
+            self._entries[path.name] = entry
+            heapq.heappush(self._heap, (score, next(self._seq), entry))
+        return entry
+
+    def discard(self, name: str):
+        """Forget a file (it was archived, claimed elsewhere or deleted)."""
+        with self._lock:
+            entry = self._entries.pop(name, None)
+            if entry is not None:
+                entry.live = False
+
+    def sync(self, paths: Iterable[PathLike], complete: bool = True) -> int:
+        """
+        Bring the queue up to date with the files currently waiting.
+
+        Only new files and files whose size or mtime changed are (re)read.
+        Files handed back by done(retry=True) are queued again.
+
+        Args:
+            paths: Files waiting to be processed
+            complete: True if paths lists every waiting file, so files not in
+                it are forgotten; False for a list of changes only
+
+        Returns:
+            Number of files (re)queued
+        """
+        with self._lock:
+            retry, self._retry = self._retry, []
+            for entry in retry:
+                if entry.live:
+                    heapq.heappush(self._heap, (entry.score, next(self._seq), entry))
+        added = 0
+        seen = set()
+        for path in paths:
+            path = to_vault_path(path)
+            seen.add(path.name)
+            entry = self._entries.get(path.name)
+            if entry is not None:
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    self.discard(path.name)
+                    continue
+                if (st.st_size, st.st_mtime_ns) == entry.signature:
+                    continue
+            if self.add(path) is not None:
+                added += 1
+        if complete:
+            for name in [name for name in self._entries if name not in seen]:
+                self.discard(name)
+        return added
+
+    def pop(self) -> Optional[ScheduledAction]:
+        """
+        Take the most urgent file whose class is below its concurrency limit.
+
+        Returns:
+            The entry (call done() when it is finished), or None if nothing can run now
+        """
+        with self._lock:
+            held = []
+            found = None
+            while self._heap:
+                item = heapq.heappop(self._heap)
+                entry = item[2]
+                if not entry.live:
+                    continue
+                limit = self.limits.get(entry.priority)
+                if limit is not None and self._running.get(entry.priority, 0) >= limit:
+                    held.append(item)
+                    continue
+                found = entry
+                break
+            for item in held:
+                heapq.heappush(self._heap, item)
+            if found is None:
+                return None
+            self._running[found.priority] = self._running.get(found.priority, 0) + 1
+            waits = self._waits.setdefault(found.priority, deque(maxlen=WAIT_SAMPLES))
+            waits.append(max(0.0, self._clock() - found.queued_at))
+            return found
+
+    def done(self, entry: ScheduledAction, retry: bool = False):
+        """
+        Mark a popped file as finished.
+
+        Args:
+            entry: Entry returned by pop()
+            retry: Queue it again at the next sync() (e.g. processing failed);
+                otherwise it is only queued again if the file changes
+        """
+        gone = not retry and not entry.path.exists()
+        with self._lock:
+            self._running[entry.priority] -= 1
+            if retry and entry.live:
+                self._retry.append(entry)
+            elif gone and self._entries.get(entry.path.name) is entry:
+                del self._entries[entry.path.name]
+
+    def ordered(self) -> Iterator[VaultPath]:
+        """
+        Take queued files one at a time, most urgent first, for a sequential loop.
+
+        Each file is marked done when the loop moves on to the next one; a file
+        still in place by then is retried at the next sync().
+        """
+        while (entry := self.pop()) is not None:
+            try:
+                yield entry.path
+            finally:
+                self.done(entry, retry=entry.path.exists())
+
+    def batches(self, size: int) -> Iterator[List[VaultPath]]:
+        """
+        Take queued files up to `size` at a time, most urgent first, for a batching loop.
+
+        Like ordered(), a batch is marked done when the loop moves on to the
+        next one. Class limits apply within a batch, so a batch is cut short
+        rather than holding more files of a limited class than it allows.
+        """
+        while True:
+            entries = []
+            while len(entries) < size and (entry := self.pop()) is not None:
+                entries.append(entry)
+            if not entries:
+                return
+            try:
+                yield [entry.path for entry in entries]
+            finally:
+                for entry in entries:
+                    self.done(entry, retry=entry.path.exists())
+
+    def drain(self, handler: Callable[[VaultPath], Any], workers: int = 1) -> List[Any]:
+        """
+        Process queued files most urgent first until nothing more can run.
+
+        A file the handler leaves in place (e.g. because it failed) is retried
+        at the next sync().
+
+        Args:
+            handler: Called with each file's path
+            workers: Files processed concurrently
+
+        Returns:
+            Handler results, in the order the files were taken
+        """
+        if workers <= 1:
+            return [handler(path) for path in self.ordered()]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scheduled-action") as pool:
+            running = {}
+            order = []
+            while True:
+                while len(running) < workers and (entry := self.pop()) is not None:
+                    future = pool.submit(handler, entry.path)
+                    running[future] = entry
+                    order.append(future)
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    entry = running.pop(future)
+                    self.done(entry, retry=entry.path.exists())
+            return [future.result() for future in order]
+
+    def waiting(self) -> List[VaultPath]:
+        """Files queued or waiting for a retry, most urgent first."""
+        with self._lock:
+            items = [item for item in self._heap if item[2].live]
+            items += [(entry.score, 0, entry) for entry in self._retry if entry.live]
+        return [item[2].path for item in sorted(items, key=lambda item: item[:2])]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for item in self._heap if item[2].live)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queued and running files and queue wait times (seconds) per priority class."""
+        with self._lock:
+            queued: Dict[str, int] = {}
+            for item in self._heap:
+                if item[2].live:
+                    queued[item[2].priority] = queued.get(item[2].priority, 0) + 1
+            classes = set(queued) | set(self._running) | set(self._waits) | set(PRIORITY_CLASSES)
+            return {priority: {"queued": queued.get(priority, 0),
+                               "running": self._running.get(priority, 0),
+                               "limit": self.limits.get(priority),
+                               "wait": _summary(self._waits.get(priority, ()))}
+                    for priority in sorted(classes, key=lambda p: self.offsets.get(p, 0.0))}
+
+
+def parse_limits(spec: str) -> Dict[str, int]:
+    """Parse per-class limits such as "low=1,medium=4" (e.g. from an environment variable)."""
+    limits = {}
+    for part in (spec or "").split(','):
+        if not part.strip():
+            continue
+        name, _, value = part.partition('=')
+        try:
+            limits[name.strip().lower()] = max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring malformed scheduler limit {part.strip()!r}")
+    return limits
+
+
+def main():
+    """Order the action files of a Needs_Action folder."""
+    folder = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.getcwd(), "AI_Employee_Vault", "Needs_Action")
+    scheduler = ActionScheduler()
+    scheduler.sync(to_vault_path(folder).glob("*.md"))
+    while (entry := scheduler.pop()) is not None:
+        print(f"{entry.priority:6}  {datetime.fromtimestamp(entry.score).isoformat(timespec='seconds')}  {entry.path.name}")
+        scheduler.done(entry)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,18 @@ Email Agent Skill for AI Employee
 
 This skill handles email operations for the AI Employee.
 """
+import os
+import sys
 import json
 from typing import Dict, Any, List
 from pathlib import Path
 
+# Add the gold tier directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_fs import get_vault_fs
+from action_ids import create_new_file, new_id
+
 def send_email(to: str, subject: str, body: str, cc: str = "", bcc: str = "") -> Dict[str, Any]:
     """
     Send an email to a recipient using either Gmail API or SMTP.
@@ -218,13 +226,13 @@ This email was generated by AI Employee and requires human approval before sendi
 """
 
     # Write to approval queue
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
     pending_approval_path = vault_path / "Plans" / "Pending_Approval"
     pending_approval_path.mkdir(parents=True, exist_ok=True)
 
-    approval_filename = f"EMAIL_APPROVAL_{int(datetime.now().timestamp())}.md"
+    approval_filename = f"EMAIL_APPROVAL_{new_id()}.md"
     approval_file_path = pending_approval_path / approval_filename
-    approval_file_path.write_text(approval_content)
+    create_new_file(approval_file_path, approval_content)
 
     return {
         "success": True,
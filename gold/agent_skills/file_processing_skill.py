@@ -4,10 +4,18 @@ File Processing Agent Skill for AI Employee
 This skill handles file operations for the AI Employee.
 """
 import json
+import sys
+import os
 from typing import Dict, Any, List
-from pathlib import Path
 from datetime import datetime
 
+# Add the gold tier directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vault_index import INDEXED_FIELDS, get_vault_index
+from vault_fs import get_vault_fs
+from action_ids import create_new_file, new_id
+
 def create_action_file(content: str, file_type: str = "general", priority: str = "medium") -> Dict[str, Any]:
     """
     Create an action file in the Needs_Action folder.
@@ -20,13 +28,12 @@ def create_action_file(content: str, file_type: str = "general", priority: str =
     Returns:
         Dictionary with success status and file path
     """
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
     needs_action_path = vault_path / "Needs_Action"
     needs_action_path.mkdir(exist_ok=True)
 
     # Create the action file
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    action_filename = f"SKILL_ACTION_{timestamp}_{file_type.upper()}.md"
+    action_filename = f"SKILL_ACTION_{new_id()}_{file_type.upper()}.md"
     action_file_path = needs_action_path / action_filename
 
     action_content = f"""---
@@ -57,7 +64,7 @@ source: agent_skill
 This action was created by the AI Employee using file processing skill.
 """
 
-    action_file_path.write_text(action_content)
+    create_new_file(action_file_path, action_content)
 
     return {
         "success": True,
@@ -65,7 +72,8 @@ This action was created by the AI Employee using file processing skill.
         "message": f"Action file created: {action_filename}"
     }
 
-def create_plan_file(objective: str, tasks: List[str], timeline: str = "TBD") -> Dict[str, Any]:
+def create_plan_file(objective: str, tasks: List[str], timeline: str = "TBD",
+                     vault_path: str = None, writer=None) -> Dict[str, Any]:
     """
     Create a Plan.md file with specified objective and tasks.
 
@@ -73,17 +81,20 @@ def create_plan_file(objective: str, tasks: List[str], timeline: str = "TBD") ->
         objective: The main objective of the plan
         tasks: List of tasks to complete
         timeline: Timeline for completion
+        vault_path: Vault to create the plan in (defaults to the configured vault)
+        writer: VaultFS or WriteBatch the plan is written through (defaults to the vault's backend)
 
     Returns:
         Dictionary with success status and plan file path
     """
-    vault_path = Path("../AI_Employee_Vault")
+    fs = get_vault_fs(vault_path)
+    writer = writer or fs
+    vault_path = fs.root
     plans_path = vault_path / "Plans"
     plans_path.mkdir(exist_ok=True)
 
     # Create the plan file
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    plan_filename = f"PLAN_SKILL_{timestamp}.md"
+    plan_filename = f"PLAN_SKILL_{new_id()}.md"
     plan_file_path = plans_path / plan_filename
 
     # Format tasks as checklist
@@ -122,7 +133,7 @@ timeline: {timeline}
 This plan was automatically generated by the AI Employee using the file processing skill.
 """
 
-    plan_file_path.write_text(plan_content)
+    writer.write_text(plan_file_path, plan_content)
 
     return {
         "success": True,
@@ -138,23 +149,29 @@ def check_pending_actions(folder: str = "Needs_Action") -> List[Dict[str, Any]]:
         folder: Folder to check (Needs_Action, Pending_Approval, etc.)
 
     Returns:
-        List of pending action files
+        List of pending action files with a preview and their indexed
+        frontmatter fields
     """
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
     target_path = vault_path / folder
     target_path.mkdir(exist_ok=True)
 
     pending_files = []
-    for file_path in target_path.glob("*.md"):
+    for record in get_vault_index(vault_path).query(target_path, suffix=".md"):
+        file_path = record['path']
         # Read the first few lines to get basic info
-        with open(file_path, 'r', encoding='utf-8') as f:
-            first_lines = f.read(200)  # Read first 200 characters
+        try:
+            with file_path.open('r', encoding='utf-8', errors='replace') as f:
+                first_lines = f.read(200)  # Read first 200 characters
+        except FileNotFoundError:
+            continue  # Moved on since the index last saw the folder
 
         pending_files.append({
             "filename": file_path.name,
             "path": str(file_path),
-            "size": file_path.stat().st_size,
-            "preview": first_lines
+            "size": record['size'],
+            "preview": first_lines,
+            "frontmatter": {field: record[field] for field in INDEXED_FIELDS if record[field] is not None}
         })
 
     return pending_files
@@ -171,7 +188,7 @@ def move_file(source_folder: str, target_folder: str, filename: str) -> Dict[str
     Returns:
         Dictionary with success status
     """
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
     source_path = vault_path / source_folder
     target_path = vault_path / target_folder
 
@@ -4,10 +4,18 @@ Social Media Agent Skill for AI Employee
 This skill handles social media operations including LinkedIn posting.
 """
 import json
+import sys
+import os
 from typing import Dict, Any, List
-from pathlib import Path
 from datetime import datetime, timedelta
 
+# Add the gold tier directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frontmatter import read_frontmatter, update_frontmatter_field
+from vault_fs import get_vault_fs, to_vault_path
+from action_ids import create_new_file, new_id
+
 def create_linkedin_post(content: str, visibility: str = "public") -> Dict[str, Any]:
     """
     Create a LinkedIn post draft.
@@ -19,13 +27,12 @@ def create_linkedin_post(content: str, visibility: str = "public") -> Dict[str,
     Returns:
         Dictionary with success status and post information
     """
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
     linkedin_posts_path = vault_path / "LinkedIn_Posts"
     linkedin_posts_path.mkdir(parents=True, exist_ok=True)
 
     # Create the post file
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    post_filename = f"LINKEDIN_POST_{timestamp}.md"
+    post_filename = f"LINKEDIN_POST_{new_id()}.md"
     post_file_path = linkedin_posts_path / post_filename
 
     post_content = f"""---
@@ -50,7 +57,7 @@ scheduled: {datetime.now().replace(hour=12, minute=0, second=0, microsecond=0).i
 ## Notes
 This post was automatically generated by the AI Employee using social media skill.
 """
-    post_file_path.write_text(post_content)
+    create_new_file(post_file_path, post_content)
 
     return {
         "success": True,
@@ -74,23 +81,15 @@ def schedule_linkedin_post(post_file_path: str, scheduled_time: str = None) -> D
         scheduled_time = (datetime.now() + timedelta(days=1)).replace(hour=12, minute=0, second=0, microsecond=0).isoformat()
 
     # Update the post file with scheduled time
-    post_path = Path(post_file_path)
+    post_path = to_vault_path(post_file_path)
     if not post_path.exists():
         return {
             "success": False,
             "message": f"Post file does not exist: {post_file_path}"
         }
 
-    content = post_path.read_text()
     # Replace the scheduled time in the YAML front matter
-    import re
-    updated_content = re.sub(
-        r'scheduled:.*',
-        f'scheduled: {scheduled_time}',
-        content,
-        count=1
-    )
-    post_path.write_text(updated_content)
+    update_frontmatter_field(post_path, 'scheduled', scheduled_time)
 
     return {
         "success": True,
@@ -160,7 +159,7 @@ def get_scheduled_posts() -> List[Dict[str, Any]]:
     Returns:
         List of scheduled posts
     """
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
     linkedin_posts_path = vault_path / "LinkedIn_Posts"
 
     if not linkedin_posts_path.exists():
@@ -168,22 +167,15 @@ def get_scheduled_posts() -> List[Dict[str, Any]]:
 
     scheduled_posts = []
     for post_file in linkedin_posts_path.glob("*.md"):
-        content = post_file.read_text()
-
         # Extract scheduled information from front matter
-        import re
-        scheduled_match = re.search(r'scheduled:\s*(.*)', content)
-        status_match = re.search(r'status:\s*(.*)', content)
-
-        if scheduled_match:
-            scheduled_time = scheduled_match.group(1).strip()
-            status = status_match.group(1).strip() if status_match else "unknown"
+        metadata = read_frontmatter(post_file)
 
+        if 'scheduled' in metadata.fields:
             scheduled_posts.append({
                 "filename": post_file.name,
                 "path": str(post_file),
-                "scheduled_time": scheduled_time,
-                "status": status
+                "scheduled_time": metadata.get('scheduled'),
+                "status": metadata.status or "unknown"
             })
 
     return scheduled_posts
@@ -3,18 +3,20 @@ Comprehensive Audit Logging for AI Employee
 
 This module provides comprehensive audit logging for the Gold Tier requirements.
 """
-import time
 import logging
-from pathlib import Path
 from datetime import datetime
 import json
 import sys
 import os
+import threading
 from typing import Dict, Any, List
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from vault_fs import get_vault_fs, to_vault_path
+from action_ids import new_id
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,9 +28,13 @@ class AuditLogger:
     """Handles comprehensive audit logging for all AI Employee activities"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.writer = self.fs
         self.logs_dir = self.vault_path / "Logs"
         self.audit_log_file = self.logs_dir / f"audit_log_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        # The daily summary is read, updated and rewritten; one event at a time
+        self._summary_lock = threading.Lock()
 
         # Create necessary directories
         self.logs_dir.mkdir(parents=True, exist_ok=True)
@@ -61,7 +67,7 @@ class AuditLogger:
         """
         event = {
             "timestamp": datetime.now().isoformat(),
-            "event_id": f"event_{int(time.time() * 1000000)}",  # Unique event ID
+            "event_id": f"event_{new_id()}",  # Unique, time-sortable event ID
             "event_type": event_type,
             "description": description,
             "actor": actor,
@@ -73,11 +79,11 @@ class AuditLogger:
         }
 
         # Write event to audit log file
-        with open(self.audit_log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(event) + '\n')
+        self.fs.append_bytes(self.audit_log_file, (json.dumps(event) + '\n').encode('utf-8'))
 
         # Also add to daily summary if needed
-        self._update_daily_summary(event)
+        with self._summary_lock:
+            self._update_daily_summary(event)
 
         logger.debug(f"Audit log: {event_type} - {description}")
         return event
@@ -86,8 +92,8 @@ class AuditLogger:
         """Update the daily activity summary."""
         summary_file = self.logs_dir / f"daily_summary_{datetime.now().strftime('%Y%m%d')}.md"
 
-        if summary_file.exists():
-            summary_content = summary_file.read_text()
+        if self.writer.exists(summary_file):
+            summary_content = self.writer.read_text(summary_file)
         else:
             summary_content = f"""---
 type: daily_audit_summary
@@ -166,12 +172,12 @@ date: {datetime.now().strftime('%Y-%m-%d')}
             updated_lines.insert(idx, timeline_entry)
             summary_content = '\n'.join(updated_lines)
 
-        summary_file.write_text(summary_content)
+        self.writer.write_text(summary_file, summary_content)
 
     def log_file_operation(self, operation: str, file_path: str, actor: str = "system") -> Dict[str, Any]:
         """Log a file operation."""
         description = f"{operation} file: {file_path}"
-        result = "success" if (operation in ["read", "write", "delete"] and Path(file_path).exists()) else "success"
+        result = "success" if (operation in ["read", "write", "delete"] and to_vault_path(file_path).exists()) else "success"
 
         return self.log_event(
             event_type="file_operation",
@@ -236,7 +242,7 @@ date: {datetime.now().strftime('%Y-%m-%d')}
         }
 
         for log_file in log_files:
-            with open(log_file, 'r', encoding='utf-8') as f:
+            with log_file.open('r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
                         try:
@@ -319,12 +325,12 @@ from datetime import timedelta
 
 def main():
     """Main function to demonstrate audit logging functionality"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
 
-    audit_logger = AuditLogger(str(vault_path))
+    audit_logger = AuditLogger(vault_path)
 
     # Log various events to demonstrate functionality
     print("Logging system events...")
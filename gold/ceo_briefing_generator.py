@@ -15,6 +15,8 @@ from typing import Dict, Any, List
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from vault_fs import get_vault_fs
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,7 +28,9 @@ class CEOBriefingGenerator:
     """Generates weekly business and accounting audits with CEO briefings"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.writer = self.fs
         self.reports_dir = self.vault_path / "Reports"
         self.briefings_dir = self.vault_path / "Briefings"
         self.tasks_dir = self.vault_path / "Tasks"
@@ -86,7 +90,7 @@ class CEOBriefingGenerator:
         report_path = self.reports_dir / report_filename
 
         report_content = self._format_audit_report(audit_data)
-        report_path.write_text(report_content)
+        self.writer.write_text(report_path, report_content)
 
         return audit_data
 
@@ -313,7 +317,7 @@ This week showed **strong revenue performance** with ${audit_data['revenue']['to
         briefing_path = self.briefings_dir / briefing_filename
 
         briefing_content = self._format_ceo_briefing(audit_data)
-        briefing_path.write_text(briefing_content)
+        self.writer.write_text(briefing_path, briefing_content)
 
         logger.info(f"CEO briefing generated: {briefing_path.name}")
         return briefing_path
@@ -375,13 +379,13 @@ generated: {audit_data['generated_at']}
 
 def main():
     """Main function to demonstrate CEO briefing generation"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Reports").mkdir(exist_ok=True)
     (vault_path / "Briefings").mkdir(exist_ok=True)
 
-    generator = CEOBriefingGenerator(str(vault_path))
+    generator = CEOBriefingGenerator(vault_path)
 
     # Generate a weekly audit and CEO briefing
     print("Generating weekly audit...")
@@ -0,0 +1,359 @@
+"""
+Change Journal for AI Employee
+
+This module keeps an append-only journal of vault changes
+(.journal/changes.jsonl). Every file that is created, updated, moved or
+deleted through a VaultFS backend is recorded as one compact line with a
+sequence number:
+
+    {"seq":1042,"op":"move","path":"Done/2026/02/19/ACTION_x.md","src":"Needs_Action/ACTION_x.md","ts":1771500000.123}
+
+Consumers read the journal through named cursors
+(.journal/cursors/<name>.json) that durably remember how far they got, so
+each run looks only at the entries appended since the last one instead of
+rescanning folders. The journal doubles as a replayable history of what
+happened in the vault (see main()).
+
+Journaling starts in a process once get_change_journal() has been called for
+the vault. Edits made outside the tiers (e.g. an approval moved by hand in
+Obsidian) are journaled when the vault index reconciles their folder, so
+consumers sync the folders they care about before reading their cursor.
+Delivery is at least once: a change can appear twice (from the backend and
+from a reconciliation), and consumers with a new cursor start with a full
+scan. Logs/ is not journaled: the audit and error logs are append-only
+histories already.
+"""
+import os
+import sys
+import json
+import time
+import fnmatch
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import (PathLike, VaultFS, VaultPath, add_change_listener, get_vault_fs,
+                      remove_change_listener)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+JOURNAL_DIR = ".journal"
+JOURNAL_FILENAME = "changes.jsonl"
+CURSOR_DIRNAME = "cursors"
+
+# Folders whose changes are not journaled
+EXCLUDED_FOLDERS = ("Logs",)
+
+# Bytes read from the end of the journal to find the last sequence number
+TAIL_BYTES = 64 * 1024
+
+
+class ChangeRecord(NamedTuple):
+    """One journaled change; paths are relative to the vault root"""
+    seq: int
+    op: str
+    path: str
+    src: Optional[str]
+    ts: float
+
+
+def net_changes(records: Iterable[ChangeRecord], folder: str, pattern: str = "*",
+                recursive: bool = False) -> Dict[str, bool]:
+    """
+    Collapse records into their net effect on the files of one folder.
+
+    Args:
+        records: Journal records, oldest first
+        folder: Folder relative to the vault root, e.g. "Plans/Approved"
+        pattern: fnmatch pattern for file names
+        recursive: Include files in subfolders
+
+    Returns:
+        Relative path -> True if the file exists after the records (created,
+        updated or moved in), False if it was deleted or moved out
+    """
+    prefix = folder.strip('/') + '/' if folder.strip('/') else ''
+
+    def matches(path: Optional[str]) -> bool:
+        if not path or not path.startswith(prefix):
+            return False
+        name = path[len(prefix):]
+        return (recursive or '/' not in name) and fnmatch.fnmatchcase(name.rsplit('/', 1)[-1], pattern)
+
+    result: Dict[str, bool] = {}
+    for record in records:
+        if record.op == 'move' and matches(record.src):
+            result[record.src] = False
+        if matches(record.path):
+            result[record.path] = record.op != 'delete'
+    return result
+
+
+class ChangeJournal:
+    """Append-only journal of vault file changes"""
+
+    def __init__(self, vault_path: str):
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.journal_dir = self.vault_path / JOURNAL_DIR
+        self.journal_path = self.journal_dir / JOURNAL_FILENAME
+        self.cursor_dir = self.journal_dir / CURSOR_DIRNAME
+        self._lock = threading.Lock()
+
+        # Last sequence number and the journal size it was read at
+        self._seq = 0
+        self._offset = 0
+
+        self.cursor_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._sync_tail()
+
+        excluded = [self.journal_dir] + [self.vault_path / folder for folder in EXCLUDED_FOLDERS]
+        add_change_listener(self.vault_path, self._on_change, exclude=excluded)
+
+    def _relative(self, path: Optional[str]) -> Optional[str]:
+        if not path:
+            return None
+        try:
+            rel = self.vault_path.with_segments(path).relative_to(self.vault_path).as_posix()
+        except ValueError:
+            return None
+        if any(part.startswith('.') for part in rel.split('/')):
+            return None
+        return rel
+
+    def size(self) -> int:
+        """Current size of the journal file in bytes."""
+        try:
+            return self.journal_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _sync_tail(self):
+        """Pick up the last sequence number if another process appended since we last looked."""
+        size = self.size()
+        if size == self._offset:
+            return
+        start = max(0, size - TAIL_BYTES)
+        with self.journal_path.open('rb') as f:
+            f.seek(start)
+            data = f.read(size - start)
+        self._seq = 0
+        for line in reversed(data.splitlines()):
+            try:
+                self._seq = json.loads(line)["seq"]
+                break
+            except (ValueError, KeyError, TypeError):
+                continue
+        self._offset = size
+
+    def _on_change(self, kind: str, path: str, src: Optional[str]):
+        self.record(kind, path, src)
+
+    def record(self, op: str, path: PathLike, src: PathLike = None) -> Optional[int]:
+        """
+        Append a change to the journal.
+
+        Moves out of the journaled part of the vault are recorded as deletes,
+        moves into it as creates.
+
+        Args:
+            op: 'create', 'update', 'move' or 'delete'
+            path: Changed file (destination for moves)
+            src: Previous path of a moved file
+
+        Returns:
+            Sequence number of the record, or None if the change is not journaled
+        """
+        rel = self._relative(os.fspath(path))
+        rel_src = self._relative(os.fspath(src)) if src is not None else None
+        if rel is None:
+            if rel_src is None:
+                return None
+            op, rel, rel_src = 'delete', rel_src, None
+        elif op == 'move' and rel_src is None:
+            op = 'create'
+
+        entry: Dict[str, Any] = {"seq": 0, "op": op, "path": rel}
+        if op == 'move':
+            entry["src"] = rel_src
+        entry["ts"] = round(time.time(), 3)
+
+        with self._lock:
+            self._sync_tail()
+            self._seq += 1
+            entry["seq"] = self._seq
+            line = (json.dumps(entry, separators=(',', ':')) + "\n").encode('utf-8')
+            # One appending write per record, so concurrent writers do not interleave
+            self.fs.append_bytes(self.journal_path, line)
+            self._offset += len(line)
+            return self._seq
+
+    def read(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[ChangeRecord], int]:
+        """
+        Read records starting at a byte offset.
+
+        Args:
+            offset: Byte offset to start at (0 for the whole history)
+            limit: Maximum number of records to return
+
+        Returns:
+            (records, byte offset just after the last returned record)
+        """
+        try:
+            with self.journal_path.open('rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+
+        records = []
+        position = offset
+        # Only consume complete lines; a partial last line is read next time
+        for line in data[:data.rfind(b'\n') + 1].splitlines(keepends=True):
+            if limit is not None and len(records) >= limit:
+                break
+            position += len(line)
+            try:
+                entry = json.loads(line)
+                records.append(ChangeRecord(entry["seq"], entry["op"], entry["path"],
+                                            entry.get("src"), entry.get("ts", 0.0)))
+            except (ValueError, KeyError):
+                logger.warning(f"Skipping malformed line in {self.journal_path.name} at byte {position}")
+        return records, position
+
+    def cursor(self, name: str) -> 'JournalCursor':
+        """Return the named consumer cursor (created at the start of the journal if new)."""
+        return JournalCursor(self, name)
+
+    def close(self):
+        """Stop journaling changes and drop the shared instance."""
+        remove_change_listener(self._on_change)
+        with _journals_lock:
+            for key in [key for key, journal in _journals.items() if journal is self]:
+                del _journals[key]
+
+
+class JournalCursor:
+    """A consumer's durable position in the change journal"""
+
+    def __init__(self, journal: ChangeJournal, name: str):
+        self.journal = journal
+        self.name = name
+        self.path = journal.cursor_dir / f"{name}.json"
+
+        self.offset = 0
+        self.seq = 0
+        # Small consumer-specific state stored with the position
+        self.state: Dict[str, Any] = {}
+        # True until the first commit(); consumers do a full scan first
+        self.is_new = True
+
+        try:
+            saved = json.loads(self.path.read_text(encoding='utf-8'))
+            self.offset, self.seq = saved["offset"], saved["seq"]
+            self.state = saved.get("state", {})
+            self.is_new = False
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError):
+            logger.warning(f"Ignoring unreadable journal cursor {self.path.name}")
+
+        if self.offset > journal.size():
+            logger.warning(f"Change journal is shorter than cursor {name}; starting over")
+            self.offset, self.seq, self.is_new = 0, 0, True
+
+        self._read_offset = self.offset
+        self._read_seq = self.seq
+
+    def read(self, limit: Optional[int] = None) -> List[ChangeRecord]:
+        """
+        Records appended since the last commit().
+
+        Reading does not move the cursor; commit() does, so records are
+        processed at least once even if the consumer fails halfway.
+        """
+        records, self._read_offset = self.journal.read(self.offset, limit)
+        self._read_seq = records[-1].seq if records else self.seq
+        return records
+
+    def seek_end(self):
+        """Skip everything journaled so far (after the consumer did a full scan)."""
+        with self.journal._lock:
+            self.journal._sync_tail()
+            self._read_offset, self._read_seq = self.journal._offset, self.journal._seq
+
+    def commit(self, writer=None):
+        """
+        Durably move the cursor past the records returned by read() (or to seek_end()).
+
+        Args:
+            writer: WriteBatch holding the outputs made from those records; the
+                cursor is staged on it so it is saved after them. Without one
+                (or with a plain VaultFS) the cursor is replaced atomically now.
+        """
+        self.offset, self.seq = self._read_offset, self._read_seq
+        content = json.dumps({
+            "offset": self.offset,
+            "seq": self.seq,
+            "state": self.state,
+            "updated": datetime.now().isoformat()
+        })
+        if writer is None or isinstance(writer, VaultFS):
+            with self.journal.fs.atomic_write(self.path, encoding='utf-8') as f:
+                f.write(content)
+        else:
+            writer.write_text(self.path, content, encoding='utf-8')
+        self.is_new = False
+
+
+# Keyed by backend as well as root, like the shared vault indexes
+_journals: Dict[Tuple[VaultFS, VaultPath], ChangeJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_change_journal(vault_path: Optional[str] = None) -> ChangeJournal:
+    """Return the shared ChangeJournal for a vault, creating it (and starting journaling) on first use."""
+    fs = get_vault_fs(vault_path)
+    key = (fs, fs.root.resolve())
+    with _journals_lock:
+        if key not in _journals:
+            _journals[key] = ChangeJournal(fs.root)
+        return _journals[key]
+
+
+def active_change_journal(vault_path: Optional[str] = None) -> Optional[ChangeJournal]:
+    """Return the shared ChangeJournal for a vault if journaling has been started, else None."""
+    fs = get_vault_fs(vault_path)
+    with _journals_lock:
+        return _journals.get((fs, fs.root.resolve()))
+
+
+def main():
+    """Print the journaled history of the default vault (optionally from a sequence number)."""
+    journal = get_change_journal()
+    after = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+
+    records, _ = journal.read()
+    for record in records:
+        if record.seq <= after:
+            continue
+        when = datetime.fromtimestamp(record.ts).strftime('%Y-%m-%d %H:%M:%S')
+        source = f"{record.src} -> " if record.src else ""
+        print(f"{record.seq:>8} {when} {record.op:<6} {source}{record.path}")
+
+    print(f"{len(records)} change(s) journaled")
+    journal.close()
+
+
+if __name__ == "__main__":
+    main()
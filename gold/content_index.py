@@ -0,0 +1,158 @@
+"""
+Content Index for AI Employee
+
+This module recognises drops whose content has been seen before, so the same
+attachment dropped three times by a sync client becomes one action instead
+of three.
+
+The first drop of each content is kept in a content-addressed blob store
+(.blobs/<sha256> at the vault root) as a hard link to its attachment, so
+keeping it costs no disk space and it survives the action being archived or
+cleaned up. An append-only index next to the blobs records who saw what first
+and every repeat:
+
+    {"op": "first", "sha256": "9d14...", "size": 300008, "name": "scan.pdf",
+     "action": "ACTION_..._scan.pdf.md", "seen": "..."}
+    {"op": "repeat", "sha256": "9d14...", "name": "scan (1).pdf",
+     "action": "ACTION_..._scan.pdf.md", "seen": "..."}
+
+Content only counts as seen while its blob exists; deleting a blob (or the
+whole .blobs folder) makes the next drop of that content new work again.
+"""
+import os
+import sys
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import Fingerprint, PathLike, get_vault_fs, to_vault_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+BLOB_DIRNAME = ".blobs"
+INDEX_FILENAME = "index.jsonl"
+
+
+class ContentIndex:
+    """SHA-256 -> first drop with that content, backed by hard-linked blobs"""
+
+    def __init__(self, vault_path: PathLike):
+        self.fs = get_vault_fs(vault_path)
+        self.blobs = self.fs.root / BLOB_DIRNAME
+        self.index_path = self.blobs / INDEX_FILENAME
+        self.blobs.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        # Signalled when a pending claim is added or released
+        self._settled = threading.Condition(self._lock)
+
+        # sha256 -> "first" record, claims not yet added, and number of repeats
+        self._first: Dict[str, dict] = {}
+        self._pending: Dict[str, dict] = {}
+        self._repeats: Dict[str, int] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            data = self.index_path.read_bytes()
+        except FileNotFoundError:
+            return
+        for line in data[:data.rfind(b'\n') + 1].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError):
+                logger.warning(f"Skipping malformed line in {BLOB_DIRNAME}/{INDEX_FILENAME}")
+
+    def _apply(self, record: dict):
+        if record["op"] == "first":
+            self._first[record["sha256"]] = record
+            self._repeats.pop(record["sha256"], None)
+        elif record["op"] == "repeat":
+            self._repeats[record["sha256"]] = self._repeats.get(record["sha256"], 0) + 1
+
+    def _append(self, record: dict):
+        self.fs.append_bytes(self.index_path, (json.dumps(record) + "\n").encode('utf-8'))
+        self._apply(record)
+
+    def claim(self, fingerprint: Fingerprint, name: str, action: str) -> Optional[dict]:
+        """
+        Check a drop's content against the index.
+
+        Content seen before is recorded as a repeat. New content is reserved for
+        this drop; the caller then either add()s it once its action file exists,
+        or release()s it. An identical drop handled concurrently waits for that
+        and then becomes its repeat (or takes over the claim).
+
+        Args:
+            fingerprint: Size and hash of the content
+            name: Name the file was dropped under
+            action: Action file that will be created for it
+
+        Returns:
+            The "first" record this drop repeats, or None for new content
+        """
+        sha256 = fingerprint.sha256
+        with self._lock:
+            while sha256 in self._pending:
+                self._settled.wait()
+            first = self._first.get(sha256)
+            if first is not None and not self.fs.exists(self.blobs / sha256):
+                first = None
+            if first is None:
+                self._pending[sha256] = {"op": "first", "sha256": sha256, "size": fingerprint.size,
+                                         "name": name, "action": action}
+                return None
+            self._append({"op": "repeat", "sha256": sha256, "name": name,
+                          "action": first["action"], "seen": datetime.now().isoformat()})
+            return first
+
+    def add(self, fingerprint: Fingerprint, path: PathLike) -> bool:
+        """
+        Index claimed content and keep it as a blob.
+
+        Args:
+            fingerprint: Size and hash of the content
+            path: The drop's attachment, which the blob is hard-linked to
+
+        Returns:
+            True if repeats of the content will be recognised
+        """
+        path = to_vault_path(path)
+        blob = self.blobs / fingerprint.sha256
+        try:
+            self.fs.link(path, blob)
+        except FileExistsError:
+            # Left over from an index line that was never written; same content
+            pass
+        except OSError as e:
+            logger.warning(f"Cannot keep a blob of {path.name} ({e}); its repeats will not be recognised")
+            self.release(fingerprint)
+            return False
+        with self._lock:
+            record = self._pending.pop(fingerprint.sha256)
+            record["seen"] = datetime.now().isoformat()
+            try:
+                self._append(record)
+            finally:
+                self._settled.notify_all()
+        return True
+
+    def release(self, fingerprint: Fingerprint):
+        """Give up a claim on new content (e.g. its action file could not be written)."""
+        with self._lock:
+            self._pending.pop(fingerprint.sha256, None)
+            self._settled.notify_all()
+
+    def repeats(self, sha256: str) -> int:
+        """Number of times this content was dropped again after its first drop."""
+        with self._lock:
+            return self._repeats.get(sha256, 0)
@@ -10,11 +10,17 @@ from datetime import datetime
 import json
 import sys
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from keyword_classifier import classify_file, classify_text
+from vault_fs import get_vault_fs
+from action_ids import new_id
+from vault_index import get_vault_index
+from change_journal import get_change_journal, net_changes
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,11 +28,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (folder, category that flags a file, event type, event domain, description, severity)
+DOMAIN_CHECKS = [
+    ("Personal/Communications", 'business_related', "personal_business_overlap", "personal_to_business",
+     "Business-related content detected in personal communication: {name}", "medium"),
+    ("Business/Communications", 'personal_related', "business_personal_overlap", "business_to_personal",
+     "Personal matter detected in business communication: {name}", "medium"),
+    ("Personal/Finance", 'business_finance', "finance_cross_domain", "personal_to_business",
+     "Business-related finance in personal records: {name}", "high"),
+    ("Business/Finance", 'personal_finance', "finance_cross_domain", "business_to_personal",
+     "Personal finance in business records: {name}", "high"),
+]
+
+# Name prefixes of the references this integrator writes into the domains
+REFERENCE_PREFIXES = ("BUSINESS_REF_", "PERSONAL_REF_", "DOMAIN_REF_")
+
 class CrossDomainIntegrator:
     """Handles integration between personal and business domains"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.writer = self.fs
         self.personal_dir = self.vault_path / "Personal"
         self.business_dir = self.vault_path / "Business"
         self.integration_dir = self.vault_path / "Integration"
@@ -44,70 +67,71 @@ class CrossDomainIntegrator:
         (self.business_dir / "Finance").mkdir(exist_ok=True)
         (self.business_dir / "Communications").mkdir(exist_ok=True)
 
+        # Domain changes are followed through the change journal instead of
+        # rescanning the domain folders every cycle
+        self.index = get_vault_index(self.vault_path)
+        self.journal = get_change_journal(self.vault_path)
+        self._events_cursor = None
+        self._sync_cursor = None
+        self._dashboard_cursor = None
+        # Folder -> {file name: flagged by its domain check}
+        self._flagged: Dict[str, Dict[str, bool]] = {}
+
+    def _sync_domain_folders(self):
+        """Reconcile the domain folders so edits made by hand reach the change journal."""
+        for folder in ["Personal", "Business"] + [check[0] for check in DOMAIN_CHECKS]:
+            self.index.sync_folder(self.vault_path / folder)
+
+    def _refresh_flagged(self):
+        """Bring the per-file domain checks up to date with the change journal."""
+        if self._events_cursor is None:
+            # First use in this process: check every file, then follow the journal
+            self._events_cursor = self.journal.cursor("cross_domain_events")
+            self._sync_domain_folders()
+            self._events_cursor.seek_end()
+            for folder, category, *_ in DOMAIN_CHECKS:
+                self._flagged[folder] = {path.name: category in classify_file(path)
+                                         for path in (self.vault_path / folder).glob("*.md")}
+            self._events_cursor.commit()
+            return
+
+        self._sync_domain_folders()
+        records = self._events_cursor.read()
+        if not records:
+            return
+        for folder, category, *_ in DOMAIN_CHECKS:
+            for rel_path, exists in net_changes(records, folder, "*.md").items():
+                name = rel_path.rsplit('/', 1)[-1]
+                try:
+                    self._flagged[folder][name] = exists and category in classify_file(self.vault_path / rel_path)
+                except FileNotFoundError:
+                    self._flagged[folder][name] = False
+        self._events_cursor.commit()
+
     def detect_cross_domain_events(self) -> List[Dict[str, Any]]:
         """
         Detect events that span personal and business domains.
 
+        Files are classified once and then again only when the change journal
+        reports them as changed.
+
         Returns:
             List of cross-domain events
         """
-        events = []
-
-        # Check for business-related personal communications
-        personal_emails = list((self.personal_dir / "Communications").glob("*.md"))
-        for email in personal_emails:
-            content = email.read_text()
-            if any(keyword in content.lower() for keyword in ['client', 'project', 'invoice', 'payment', 'business']):
-                events.append({
-                    "type": "personal_business_overlap",
-                    "source": str(email),
-                    "domain": "personal_to_business",
-                    "description": f"Business-related content detected in personal communication: {email.name}",
-                    "severity": "medium",
-                    "timestamp": datetime.now().isoformat()
-                })
-
-        # Check for personal matters in business context
-        business_docs = list((self.business_dir / "Communications").glob("*.md"))
-        for doc in business_docs:
-            content = doc.read_text()
-            if any(keyword in content.lower() for keyword in ['personal', 'family', 'vacation', 'doctor', 'appointment']):
-                events.append({
-                    "type": "business_personal_overlap",
-                    "source": str(doc),
-                    "domain": "business_to_personal",
-                    "description": f"Personal matter detected in business communication: {doc.name}",
-                    "severity": "medium",
-                    "timestamp": datetime.now().isoformat()
-                })
-
-        # Check for financial transactions that span domains
-        personal_finance = list((self.personal_dir / "Finance").glob("*.md"))
-        business_finance = list((self.business_dir / "Finance").glob("*.md"))
-
-        for p_fin in personal_finance:
-            p_content = p_fin.read_text()
-            if 'business' in p_content.lower() or 'work' in p_content.lower():
-                events.append({
-                    "type": "finance_cross_domain",
-                    "source": str(p_fin),
-                    "domain": "personal_to_business",
-                    "description": f"Business-related finance in personal records: {p_fin.name}",
-                    "severity": "high",
-                    "timestamp": datetime.now().isoformat()
-                })
+        self._refresh_flagged()
 
-        for b_fin in business_finance:
-            b_content = b_fin.read_text()
-            if 'personal' in b_content.lower() or 'private' in b_content.lower():
-                events.append({
-                    "type": "finance_cross_domain",
-                    "source": str(b_fin),
-                    "domain": "business_to_personal",
-                    "description": f"Personal finance in business records: {b_fin.name}",
-                    "severity": "high",
-                    "timestamp": datetime.now().isoformat()
-                })
+        events = []
+        for folder, _, event_type, domain, description, severity in DOMAIN_CHECKS:
+            for name, flagged in sorted(self._flagged[folder].items()):
+                if flagged:
+                    events.append({
+                        "type": event_type,
+                        "source": str(self.vault_path / folder / name),
+                        "domain": domain,
+                        "description": description.format(name=name),
+                        "severity": severity,
+                        "timestamp": datetime.now().isoformat()
+                    })
 
         return events
 
@@ -144,8 +168,7 @@ class CrossDomainIntegrator:
         link_filename = f"LINK_{from_domain}_to_{to_domain}_{link_id}.json"
         link_path = self.integration_dir / link_filename
 
-        with open(link_path, 'w', encoding='utf-8') as f:
-            json.dump(link_data, f, indent=2)
+        self.writer.write_text(link_path, json.dumps(link_data, indent=2), encoding='utf-8')
 
         logger.info(f"Cross-domain link created: {link_data}")
         return link_id
@@ -154,6 +177,10 @@ class CrossDomainIntegrator:
         """
         Synchronize tasks that span personal and business domains.
 
+        Only task files created or changed since the last synchronization are
+        looked at (the first run scans both domains). References written by
+        this integrator are never synchronized back.
+
         Returns:
             Dictionary with synchronization results
         """
@@ -164,11 +191,12 @@ class CrossDomainIntegrator:
             "synchronized": 0
         }
 
+        personal_tasks, business_tasks = self._tasks_to_sync()
+
         # Look for personal tasks that mention business
-        personal_tasks = list(self.personal_dir.rglob("*task*.md"))
         for task in personal_tasks:
             content = task.read_text()
-            if any(keyword in content.lower() for keyword in ['client', 'meeting', 'work', 'office', 'project']):
+            if 'business_task' in classify_text(content):
                 # This personal task may affect business - create a reference
                 business_ref = self._create_business_ref_from_personal(task, content)
                 results["personal_to_business"].append({
@@ -178,10 +206,9 @@ class CrossDomainIntegrator:
                 results["synchronized"] += 1
 
         # Look for business tasks that mention personal
-        business_tasks = list(self.business_dir.rglob("*task*.md"))
         for task in business_tasks:
             content = task.read_text()
-            if any(keyword in content.lower() for keyword in ['personal', 'family', 'vacation', 'appointment', 'private']):
+            if 'personal_task' in classify_text(content):
                 # This business task may affect personal - create a reference
                 personal_ref = self._create_personal_ref_from_business(task, content)
                 results["business_to_personal"].append({
@@ -193,12 +220,37 @@ class CrossDomainIntegrator:
         # Check for potential conflicts
         results["conflicts"] = self._detect_schedule_conflicts()
 
+        # Saved together with the references written above
+        self._sync_cursor.commit(self.writer)
         return results
 
+    def _tasks_to_sync(self) -> Tuple[List[Path], List[Path]]:
+        """Personal and business task files that changed since the last synchronization."""
+        if self._sync_cursor is None:
+            self._sync_cursor = self.journal.cursor("cross_domain_sync")
+        cursor = self._sync_cursor
+
+        if cursor.is_new:
+            self._sync_domain_folders()
+            cursor.seek_end()
+            personal_tasks = list(self.personal_dir.rglob("*task*.md"))
+            business_tasks = list(self.business_dir.rglob("*task*.md"))
+        else:
+            self._sync_domain_folders()
+            records = cursor.read()
+            personal_tasks, business_tasks = [
+                [self.vault_path / rel_path
+                 for rel_path, exists in net_changes(records, domain, "*task*.md", recursive=True).items()
+                 if exists and self.writer.exists(self.vault_path / rel_path)]
+                for domain in ("Personal", "Business")
+            ]
+
+        return ([task for task in personal_tasks if not task.name.startswith(REFERENCE_PREFIXES)],
+                [task for task in business_tasks if not task.name.startswith(REFERENCE_PREFIXES)])
+
     def _create_business_ref_from_personal(self, personal_task: Path, content: str) -> str:
         """Create a business reference from a personal task."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        ref_file = self.business_dir / f"BUSINESS_REF_{timestamp}_{personal_task.name}"
+        ref_file = self.business_dir / f"BUSINESS_REF_{new_id()}_{personal_task.name}"
 
         ref_content = f"""---
 type: business_reference
@@ -223,13 +275,12 @@ This business reference was automatically generated from a personal task that me
 ## Synchronization
 This item is synchronized between personal and business domains.
 """
-        ref_file.write_text(ref_content)
+        self.writer.write_text(ref_file, ref_content)
         return str(ref_file)
 
     def _create_personal_ref_from_business(self, business_task: Path, content: str) -> str:
         """Create a personal reference from a business task."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        ref_file = self.personal_dir / f"PERSONAL_REF_{timestamp}_{business_task.name}"
+        ref_file = self.personal_dir / f"PERSONAL_REF_{new_id()}_{business_task.name}"
 
         ref_content = f"""---
 type: personal_reference
@@ -254,7 +305,7 @@ This personal reference was automatically generated from a business task that af
 ## Synchronization
 This item is synchronized between business and personal domains.
 """
-        ref_file.write_text(ref_content)
+        self.writer.write_text(ref_file, ref_content)
         return str(ref_file)
 
     def _detect_schedule_conflicts(self) -> List[Dict[str, Any]]:
@@ -270,15 +321,34 @@ This item is synchronized between business and personal domains.
         # In real implementation, this would parse event times and identify overlaps
         return conflicts
 
-    def create_integration_dashboard(self) -> Path:
+    def create_integration_dashboard(self, force: bool = False) -> Path:
         """
         Create a dashboard showing cross-domain integration status.
 
+        Today's dashboard is only regenerated when the change journal shows
+        changes in the personal or business domain since it was written.
+
+        Args:
+            force: Regenerate even if nothing changed
+
         Returns:
             Path to the integration dashboard file
         """
         dashboard_path = self.integration_dir / f"Integration_Dashboard_{datetime.now().strftime('%Y%m%d')}.md"
 
+        if self._dashboard_cursor is None:
+            self._dashboard_cursor = self.journal.cursor("integration_dashboard")
+        cursor = self._dashboard_cursor
+        self._sync_domain_folders()
+        domain_changed = any(
+            path.startswith(("Personal/", "Business/"))
+            for record in cursor.read() for path in (record.path, record.src or "")
+        )
+        if not (force or cursor.is_new or domain_changed or not self.writer.exists(dashboard_path)):
+            cursor.commit(self.writer)
+            logger.info(f"No domain changes since {dashboard_path.name} was generated")
+            return dashboard_path
+
         # Gather integration statistics
         cross_events = self.detect_cross_domain_events()
         sync_results = self.sync_personal_business_tasks()
@@ -326,7 +396,8 @@ This dashboard shows the integration status between personal and business domain
 ---
 *This dashboard was automatically generated by the Cross-Domain Integration system.*
 """
-        dashboard_path.write_text(dashboard_content)
+        self.writer.write_text(dashboard_path, dashboard_content)
+        cursor.commit(self.writer)
         return dashboard_path
 
     def process_cross_domain_notification(self, notification_data: Dict[str, Any]) -> bool:
@@ -341,9 +412,8 @@ This dashboard shows the integration status between personal and business domain
         """
         try:
             # Determine if this notification affects both domains
-            affects_both_domains = any(
-                keyword in notification_data.get('content', '').lower()
-                for keyword in ['business', 'work', 'personal', 'client', 'private']
+            affects_both_domains = 'cross_domain_notification' in classify_text(
+                notification_data.get('content', '')
             )
 
             if affects_both_domains:
@@ -361,10 +431,10 @@ This dashboard shows the integration status between personal and business domain
 
     def _create_domain_references(self, notification_data: Dict[str, Any]):
         """Create references to a notification in both domains."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        ref_id = new_id()
 
         # Create reference in personal domain
-        personal_ref = self.personal_dir / f"DOMAIN_REF_{timestamp}_{notification_data.get('id', 'unknown')}.md"
+        personal_ref = self.personal_dir / f"DOMAIN_REF_{ref_id}_{notification_data.get('id', 'unknown')}.md"
         personal_content = f"""---
 type: domain_reference
 domain: personal
@@ -385,10 +455,10 @@ A notification from the business domain requires personal attention.
 - [ ] Adjust personal schedule if needed
 - [ ] Respond appropriately
 """
-        personal_ref.write_text(personal_content)
+        self.writer.write_text(personal_ref, personal_content)
 
         # Create reference in business domain
-        business_ref = self.business_dir / f"DOMAIN_REF_{timestamp}_{notification_data.get('id', 'unknown')}.md"
+        business_ref = self.business_dir / f"DOMAIN_REF_{ref_id}_{notification_data.get('id', 'unknown')}.md"
         business_content = f"""---
 type: domain_reference
 domain: business
@@ -409,17 +479,17 @@ A notification from the personal domain requires business attention.
 - [ ] Adjust business schedule if needed
 - [ ] Respond appropriately
 """
-        business_ref.write_text(business_content)
+        self.writer.write_text(business_ref, business_content)
 
 def main():
     """Main function to demonstrate cross-domain integration"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Personal" / "Communications").mkdir(parents=True, exist_ok=True)
     (vault_path / "Business" / "Communications").mkdir(parents=True, exist_ok=True)
 
-    integrator = CrossDomainIntegrator(str(vault_path))
+    integrator = CrossDomainIntegrator(vault_path)
 
     # Create some sample files that demonstrate cross-domain overlap
     print("Creating sample cross-domain files...")
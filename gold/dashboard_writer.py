@@ -0,0 +1,253 @@
+"""
+Dashboard Writer for AI Employee
+
+This module buffers Dashboard.md updates in memory and writes them once per
+orchestrator cycle.
+
+Activity entries, System Status lines and Quick Stats counters are collected
+while files are processed; flush() then reads the dashboard once, merges the
+changes and swaps the result in with a single atomic replace. Recent Activity
+is kept to a fixed number of entries so the file stops growing with every
+processed action.
+"""
+import os
+import sys
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+ACTIVITY_SECTION = "## Recent Activity"
+STATUS_SECTION = "## System Status"
+STATS_SECTION = "## Quick Stats"
+
+# Number of Recent Activity entries kept when neither the constructor nor the
+# DASHBOARD_MAX_ACTIVITY environment variable says otherwise
+DEFAULT_MAX_RECENT_ACTIVITY = 50
+
+DEFAULT_DASHBOARD = f"""# AI Employee Dashboard
+
+## Executive Summary
+This dashboard provides an overview of your AI Employee's activities and status.
+
+{ACTIVITY_SECTION}
+
+{STATUS_SECTION}
+
+{STATS_SECTION}
+- Files Processed: 0
+- Actions Taken: 0
+- Approval Requests: 0
+"""
+
+
+def _split_sections(content: str) -> List[Tuple[Optional[str], List[str]]]:
+    """Split markdown into (heading, body lines) pairs; the preamble has heading None."""
+    sections: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+    for line in content.splitlines():
+        if line.startswith("## "):
+            sections.append((line.rstrip(), []))
+        else:
+            sections[-1][1].append(line)
+    return sections
+
+
+def _split_item(line: str) -> Tuple[str, str]:
+    """Split a '- Key: value' line into (key, value)."""
+    key, _, value = line[2:].partition(':')
+    return key.strip(), value.strip()
+
+
+class DashboardWriter:
+    """Collects dashboard changes in memory and writes them in one atomic replace"""
+
+    def __init__(self, vault_path: str, max_recent_activity: Optional[int] = None):
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.dashboard_path = self.vault_path / "Dashboard.md"
+
+        if max_recent_activity is None:
+            max_recent_activity = int(os.environ.get("DASHBOARD_MAX_ACTIVITY", DEFAULT_MAX_RECENT_ACTIVITY))
+        self.max_recent_activity = max(1, max_recent_activity)
+
+        # Pending changes since the last flush
+        self._activity: Deque[str] = deque(maxlen=self.max_recent_activity)
+        self._status: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._stats: Dict[str, int] = {}
+
+    def add_activity(self, description: str, done: bool = True, timestamp: Optional[datetime] = None):
+        """
+        Queue a Recent Activity entry.
+
+        Args:
+            description: Activity text, e.g. "Processed ACTION_x.md"
+            done: Whether the entry is rendered as a checked item
+            timestamp: Time shown on the entry (defaults to now)
+        """
+        timestamp = timestamp or datetime.now()
+        mark = 'x' if done else ' '
+        self._activity.append(f"- [{mark}] {timestamp.strftime('%Y-%m-%d %H:%M')} - {description}")
+
+    def set_status(self, key: str, value: str, only_if: Optional[str] = None):
+        """
+        Queue a System Status line update ("- key: value").
+
+        Args:
+            key: Status name, e.g. "Last Update"
+            value: New value
+            only_if: Only replace the line when its current value equals this
+        """
+        self._status[key] = (value, only_if)
+
+    def increment(self, stat: str, amount: int = 1):
+        """
+        Queue an increment of a Quick Stats counter.
+
+        Args:
+            stat: Counter name, e.g. "Files Processed"
+            amount: Amount to add
+        """
+        self._stats[stat] = self._stats.get(stat, 0) + amount
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self._activity or self._status or self._stats)
+
+    def _merge_activity(self, lines: List[str]) -> List[str]:
+        entries = [line for line in lines if line.startswith("- ")]
+        other = [line for line in lines if not line.startswith("- ") and line.strip()]
+
+        # Oldest first into the ring so the newest entries survive the cap
+        ring: Deque[str] = deque(reversed(entries), maxlen=self.max_recent_activity)
+        seen = set(entries)
+        for entry in self._activity:
+            if entry not in seen:
+                ring.append(entry)
+                seen.add(entry)
+        return other + list(reversed(ring)) + ['']
+
+    def _merge_status(self, lines: List[str]) -> List[str]:
+        merged = []
+        seen = set()
+        for line in lines:
+            if not line.startswith("- "):
+                if line.strip():
+                    merged.append(line)
+                continue
+            key, current = _split_item(line)
+            if key in seen:
+                continue  # Drop duplicated status lines left by earlier runs
+            seen.add(key)
+            if key in self._status:
+                value, only_if = self._status[key]
+                if only_if is None or current == only_if:
+                    line = f"- {key}: {value}"
+            merged.append(line)
+        for key, (value, only_if) in self._status.items():
+            if key not in seen and only_if is None:
+                merged.append(f"- {key}: {value}")
+        return merged + ['']
+
+    def _merge_stats(self, lines: List[str]) -> List[str]:
+        merged = []
+        seen = set()
+        for line in lines:
+            if line.startswith("- "):
+                key, current = _split_item(line)
+                if key in self._stats:
+                    try:
+                        line = f"- {key}: {int(current) + self._stats[key]}"
+                    except ValueError:
+                        line = f"- {key}: {self._stats[key]}"
+                seen.add(key)
+            if line.strip():
+                merged.append(line)
+        for key, amount in self._stats.items():
+            if key not in seen:
+                merged.append(f"- {key}: {amount}")
+        return merged + ['']
+
+    def render(self, content: str) -> str:
+        """
+        Apply the pending changes to dashboard content.
+
+        Args:
+            content: Current Dashboard.md content
+
+        Returns:
+            Updated content
+        """
+        sections = _split_sections(content)
+        headings = [heading for heading, _ in sections]
+        for heading in (ACTIVITY_SECTION, STATUS_SECTION, STATS_SECTION):
+            if heading not in headings:
+                sections.append((heading, []))
+
+        mergers = {
+            ACTIVITY_SECTION: self._merge_activity,
+            STATUS_SECTION: self._merge_status,
+            STATS_SECTION: self._merge_stats,
+        }
+
+        out = []
+        for heading, lines in sections:
+            if heading is not None:
+                out.append(heading)
+            merge = mergers.get(heading)
+            out.extend(merge(lines) if merge else lines)
+
+        while out and not out[-1].strip():
+            out.pop()
+        return '\n'.join(out) + '\n'
+
+    def flush(self) -> bool:
+        """
+        Write pending changes to Dashboard.md with one read and one atomic replace.
+
+        Returns:
+            True if the dashboard was written, False if there was nothing to write
+        """
+        if not self.has_changes:
+            return False
+
+        try:
+            content = self.dashboard_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            content = DEFAULT_DASHBOARD
+
+        updated = self.render(content)
+
+        self.vault_path.mkdir(parents=True, exist_ok=True)
+        with self.fs.atomic_write(self.dashboard_path, encoding='utf-8') as f:
+            f.write(updated)
+
+        logger.info(f"Updated Dashboard.md ({len(self._activity)} new activity entries)")
+        self._activity.clear()
+        self._status.clear()
+        self._stats.clear()
+        return True
+
+
+def main():
+    """Main function to demonstrate the dashboard writer."""
+    dashboard = DashboardWriter(get_vault_fs().root)
+    dashboard.add_activity("Dashboard writer check")
+    dashboard.set_status("Last Update", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    dashboard.flush()
+    print(f"Dashboard updated: {dashboard.dashboard_path}")
+
+
+if __name__ == "__main__":
+    main()
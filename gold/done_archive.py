@@ -0,0 +1,336 @@
+"""
+Done Archive for AI Employee
+
+This module stores completed files under date-partitioned folders
+(Done/YYYY/MM/DD/) instead of one flat Done/ directory, and keeps an
+append-only lookup index (Done/.done_index.jsonl) so that completion checks
+never have to list the archive.
+
+Each index line records one archived file:
+
+    {"name": "ACTION_..._invoice.md", "path": "2026/02/19/ACTION_..._invoice.md", "archived": "..."}
+
+Besides exact names, every run of consecutive name tokens (split on '_', '-',
+'.' and spaces) is indexed, so "was any file for task X completed" is a single
+dictionary lookup as long as X lines up with token boundaries, e.g.
+"test_autonomous" for "test_autonomous_task.md".
+
+Action files are archived together with their attachments: the watcher
+records the attachment's name in the action file's `original_file:`
+frontmatter field, so no probing for `.original.*` variants is needed.
+
+Run this module directly to migrate an existing flat Done/ folder.
+"""
+import os
+import re
+import sys
+import json
+import glob
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from frontmatter import read_frontmatter, update_frontmatter_field
+from vault_fs import get_vault_fs, to_vault_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".done_index.jsonl"
+
+# Frontmatter field naming an action file's attachment (relative to the action file)
+ATTACHMENT_FIELD = "original_file"
+
+# Token runs longer than this are not indexed (keeps names with many parts cheap)
+MAX_RUN_TOKENS = 8
+
+_TOKEN_SPLIT = re.compile(r'[_\-.\s]+')
+_PARTITION = re.compile(r'^\d{4}/\d{2}/\d{2}$')
+
+
+def _tokens(name: str) -> List[str]:
+    return [token for token in _TOKEN_SPLIT.split(name.lower()) if token]
+
+
+def _token_runs(name: str) -> List[str]:
+    """All runs of consecutive tokens of a file name, normalised to '_'-joined form."""
+    tokens = _tokens(name)
+    runs = []
+    for start in range(len(tokens)):
+        for end in range(start + 1, min(len(tokens), start + MAX_RUN_TOKENS) + 1):
+            runs.append('_'.join(tokens[start:end]))
+    return runs
+
+
+def find_attachments(action_file: Path) -> List[Path]:
+    """
+    Find the attachments that belong to an action file.
+
+    The attachment is taken from the `original_file:` frontmatter field. Action
+    files written before that field existed fall back to a single glob for
+    `<stem>.original.*` next to the action file.
+
+    Args:
+        action_file: Action file in Needs_Action
+
+    Returns:
+        Attachment paths that exist in the vault
+    """
+    action_file = to_vault_path(action_file)
+    meta = read_frontmatter(action_file)
+
+    name = meta.get(ATTACHMENT_FIELD)
+    if name:
+        attachment = action_file.parent / name
+        try:
+            size = attachment.stat().st_size
+        except FileNotFoundError:
+            logger.warning(f"Attachment {name} of {action_file.name} is missing")
+            return []
+        expected = meta.get('original_size')
+        if expected.isdigit() and int(expected) != size:
+            logger.warning(f"Attachment {name} is {size} bytes, expected {expected}")
+        return [attachment]
+
+    if meta.type == 'file_drop':
+        return sorted(action_file.parent.glob(f"{glob.escape(action_file.stem)}.original.*"))
+    return []
+
+
+class DoneArchive:
+    """Date-partitioned Done folder with an append-only name index"""
+
+    def __init__(self, vault_path: str):
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.done = self.vault_path / "Done"
+        self.index_path = self.done / INDEX_FILENAME
+        self._lock = threading.Lock()
+
+        # name -> path relative to Done/, and token run -> number of archived names
+        self._names: Dict[str, str] = {}
+        self._runs: Dict[str, int] = {}
+        self._offset = 0
+
+        self.done.mkdir(parents=True, exist_ok=True)
+
+    def _add_entry(self, name: str, rel_path: str):
+        if name not in self._names:
+            for run in set(_token_runs(name)):
+                self._runs[run] = self._runs.get(run, 0) + 1
+        self._names[name] = rel_path
+
+    def _refresh(self):
+        """Load index lines appended since the last read (including by other processes)."""
+        try:
+            size = self.index_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size <= self._offset:
+            return
+
+        with self.index_path.open('rb') as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+
+        # Only consume complete lines; a partial last line is read next time
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+                self._add_entry(entry["name"], entry["path"])
+            except (ValueError, KeyError):
+                logger.warning(f"Skipping malformed line in {self.index_path.name}")
+        self._offset += end
+
+    def _append_entry(self, name: str, rel_path: str):
+        line = json.dumps({
+            "name": name,
+            "path": rel_path,
+            "archived": datetime.now().isoformat()
+        }) + "\n"
+        # One appending write per line, so concurrent writers do not interleave
+        self.fs.append_bytes(self.index_path, line.encode('utf-8'))
+        self._add_entry(name, rel_path)
+
+    def partition_for(self, when: Optional[datetime] = None) -> Path:
+        """Return (and create) the Done/YYYY/MM/DD folder for a date."""
+        when = when or datetime.now()
+        partition = self.done / when.strftime('%Y') / when.strftime('%m') / when.strftime('%d')
+        partition.mkdir(parents=True, exist_ok=True)
+        return partition
+
+    def archive(self, file_path: Path, when: Optional[datetime] = None) -> Path:
+        """
+        Move a file into the archive and record it in the index.
+
+        Names stay unique across the whole archive; if the name was archived
+        before, a timestamp suffix is added.
+
+        Args:
+            file_path: File to archive
+            when: Completion time used for the partition (defaults to now)
+
+        Returns:
+            Path of the archived file
+        """
+        file_path = self.vault_path.with_segments(file_path)
+        partition = self.partition_for(when)
+
+        with self._lock:
+            self._refresh()
+            name = file_path.name
+            while True:
+                if name not in self._names and self.fs.rename_no_clobber(file_path, partition / name):
+                    break
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+                name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
+
+            rel_path = (partition / name).relative_to(self.done).as_posix()
+            self._append_entry(name, rel_path)
+
+        logger.info(f"Archived {file_path.name} to Done/{rel_path}")
+        return partition / name
+
+    def archive_action(self, action_file: Path, when: Optional[datetime] = None) -> Tuple[Path, Dict[Path, Path]]:
+        """
+        Archive an action file together with its attachments.
+
+        Both land in the same date partition. If an attachment has to be renamed
+        to stay unique, the archived action file's `original_file:` field is
+        updated so the link is kept.
+
+        Args:
+            action_file: Action file to archive
+            when: Completion time used for the partition (defaults to now)
+
+        Returns:
+            (archived action file, mapping of attachment -> archived attachment)
+        """
+        when = when or datetime.now()
+        attachments = find_attachments(action_file)
+
+        done_file = self.archive(action_file, when)
+        archived = {}
+        for attachment in attachments:
+            archived_attachment = self.archive(attachment, when)
+            if archived_attachment.name != attachment.name:
+                update_frontmatter_field(done_file, ATTACHMENT_FIELD, archived_attachment.name)
+            archived[attachment] = archived_attachment
+
+        return done_file, archived
+
+    def locate(self, name: str) -> Optional[Path]:
+        """
+        Find an archived file by its exact name.
+
+        Args:
+            name: File name as archived
+
+        Returns:
+            Path of the archived file, or None if it is not in the archive
+        """
+        with self._lock:
+            self._refresh()
+            rel_path = self._names.get(name)
+        return self.done / rel_path if rel_path else None
+
+    def is_done(self, task_identifier: str) -> bool:
+        """
+        Check whether any archived file name contains the task identifier.
+
+        The identifier is matched on token boundaries: "test_autonomous" matches
+        "test_autonomous_task.md" but "autonom" does not.
+
+        Args:
+            task_identifier: Task id or file name fragment
+
+        Returns:
+            True if a matching file has been archived
+        """
+        key = '_'.join(_tokens(task_identifier))
+        if not key:
+            return False
+        with self._lock:
+            self._refresh()
+            return key in self._names or self._runs.get(key, 0) > 0
+
+    def count(self) -> int:
+        """Number of files recorded in the archive."""
+        with self._lock:
+            self._refresh()
+            return len(self._names)
+
+    def migrate_flat_done(self) -> int:
+        """
+        Move files sitting directly in Done/ into date partitions.
+
+        Files are partitioned by their modification time, which is when they
+        were moved to Done/ by the tiers.
+
+        Returns:
+            Number of files migrated
+        """
+        migrated = 0
+        flat_files = [entry for entry in self.fs.scandir(self.done)
+                      if entry.is_file(follow_symlinks=False) and not entry.name.startswith('.')]
+
+        for entry in flat_files:
+            when = datetime.fromtimestamp(entry.stat(follow_symlinks=False).st_mtime)
+            self.archive(self.done / entry.name, when)
+            migrated += 1
+
+        logger.info(f"Migrated {migrated} files from flat Done/ into date partitions")
+        return migrated
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the index from the partition folders on disk.
+
+        Returns:
+            Number of files indexed
+        """
+        with self._lock:
+            entries = []
+            for root, dirs, files in self.fs.walk(self.done):
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+                rel_root = root.relative_to(self.done).as_posix()
+                if not _PARTITION.match(rel_root):
+                    continue
+                for name in files:
+                    if not name.startswith('.'):
+                        entries.append({"name": name, "path": f"{rel_root}/{name}",
+                                        "archived": datetime.now().isoformat()})
+
+            with self.fs.atomic_write(self.index_path, encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+
+            self._names.clear()
+            self._runs.clear()
+            self._offset = 0
+            self._refresh()
+
+        logger.info(f"Rebuilt Done index with {len(entries)} files")
+        return len(entries)
+
+
+def main():
+    """Migrate a flat Done/ folder into date partitions."""
+    archive = DoneArchive(sys.argv[1] if len(sys.argv) > 1 else get_vault_fs().root)
+
+    migrated = archive.migrate_flat_done()
+    print(f"Migrated {migrated} files; {archive.count()} files in the Done archive")
+
+
+if __name__ == "__main__":
+    main()
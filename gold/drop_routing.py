@@ -0,0 +1,247 @@
+"""
+Drop Routing for AI Employee
+
+This module decides what a dropped file is and where it goes. A declarative
+routing table (drop_routes.json next to this module by default) maps:
+
+- magic bytes in the first 4 KB and the file extension to a kind
+  ("pdf", "docx", "png", ...),
+- each kind to an action type, priority and target handler,
+- size tiers (e.g. empty files, files over 100 MB) to overrides of those fields.
+
+The table's "folders" section holds policies for Inbox subfolders (e.g.
+Inbox/Invoices); they are resolved by folder_policy.py, together with the
+policy files in the subfolders themselves.
+
+Content wins over the extension: a .pdf that starts with a PNG header is
+routed as an image. Container formats are the exception; a ZIP header with
+a .docx extension is a docx, an OLE header with a .xls extension an xls. So
+are text kinds (marked "text" in the table): a .csv whose header is text
+stays a csv even if it starts with a signature, as "BMI,age" starts with the
+BMP one. Short printable signatures ("BM", "ID3") only count in headers that
+are not text. Files without a known signature or extension that decode as
+UTF-8 are text.
+
+The table is compiled once into dictionaries and byte tries, so routing a
+file costs a few dictionary lookups and at most one walk down the trie per
+signature offset, however many kinds the table lists.
+"""
+import os
+import sys
+import json
+import bisect
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, to_vault_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "drop_routes.json")
+
+# Bytes read from the start of a file for sniffing
+SNIFF_BYTES = 4096
+
+ROUTE_FIELDS = ("action_type", "priority", "handler")
+
+# Trie node key marking the end of a signature
+_KIND = None
+
+# Printable signatures shorter than this are ignored in text headers
+WEAK_SIGNATURE_BYTES = 4
+
+
+class Route(NamedTuple):
+    """Where a dropped file goes"""
+    kind: str
+    action_type: str
+    priority: str
+    handler: str
+
+
+def _overrides(entry: Dict[str, Any]) -> Dict[str, str]:
+    return {field: entry[field] for field in ROUTE_FIELDS if field in entry}
+
+
+def _is_text(header: bytes) -> bool:
+    """Whether a file's first bytes look like UTF-8 text."""
+    if not header or b'\0' in header:
+        return False
+    try:
+        header.decode('utf-8')
+        return True
+    except UnicodeDecodeError as e:
+        # A multi-byte character may be cut off at the end of the header
+        return e.start >= len(header) - 3
+
+
+def _is_weak(signature: bytes) -> bool:
+    """Short signatures of printable characters also start ordinary text."""
+    return len(signature) < WEAK_SIGNATURE_BYTES and all(0x20 < byte < 0x7f for byte in signature)
+
+
+class RoutingTable:
+    """Compiled routing table for dropped files"""
+
+    def __init__(self, table: Dict[str, Any]):
+        """
+        Args:
+            table: Parsed routing table (see drop_routes.json for the format)
+
+        Raises:
+            ValueError: If the table refers to kinds it does not define
+        """
+        default = table.get("default", {})
+        missing = [field for field in ROUTE_FIELDS if field not in default]
+        if missing:
+            raise ValueError(f"Routing table default is missing {', '.join(missing)}")
+
+        self._default = Route("unknown", default["action_type"], default["priority"], default["handler"])
+        self._routes: Dict[str, Route] = {}
+        self._containers: Dict[str, str] = {}
+        self._text_kinds = set()
+        for kind, entry in table.get("kinds", {}).items():
+            self._routes[kind] = self._default._replace(kind=kind, **_overrides(entry))
+            if "container" in entry:
+                self._containers[kind] = entry["container"]
+            if entry.get("text"):
+                self._text_kinds.add(kind)
+
+        self._extensions: Dict[str, str] = {ext.lower(): kind for ext, kind in table.get("extensions", {}).items()}
+
+        # offset -> byte trie of the signatures at that offset; a signature
+        # ends in (kind, weak)
+        self._tries: Dict[int, Dict] = {}
+        for signature in table.get("magic", []):
+            node = self._tries.setdefault(signature.get("offset", 0), {})
+            signature_bytes = bytes.fromhex(signature["hex"])
+            for byte in signature_bytes:
+                node = node.setdefault(byte, {})
+            node[_KIND] = (signature["kind"], _is_weak(signature_bytes))
+
+        # Size tiers sorted by lower bound, searched with bisect
+        tiers = sorted(table.get("size_tiers", []), key=lambda tier: tier["min_bytes"])
+        self._tier_bounds: List[int] = [tier["min_bytes"] for tier in tiers]
+        self._tier_overrides: List[Dict[str, str]] = [_overrides(tier) for tier in tiers]
+
+        # Subfolder -> policy, for FolderPolicies
+        self.folders: Dict[str, Dict[str, Any]] = table.get("folders", {})
+
+        referenced = set(self._extensions.values()) | set(self._containers.values())
+        referenced |= {signature["kind"] for signature in table.get("magic", [])}
+        unknown = sorted(referenced - set(self._routes))
+        if unknown:
+            raise ValueError(f"Routing table refers to undefined kinds: {', '.join(unknown)}")
+
+    @classmethod
+    def from_file(cls, path: Optional[PathLike] = None) -> 'RoutingTable':
+        """Load and compile a routing table from a JSON file (the bundled one by default)."""
+        path = path or DEFAULT_ROUTES_PATH
+        with open(path, encoding='utf-8') as f:
+            table = cls(json.load(f))
+        logger.info(f"Loaded drop routing table from {path}: {len(table._routes)} kinds")
+        return table
+
+    def _magic_kind(self, header: bytes, text: bool = False) -> Optional[str]:
+        """Kind of the longest signature that matches the header (skipping weak ones in text)."""
+        best_kind, best_length = None, 0
+        for offset, node in self._tries.items():
+            length = 0
+            for byte in header[offset:]:
+                node = node.get(byte)
+                if node is None:
+                    break
+                length += 1
+                if _KIND in node and length > best_length:
+                    kind, weak = node[_KIND]
+                    if not (weak and text):
+                        best_kind, best_length = kind, length
+        return best_kind
+
+    def _extension_kind(self, name: str) -> Optional[str]:
+        lowered = name.lower()
+        base, ext = os.path.splitext(lowered)
+        # Double extensions such as .tar.gz take precedence
+        double = os.path.splitext(base)[1] + ext
+        return self._extensions.get(double) or self._extensions.get(ext)
+
+    def sniff(self, name: str, header: bytes) -> str:
+        """
+        Determine the kind of a file from its name and first bytes.
+
+        Args:
+            name: File name (for the extension)
+            header: First bytes of the file (SNIFF_BYTES is enough)
+
+        Returns:
+            Kind from the routing table, or "unknown"
+        """
+        text = _is_text(header)
+        magic_kind = self._magic_kind(header, text)
+        ext_kind = self._extension_kind(name)
+
+        if magic_kind and ext_kind and self._containers.get(ext_kind) == magic_kind:
+            return ext_kind
+        if text and ext_kind in self._text_kinds:
+            return ext_kind
+        if magic_kind:
+            if ext_kind and ext_kind != magic_kind:
+                logger.info(f"{name} looks like {magic_kind}, not {ext_kind}; routing by content")
+            return magic_kind
+        if ext_kind:
+            return ext_kind
+        if text and "text" in self._routes:
+            return "text"
+        return "unknown"
+
+    def route(self, name: str, header: bytes, size: int) -> Route:
+        """
+        Route a file.
+
+        Args:
+            name: File name
+            header: First bytes of the file
+            size: File size in bytes
+
+        Returns:
+            Route with kind, action type, priority and handler
+        """
+        kind = self.sniff(name, header)
+        route = self._routes.get(kind, self._default)
+
+        tier = bisect.bisect_right(self._tier_bounds, size) - 1
+        if tier >= 0 and self._tier_overrides[tier]:
+            route = route._replace(**self._tier_overrides[tier])
+        return route
+
+    def route_file(self, path: PathLike, name: Optional[str] = None) -> Route:
+        """
+        Route a file on the vault's backend, reading only its first SNIFF_BYTES.
+
+        Args:
+            path: File to route
+            name: Name to take the extension from (defaults to the file's own)
+        """
+        path = to_vault_path(path)
+        with path.open('rb') as f:
+            header = f.read(SNIFF_BYTES)
+        return self.route(name or path.name, header, path.stat().st_size)
+
+
+def main():
+    """Route the files given on the command line."""
+    table = RoutingTable.from_file()
+    for file_path in sys.argv[1:]:
+        print(f"{file_path}: {table.route_file(file_path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,9 @@ from contextlib import contextmanager
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from vault_fs import get_vault_fs
+from action_ids import create_new_file, new_id
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,7 +31,9 @@ class ErrorRecoveryManager:
     """Manages error recovery and graceful degradation for the AI Employee"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.writer = self.fs
         self.logs_dir = self.vault_path / "Logs"
         self.backup_dir = self.vault_path / "Backups"
         self.failed_actions_dir = self.vault_path / "Failed_Actions"
@@ -55,7 +60,7 @@ class ErrorRecoveryManager:
         Returns:
             Error ID for tracking
         """
-        error_id = f"error_{int(time.time() * 1000000)}"
+        error_id = f"error_{new_id()}"
         error_info = {
             "error_id": error_id,
             "timestamp": datetime.now().isoformat(),
@@ -68,8 +73,7 @@ class ErrorRecoveryManager:
         }
 
         # Write to error log file
-        with open(self.error_log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(error_info) + '\n')
+        self.fs.append_bytes(self.error_log_file, (json.dumps(error_info) + '\n').encode('utf-8'))
 
         logger.error(f"Error {error_id} ({severity}): {context} - {str(error)}")
 
@@ -149,15 +153,14 @@ class ErrorRecoveryManager:
             return None
 
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_filename = f"{file_path.stem}_backup_{timestamp}{file_path.suffix}"
+            backup_filename = f"{file_path.stem}_backup_{new_id()}{file_path.suffix}"
             backup_path = self.backup_dir / backup_filename
 
             # Read the file content
             content = file_path.read_text(encoding='utf-8')
 
             # Write to backup
-            backup_path.write_text(content, encoding='utf-8')
+            create_new_file(backup_path, content)
 
             logger.info(f"Backup created: {file_path.name} -> {backup_path.name}")
             return backup_path
@@ -206,9 +209,8 @@ class ErrorRecoveryManager:
         Returns:
             Path to the saved failed action file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         action_id = action_data.get('id', action_data.get('action_id', 'unknown'))
-        failed_filename = f"FAILED_{action_id}_{timestamp}.json"
+        failed_filename = f"FAILED_{action_id}_{new_id()}.json"
         failed_path = self.failed_actions_dir / failed_filename
 
         failed_action_data = {
@@ -219,8 +221,8 @@ class ErrorRecoveryManager:
             "status": "failed"
         }
 
-        with open(failed_path, 'w', encoding='utf-8') as f:
-            json.dump(failed_action_data, f, indent=2, ensure_ascii=False)
+        self.writer.write_text(failed_path, json.dumps(failed_action_data, indent=2, ensure_ascii=False),
+                               encoding='utf-8')
 
         logger.info(f"Saved failed action: {failed_filename}")
         return failed_path
@@ -232,7 +234,7 @@ class ErrorRecoveryManager:
         Returns:
             Dictionary with processing results
         """
-        failed_files = list(self.failed_actions_dir.glob("FAILED_*.json"))
+        failed_files = self.writer.glob(self.failed_actions_dir, "FAILED_*.json")
 
         results = {
             "attempted": 0,
@@ -242,8 +244,7 @@ class ErrorRecoveryManager:
 
         for failed_file in failed_files:
             try:
-                with open(failed_file, 'r', encoding='utf-8') as f:
-                    failed_data = json.load(f)
+                failed_data = json.loads(self.writer.read_text(failed_file, encoding='utf-8'))
 
                 if failed_data['retry_count'] >= self.max_recovery_attempts:
                     logger.info(f"Max retries reached for {failed_file.name}, moving to permanently failed")
@@ -268,7 +269,7 @@ class ErrorRecoveryManager:
                     )
 
                     # If successful, remove the failed action file
-                    failed_file.unlink()
+                    self.writer.unlink(failed_file)
                     results["recovered"] += 1
                     logger.info(f"Successfully recovered {failed_file.name}")
                 except Exception:
@@ -277,8 +278,7 @@ class ErrorRecoveryManager:
                     failed_data["last_retry"] = datetime.now().isoformat()
                     failed_data["status"] = "retry_failed"
 
-                    with open(failed_file, 'w') as f:
-                        json.dump(failed_data, f, indent=2, ensure_ascii=False)
+                    self.writer.write_text(failed_file, json.dumps(failed_data, indent=2, ensure_ascii=False))
 
             except Exception as e:
                 error_id = self.log_error(e, f"Processing failed action {failed_file.name}", "high")
@@ -301,7 +301,7 @@ class ErrorRecoveryManager:
             "vault_accessible": self.vault_path.exists(),
             "logs_writable": self.logs_dir.exists(),
             "backup_space_available": self._check_disk_space(self.backup_dir),
-            "failed_actions_count": len(list(self.failed_actions_dir.glob("FAILED_*.json"))),
+            "failed_actions_count": len(self.writer.glob(self.failed_actions_dir, "FAILED_*.json")),
             "recent_errors_count": self._count_recent_errors(hours=24),
             "system_uptime": self._get_system_uptime()
         }
@@ -325,8 +325,7 @@ class ErrorRecoveryManager:
     def _check_disk_space(self, path: Path) -> float:
         """Check available disk space in MB."""
         try:
-            import shutil
-            total, used, free = shutil.disk_usage(path)
+            total, used, free = self.fs.disk_usage(path)
             return free / (1024 * 1024)  # Convert to MB
         except:
             return 0
@@ -337,7 +336,7 @@ class ErrorRecoveryManager:
         count = 0
 
         try:
-            with open(self.error_log_file, 'r', encoding='utf-8') as f:
+            with self.error_log_file.open('r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
                         try:
@@ -375,12 +374,12 @@ def error_handling_context(recovery_manager: ErrorRecoveryManager, context: str
 
 def main():
     """Main function to demonstrate error recovery and graceful degradation"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
 
-    recovery_manager = ErrorRecoveryManager(str(vault_path))
+    recovery_manager = ErrorRecoveryManager(vault_path)
 
     print("Testing graceful degradation...")
 
@@ -0,0 +1,474 @@
+"""
+Content Extraction for AI Employee
+
+This module pulls a summary out of dropped documents and data files, so the
+action file already says what is in the attachment:
+
+- PDF: page count and a text excerpt (text needs the optional pypdf package)
+- DOCX: paragraph and word counts and a text excerpt
+- CSV: header, row count and min/max/mean of numeric columns, streamed
+- XLSX: sheet names and their dimensions (A1:F1200)
+
+Extraction runs in a pool of worker processes. Each process has its address
+space capped (RLIMIT_AS) and every job a time limit (SIGALRM in the worker,
+plus a grace period in the caller), so a huge or malicious spreadsheet fails
+its own job instead of stalling or exhausting the watcher. Workers report
+when they pick a job up and the limit counts from there, so jobs queued
+behind slow ones are not cut short. A job that hangs past its grace period
+has its worker killed and the pool replaced; the other jobs that were on the
+pool are submitted again to the new one.
+
+Results are cached by content hash in .extract_cache/<sha256>.json at the
+vault root; the same content is never extracted twice. Only results of jobs
+that ran to a verdict are cached, not those of jobs lost with a pool.
+"""
+import os
+import re
+import csv
+import sys
+import json
+import time
+import queue
+import signal
+import zipfile
+import logging
+import itertools
+import threading
+import multiprocessing
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from xml.etree import ElementTree
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = ".extract_cache"
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 30
+DEFAULT_MEMORY_MB = 512
+
+# Extra seconds the caller waits beyond a job's own time limit
+TIMEOUT_GRACE = 5
+
+# Seconds between the caller's checks on a job that has not finished
+POLL_SECONDS = 0.5
+
+# Times a job is submitted again after the pool broke under it
+POOL_RETRIES = 1
+
+# Characters of text kept as an excerpt
+EXCERPT_CHARS = 600
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_PDF_PAGE = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+
+
+def _excerpt(text: str) -> str:
+    text = ' '.join(text.split())
+    return text if len(text) <= EXCERPT_CHARS else text[:EXCERPT_CHARS].rstrip() + '...'
+
+
+def extract_pdf(path: str) -> Dict[str, Any]:
+    """Page count and text excerpt of a PDF."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        # Without pypdf only the page objects can be counted
+        pages = 0
+        with open(path, 'rb') as f:
+            tail = b''
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                data = tail + chunk
+                # Matches near the end are counted with the next chunk
+                cut = max(0, len(data) - 64)
+                pages += sum(1 for match in _PDF_PAGE.finditer(data) if match.start() < cut)
+                tail = data[cut:]
+            pages += len(_PDF_PAGE.findall(tail))
+        return {"pages": pages, "note": "install pypdf for text extraction"}
+
+    reader = PdfReader(path)
+    text = []
+    length = 0
+    for page in reader.pages:
+        if length >= EXCERPT_CHARS:
+            break
+        page_text = page.extract_text() or ''
+        text.append(page_text)
+        length += len(page_text)
+    return {"pages": len(reader.pages), "excerpt": _excerpt(' '.join(text))}
+
+
+def extract_docx(path: str) -> Dict[str, Any]:
+    """Paragraph and word counts and text excerpt of a DOCX document."""
+    paragraphs = words = 0
+    excerpt: List[str] = []
+    excerpt_length = 0
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as xml:
+        for _, element in ElementTree.iterparse(xml):
+            if element.tag != _WORD_NS + 'p':
+                continue
+            text = ''.join(node.text or '' for node in element.iter(_WORD_NS + 't'))
+            element.clear()
+            if not text.strip():
+                continue
+            paragraphs += 1
+            words += len(text.split())
+            if excerpt_length < EXCERPT_CHARS:
+                excerpt.append(text)
+                excerpt_length += len(text)
+    return {"paragraphs": paragraphs, "words": words, "excerpt": _excerpt(' '.join(excerpt))}
+
+
+def extract_csv(path: str) -> Dict[str, Any]:
+    """Header, row count and numeric column statistics of a CSV file, streamed."""
+    with open(path, newline='', encoding='utf-8', errors='replace') as f:
+        sample = f.read(64 * 1024)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(f, dialect)
+        header = next(reader, [])
+
+        rows = 0
+        numeric: Dict[int, List[float]] = {i: [0, float('inf'), float('-inf'), 0.0] for i in range(len(header))}
+        for row in reader:
+            rows += 1
+            for i in list(numeric):
+                if i >= len(row) or not row[i].strip():
+                    continue
+                try:
+                    value = float(row[i])
+                except ValueError:
+                    # One non-numeric value rules the column out
+                    del numeric[i]
+                    continue
+                stats = numeric[i]
+                stats[0] += 1
+                stats[1] = min(stats[1], value)
+                stats[2] = max(stats[2], value)
+                stats[3] += value
+
+    columns = {
+        header[i]: {"min": stats[1], "max": stats[2], "mean": round(stats[3] / stats[0], 4)}
+        for i, stats in numeric.items() if stats[0]
+    }
+    return {"rows": rows, "columns": len(header), "header": header, "numeric_columns": columns}
+
+
+def extract_xlsx(path: str) -> Dict[str, Any]:
+    """Sheet names and dimensions of an XLSX workbook."""
+    with zipfile.ZipFile(path) as archive:
+        workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        rels = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(_PKG_REL_NS + 'Relationship')}
+
+        sheets = []
+        for sheet in workbook.iter(_SHEET_NS + 'sheet'):
+            target = targets.get(sheet.get(_REL_NS + 'id'), '')
+            member = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+            dimension = None
+            try:
+                with archive.open(member) as xml:
+                    # <dimension> comes before the cell data; stop as soon as it is seen
+                    for _, element in ElementTree.iterparse(xml, events=('start',)):
+                        if element.tag == _SHEET_NS + 'dimension':
+                            dimension = element.get('ref')
+                            break
+                        if element.tag == _SHEET_NS + 'sheetData':
+                            break
+            except KeyError:
+                pass
+            sheets.append({"name": sheet.get('name'), "dimension": dimension})
+    return {"sheets": sheets}
+
+
+# Content kind (see drop_routes.json) -> extractor
+EXTRACTORS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "pdf": extract_pdf,
+    "docx": extract_docx,
+    "csv": extract_csv,
+    "xlsx": extract_xlsx,
+}
+
+
+def _limit_memory(memory_bytes: int):
+    """Process pool initializer: cap the worker's address space."""
+    try:
+        import resource
+    except ImportError:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        memory_bytes = min(memory_bytes, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, hard))
+
+
+# In worker processes: where jobs report that they started
+_started_queue = None
+
+
+def _init_worker(memory_bytes: int, started_queue):
+    """Process pool initializer: cap memory and keep the start-report queue."""
+    global _started_queue
+    _started_queue = started_queue
+    _limit_memory(memory_bytes)
+
+
+def _on_alarm(signum, frame):
+    raise TimeoutError("extraction time limit exceeded")
+
+
+def _run_job(job: int, kind: str, path: str, timeout: int) -> Dict[str, Any]:
+    """Run one extractor in a worker process under a time limit."""
+    if _started_queue is not None:
+        _started_queue.put((job, os.getpid(), time.time()))
+    has_alarm = hasattr(signal, 'SIGALRM')
+    if has_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.alarm(timeout)
+    try:
+        return {"status": "ok", **EXTRACTORS[kind](path)}
+    except TimeoutError:
+        return {"status": "timeout", "error": f"took longer than {timeout}s"}
+    except MemoryError:
+        return {"status": "too_large", "error": "memory limit exceeded"}
+    except Exception as e:
+        return {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    finally:
+        if has_alarm:
+            signal.alarm(0)
+
+
+class _WorkerPool:
+    """A process pool whose workers report when each job starts"""
+
+    def __init__(self, workers: int, memory_bytes: int):
+        # spawn: the watcher is multi-threaded, which fork does not mix with
+        context = multiprocessing.get_context('spawn')
+        self.started_queue = context.Queue()
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=context, initializer=_init_worker,
+            initargs=(memory_bytes, self.started_queue))
+        # Job -> (worker pid, start time), None until its worker reports
+        self._started: Dict[int, Optional[Tuple[int, float]]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, job: int, *args) -> concurrent.futures.Future:
+        with self._lock:
+            self._started[job] = None
+        return self.executor.submit(_run_job, job, *args)
+
+    def started(self, job: int) -> Optional[Tuple[int, float]]:
+        """The worker pid and start time of a job, or None while it is queued."""
+        with self._lock:
+            while True:
+                try:
+                    started_job, pid, when = self.started_queue.get_nowait()
+                except (queue.Empty, OSError, ValueError):
+                    break
+                # Reports of jobs nobody waits for any more are dropped
+                if started_job in self._started:
+                    self._started[started_job] = (pid, when)
+            return self._started.get(job)
+
+    def forget(self, job: int):
+        with self._lock:
+            self._started.pop(job, None)
+
+    def kill(self, pid: int):
+        """Kill a hung worker; the pool then breaks and stops its other workers."""
+        try:
+            os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def shutdown(self, wait: bool = False, cancel_futures: bool = False):
+        self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+class Extractor:
+    """Runs extraction jobs on a resource-limited process pool, cached by content hash"""
+
+    def __init__(self, vault_path: PathLike, workers: int = DEFAULT_WORKERS,
+                 timeout: int = DEFAULT_TIMEOUT, memory_mb: int = DEFAULT_MEMORY_MB):
+        """
+        Args:
+            vault_path: Vault whose .extract_cache holds the results
+            workers: Worker processes
+            timeout: Seconds a single job may run
+            memory_mb: Address space limit of each worker process
+        """
+        self.fs = get_vault_fs(vault_path)
+        self.cache_dir = self.fs.root / CACHE_DIRNAME
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_bytes = memory_mb * 1024 * 1024
+        self._workers: Optional[_WorkerPool] = None
+        self._jobs = itertools.count()
+        self._lock = threading.Lock()
+
+    def _pool(self) -> _WorkerPool:
+        with self._lock:
+            if self._workers is None:
+                self._workers = _WorkerPool(self.workers, self.memory_bytes)
+            return self._workers
+
+    def _discard_pool(self, pool: _WorkerPool):
+        with self._lock:
+            if self._workers is pool:
+                self._workers = None
+        # Jobs still on it fail with BrokenProcessPool and are submitted again
+        pool.shutdown()
+
+    def _wait(self, pool: _WorkerPool, job: int, future: concurrent.futures.Future,
+              name: str) -> Dict[str, Any]:
+        """Wait for a job, killing its worker once it overruns its time limit and grace."""
+        while True:
+            try:
+                return future.result(timeout=POLL_SECONDS)
+            except concurrent.futures.TimeoutError:
+                pass
+            started = pool.started(job)
+            if started is None:
+                # Still queued behind other jobs; its time has not started
+                continue
+            pid, begun = started
+            if time.time() > begun + self.timeout + TIMEOUT_GRACE and not future.done():
+                logger.warning(f"Extraction of {name} hung; killing worker {pid} and replacing the pool")
+                pool.kill(pid)
+                self._discard_pool(pool)
+                return {"status": "timeout", "error": f"took longer than {self.timeout}s"}
+
+    def extract(self, path: PathLike, kind: str, sha256: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract a summary of a file.
+
+        Args:
+            path: File to extract from
+            kind: Content kind from the drop routing table
+            sha256: Content hash (the cache key)
+
+        Returns:
+            Result with a "status" of ok, timeout, too_large or error, or None
+            if there is no extractor for this kind
+        """
+        if kind not in EXTRACTORS or not self.fs.is_local:
+            return None
+
+        cache_path = self.cache_dir / f"{sha256}.json"
+        try:
+            return json.loads(cache_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            pass
+
+        name = os.path.basename(path)
+        result = None
+        for _ in range(POOL_RETRIES + 1):
+            pool = self._pool()
+            job = next(self._jobs)
+            try:
+                future = pool.submit(job, kind, os.fspath(path), self.timeout)
+            except RuntimeError:
+                # Another thread broke or replaced the pool after handing it out
+                self._discard_pool(pool)
+                continue
+            try:
+                result = self._wait(pool, job, future, name)
+                break
+            except BrokenProcessPool:
+                # A worker died (or was killed for hanging on another job)
+                # before this job finished; it goes to a fresh pool
+                logger.warning(f"Extraction pool broke while {name} was on it; replacing the pool")
+                self._discard_pool(pool)
+            except concurrent.futures.CancelledError:
+                # Only shutdown() cancels jobs
+                result = {"status": "error", "error": "cancelled at shutdown"}
+                break
+            finally:
+                pool.forget(job)
+        if result is None:
+            result = {"status": "error", "error": "worker process died"}
+        result["kind"] = kind
+
+        if result["status"] != "error":
+            # Errors may be transient (a dead worker); everything else is a property of the content
+            self.cache_dir.mkdir(exist_ok=True)
+            with self.fs.atomic_write(cache_path, encoding='utf-8') as f:
+                json.dump(result, f)
+        return result
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        with self._lock:
+            pool, self._workers = self._workers, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def format_summary(result: Dict[str, Any]) -> str:
+    """
+    Render an extraction result as markdown for an action file.
+
+    Args:
+        result: Result from Extractor.extract()
+
+    Returns:
+        Markdown bullet list
+    """
+    if result["status"] != "ok":
+        return f"- **Extraction:** {result['status']} ({result.get('error', '')})\n"
+
+    lines = []
+    if "pages" in result:
+        lines.append(f"- **Pages:** {result['pages']}")
+    if "paragraphs" in result:
+        lines.append(f"- **Paragraphs:** {result['paragraphs']} ({result['words']} words)")
+    if "rows" in result:
+        lines.append(f"- **Rows:** {result['rows']} x {result['columns']} columns")
+        lines.append(f"- **Header:** {', '.join(result['header'])}")
+        for column, stats in result["numeric_columns"].items():
+            lines.append(f"- **{column}:** min {stats['min']:g}, max {stats['max']:g}, mean {stats['mean']:g}")
+    for sheet in result.get("sheets", []):
+        lines.append(f"- **Sheet {sheet['name']}:** {sheet['dimension'] or 'empty'}")
+    if result.get("excerpt"):
+        lines.append(f"- **Excerpt:** {result['excerpt']}")
+    if result.get("note"):
+        lines.append(f"- **Note:** {result['note']}")
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    """Extract summaries of the files given on the command line."""
+    import hashlib
+
+    extractor = Extractor(get_vault_fs().root)
+    try:
+        for file_path in sys.argv[1:]:
+            kind = os.path.splitext(file_path)[1].lower().lstrip('.')
+            with open(file_path, 'rb') as f:
+                sha256 = hashlib.file_digest(f, 'sha256').hexdigest()
+            result = extractor.extract(file_path, kind, sha256)
+            print(f"{file_path}:\n{format_summary(result) if result else '- no extractor'}")
+    finally:
+        extractor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
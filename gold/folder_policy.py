@@ -0,0 +1,186 @@
+"""
+Folder Policies for AI Employee
+
+This module decides how drops in Inbox subfolders are handled. A subfolder
+gets a policy by containing a .inbox_policy.json file, or through the
+"folders" section of the drop routing table (drop_routes.json):
+
+    Inbox/clients/acme/.inbox_policy.json
+    {"priority": "high", "action_type": "client_request", "auto_approve": false,
+     "target_tier": "silver"}
+
+Policies are inherited: a drop in Inbox/clients/acme/2026/ gets the fields of
+clients/, then clients/acme/ (and so on), each deeper folder overriding the
+fields it sets. A policy file overrides the routing table for its folder.
+
+Policies live in a trie of path components that is built once and updated
+when a policy file changes, and resolved policies are cached per folder, so
+handling a drop never reads a policy file.
+"""
+import os
+import sys
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+POLICY_FILENAME = ".inbox_policy.json"
+
+PRIORITIES = ("low", "medium", "high")
+TIERS = ("bronze", "silver", "gold")
+
+# Field -> check of its value
+POLICY_FIELDS = {
+    "action_type": lambda value: isinstance(value, str) and value.isidentifier(),
+    "handler": lambda value: isinstance(value, str) and value.isidentifier(),
+    "priority": lambda value: value in PRIORITIES,
+    "auto_approve": lambda value: isinstance(value, bool),
+    "target_tier": lambda value: value in TIERS,
+}
+
+
+def validate_policy(policy: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """
+    Keep the valid fields of a policy.
+
+    Args:
+        policy: Parsed policy
+        source: Where it came from (for log messages)
+
+    Returns:
+        The fields that are known and have valid values
+    """
+    valid = {}
+    for key, value in policy.items():
+        check = POLICY_FIELDS.get(key)
+        if check is None:
+            logger.warning(f"Ignoring unknown policy field {key!r} in {source}")
+        elif not check(value):
+            logger.warning(f"Ignoring invalid {key} {value!r} in {source}")
+        else:
+            valid[key] = value
+    return valid
+
+
+def _parts(folder: str) -> Tuple[str, ...]:
+    return tuple(part for part in folder.replace('\\', '/').split('/') if part and part != '.')
+
+
+class _Node:
+    """Trie node: one folder"""
+
+    __slots__ = ('children', 'table_policy', 'file_policy')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.table_policy: Dict[str, Any] = {}
+        self.file_policy: Dict[str, Any] = {}
+
+
+class FolderPolicies:
+    """Policies of the subfolders of a drop folder, resolved through a cached trie"""
+
+    def __init__(self, drop_folder: PathLike, table_policies: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            drop_folder: The Inbox
+            table_policies: Subfolder -> policy from the routing table's "folders" section
+        """
+        self.fs = get_vault_fs(drop_folder)
+        self.drop_folder = self.fs.path(drop_folder)
+        self._root = _Node()
+        self._cache: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        for folder, policy in (table_policies or {}).items():
+            self._node(_parts(folder)).table_policy = validate_policy(policy, f"routing table folder {folder}")
+        self.scan()
+
+    def _node(self, parts: Tuple[str, ...]) -> _Node:
+        node = self._root
+        for part in parts:
+            node = node.children.setdefault(part, _Node())
+        return node
+
+    def scan(self):
+        """Load every policy file under the drop folder (once, at startup)."""
+        count = 0
+        for top, dirnames, filenames in self.fs.walk(self.drop_folder):
+            dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+            if POLICY_FILENAME in filenames:
+                self.reload(top / POLICY_FILENAME)
+                count += 1
+        if count:
+            logger.info(f"Loaded {count} folder policies under {self.drop_folder.name}")
+
+    def folder_of(self, path: PathLike) -> str:
+        """Subfolder of the drop folder a path is in ("" for the drop folder itself)."""
+        folder = self.fs.path(path).parent.relative_to(self.drop_folder).as_posix()
+        return "" if folder == "." else folder
+
+    def reload(self, policy_path: PathLike):
+        """
+        Re-read a policy file after it was created or changed.
+
+        Args:
+            policy_path: The .inbox_policy.json file
+        """
+        policy_path = self.fs.path(policy_path)
+        parts = _parts(self.folder_of(policy_path))
+        try:
+            policy = json.loads(policy_path.read_text(encoding='utf-8'))
+            if not isinstance(policy, dict):
+                raise ValueError("not a JSON object")
+        except FileNotFoundError:
+            policy = {}
+        except ValueError as e:
+            logger.warning(f"Ignoring malformed policy {policy_path}: {e}")
+            policy = {}
+        with self._lock:
+            self._node(parts).file_policy = validate_policy(policy, str(policy_path))
+            self._cache.clear()
+
+    def forget(self, policy_path: PathLike):
+        """Drop the policy of a deleted policy file."""
+        parts = _parts(self.folder_of(policy_path))
+        with self._lock:
+            self._node(parts).file_policy = {}
+            self._cache.clear()
+
+    def resolve(self, folder: str) -> Dict[str, Any]:
+        """
+        Effective policy for a subfolder of the drop folder.
+
+        Args:
+            folder: Subfolder relative to the drop folder ("" for the drop folder)
+
+        Returns:
+            Merged policy fields, deeper folders overriding shallower ones
+        """
+        parts = _parts(folder)
+        with self._lock:
+            cached = self._cache.get(parts)
+            if cached is not None:
+                return cached
+            node = self._root
+            policy = {**node.table_policy, **node.file_policy}
+            for part in parts:
+                node = node.children.get(part)
+                if node is None:
+                    break
+                policy.update(node.table_policy)
+                policy.update(node.file_policy)
+            self._cache[parts] = policy
+            return policy
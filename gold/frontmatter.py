@@ -0,0 +1,226 @@
+"""
+Frontmatter Parser for AI Employee
+
+This module is the single frontmatter reader/writer shared by all tiers.
+
+Vault files start with a block like:
+
+    ---
+    type: file_drop
+    status: pending
+    ---
+
+read_frontmatter() reads a file in bounded chunks and stops at the closing
+'---', so action files carrying long email threads or extracted documents are
+never loaded just to look at `status:` or `platform:`. update_frontmatter()
+rewrites individual fields without touching the body: in place when the header
+keeps its length, otherwise by streaming the body into a replacement file.
+"""
+import io
+import os
+import sys
+import shutil
+import logging
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import to_vault_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DELIMITER = b'---'
+BOM = b'\xef\xbb\xbf'
+
+# Bytes read per chunk while scanning for the closing delimiter
+CHUNK_SIZE = 4096
+
+# Headers larger than this are treated as malformed rather than read further
+MAX_HEADER_BYTES = 64 * 1024
+
+
+@dataclass
+class Frontmatter:
+    """Typed view of a frontmatter block"""
+
+    fields: Dict[str, str] = field(default_factory=dict)
+    has_frontmatter: bool = False
+    header_length: int = 0  # Bytes from the start of the file to the start of the body
+
+    @property
+    def type(self) -> Optional[str]:
+        return self.fields.get('type')
+
+    @property
+    def status(self) -> Optional[str]:
+        return self.fields.get('status')
+
+    @property
+    def priority(self) -> Optional[str]:
+        return self.fields.get('priority')
+
+    @property
+    def platform(self) -> Optional[str]:
+        return self.fields.get('platform')
+
+    @property
+    def created(self) -> Optional[str]:
+        return self.fields.get('created')
+
+    def get(self, key: str, default: str = '') -> str:
+        return self.fields.get(key, default)
+
+
+def _parse_lines(header: str) -> Dict[str, str]:
+    """Parse 'key: value' lines of a header (without the delimiters)."""
+    fields = {}
+    for line in header.splitlines():
+        if ':' in line and not line.startswith((' ', '\t', '#')):
+            key, value = line.split(':', 1)
+            fields[key.strip()] = value.strip()
+    return fields
+
+
+def _scan_header(f: BinaryIO, chunk_size: int = CHUNK_SIZE,
+                 max_header_bytes: int = MAX_HEADER_BYTES) -> Optional[Tuple[bytes, int, int, int]]:
+    """
+    Read a stream chunk by chunk until the frontmatter block is complete.
+
+    Returns:
+        (bytes read, end of the opening line, start of the closing line, start
+        of the body), or None if the stream does not start with frontmatter
+    """
+    buf = b''
+    pos = 0
+    opening_end = None
+    while True:
+        newline = buf.find(b'\n', pos)
+        if newline == -1:
+            chunk = f.read(chunk_size) if len(buf) < max_header_bytes else b''
+            if chunk:
+                buf += chunk
+                continue
+            # End of stream (or header too large): accept a final delimiter without newline
+            if opening_end is not None and len(buf) < max_header_bytes and buf[pos:].strip() == DELIMITER:
+                return buf, opening_end, pos, len(buf)
+            return None
+        line = buf[pos:newline]
+        if opening_end is None:
+            if line.lstrip(BOM).strip() != DELIMITER:
+                return None
+            opening_end = newline + 1
+        elif line.strip() == DELIMITER:
+            return buf, opening_end, pos, newline + 1
+        pos = newline + 1
+
+
+def _to_record(scanned: Optional[Tuple[bytes, int, int, int]]) -> Frontmatter:
+    if not scanned:
+        return Frontmatter()
+    buf, opening_end, closing_start, body_start = scanned
+    header = buf[opening_end:closing_start].decode('utf-8', errors='replace')
+    return Frontmatter(fields=_parse_lines(header), has_frontmatter=True, header_length=body_start)
+
+
+def read_frontmatter(file_path: Path, chunk_size: int = CHUNK_SIZE) -> Frontmatter:
+    """
+    Read only the frontmatter of a file.
+
+    Args:
+        file_path: File to read
+        chunk_size: Bytes to read per chunk
+
+    Returns:
+        Frontmatter record (empty if the file has no frontmatter or is missing)
+    """
+    try:
+        with to_vault_path(file_path).open('rb') as f:
+            return _to_record(_scan_header(f, chunk_size))
+    except OSError:
+        return Frontmatter()
+
+
+def parse_frontmatter(content: str) -> Frontmatter:
+    """
+    Parse frontmatter from content that is already in memory.
+
+    Args:
+        content: Full or partial file content
+
+    Returns:
+        Frontmatter record (header_length is in bytes of the UTF-8 encoding)
+    """
+    return _to_record(_scan_header(io.BytesIO(content.encode('utf-8'))))
+
+
+def _render_header(old_header: str, updates: Dict[str, str]) -> str:
+    """Apply field updates to the raw header text, keeping line order and unknown lines."""
+    remaining = dict(updates)
+    lines = []
+    for line in old_header.splitlines():
+        key = line.split(':', 1)[0].strip() if ':' in line else None
+        if key in remaining and not line.startswith((' ', '\t')):
+            lines.append(f"{key}: {remaining.pop(key)}")
+        else:
+            lines.append(line)
+    for key, value in remaining.items():
+        lines.append(f"{key}: {value}")
+    return '\n'.join(lines)
+
+
+def update_frontmatter(file_path: Path, updates: Dict[str, str]) -> bool:
+    """
+    Set one or more frontmatter fields in a file without loading its body.
+
+    Existing fields are rewritten on their own line; new fields are appended to
+    the end of the block. A file without frontmatter gets a new block.
+
+    Args:
+        file_path: File to update
+        updates: Mapping of field name to new value
+
+    Returns:
+        True if the file was updated, False if it does not exist
+    """
+    file_path = to_vault_path(file_path)
+    try:
+        with file_path.open('rb') as f:
+            scanned = _scan_header(f)
+    except FileNotFoundError:
+        return False
+
+    if scanned:
+        buf, opening_end, closing_start, body_start = scanned
+        old_header = buf[opening_end:closing_start].decode('utf-8')
+        new_bytes = (buf[:opening_end]
+                     + (_render_header(old_header, updates) + '\n').encode('utf-8')
+                     + buf[closing_start:body_start])
+    else:
+        body_start = 0
+        new_bytes = f"---\n{_render_header('', updates)}\n---\n\n".encode('utf-8')
+
+    if len(new_bytes) == body_start:
+        # Same length: overwrite the header bytes in place
+        with file_path.open('r+b') as f:
+            f.write(new_bytes)
+        return True
+
+    # Different length: stream header + body into a sibling file and swap it in
+    with file_path.fs.atomic_write(file_path, 'wb') as out, file_path.open('rb') as src:
+        out.write(new_bytes)
+        src.seek(body_start)
+        shutil.copyfileobj(src, out)
+    return True
+
+
+def update_frontmatter_field(file_path: Path, key: str, value: str) -> bool:
+    """Set a single frontmatter field. See update_frontmatter()."""
+    return update_frontmatter(file_path, {key: value})
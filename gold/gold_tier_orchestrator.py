@@ -8,6 +8,17 @@ This orchestrator implements all Gold Tier features including:
 - Error recovery and graceful degradation
 - CEO briefing generation
 - Multiple MCP server coordination
+
+Action files are processed concurrently by GOLD_WORKERS threads. Each file is
+claimed by renaming it into Needs_Action/.processing/<worker-id>/ first (see
+action_claims.py), so several orchestrator processes, on one host or on hosts
+sharing the vault, never process the same file twice; claims of a process
+that stops renewing its lease for GOLD_CLAIM_LEASE seconds are returned.
+Files are taken most urgent first by priority, age and due date (see
+action_scheduler.py); GOLD_CLASS_LIMITS (e.g. "low=1") caps how many files
+of a priority class run at once. Each claimed file goes through the gold
+configuration of the stage pipeline shared with bronze and silver (see
+pipeline.py).
 """
 import time
 import logging
@@ -26,6 +37,18 @@ from ceo_briefing_generator import CEOBriefingGenerator
 from cross_domain_integration import CrossDomainIntegrator
 from social_integration import SocialMediaIntegrator
 from twitter_integration import TwitterIntegrator
+from vault_index import get_vault_index
+from change_journal import get_change_journal, net_changes
+from done_archive import DoneArchive
+from keyword_classifier import classify_text
+from frontmatter import read_frontmatter
+from action_claims import DEFAULT_LEASE_SECONDS, ClaimStore
+from action_scheduler import ActionScheduler, parse_limits
+from action_ledger import ActionLedger
+from pipeline import ActionRecord, Archive, Classify, Commit, Ingest, Pipeline, Plan, Route
+from vault_fs import get_vault_fs
+from config_loader import get_env_variable
+from write_batch import WriteBatch
 from agent_skills.email_skill import send_email, queue_email_for_approval
 from agent_skills.file_processing_skill import create_action_file, create_plan_file
 
@@ -36,23 +59,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Threads processing action files in one cycle
+DEFAULT_WORKERS = 4
+
 class GoldTierOrchestrator:
     """Main orchestrator for all Gold Tier features"""
 
-    def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+    def __init__(self, vault_path: str, workers: int = DEFAULT_WORKERS, worker_id: str = None,
+                 claim_lease: float = DEFAULT_LEASE_SECONDS, class_limits: Dict[str, int] = None):
+        """
+        Args:
+            vault_path: Vault root
+            workers: Threads processing action files concurrently
+            worker_id: Name of this process's claim folder in Needs_Action/.processing
+                (host and pid by default)
+            claim_lease: Seconds after which the claims of a worker that stopped
+                renewing them expire
+            class_limits: Most files of a priority class processed at once, e.g. {"low": 1}
+        """
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
         self.needs_action = self.vault_path / "Needs_Action"
         self.done = self.vault_path / "Done"
         self.plans = self.vault_path / "Plans"
 
         # Initialize Gold Tier components
-        self.ralph_loop = RalphWiggumLoop(str(vault_path))
-        self.audit_logger = AuditLogger(str(vault_path))
-        self.error_recovery = ErrorRecoveryManager(str(vault_path))
-        self.briefing_generator = CEOBriefingGenerator(str(vault_path))
-        self.cross_domain = CrossDomainIntegrator(str(vault_path))
-        self.social = SocialMediaIntegrator(str(vault_path))
-        self.twitter = TwitterIntegrator(str(vault_path))
+        self.ralph_loop = RalphWiggumLoop(self.vault_path)
+        self.audit_logger = AuditLogger(self.vault_path)
+        self.error_recovery = ErrorRecoveryManager(self.vault_path)
+        self.briefing_generator = CEOBriefingGenerator(self.vault_path)
+        self.cross_domain = CrossDomainIntegrator(self.vault_path)
+        self.social = SocialMediaIntegrator(self.vault_path)
+        self.twitter = TwitterIntegrator(self.vault_path)
+        self.index = get_vault_index(self.vault_path)
+        self.archive = DoneArchive(self.vault_path)
+        self.journal = get_change_journal(self.vault_path)
+        self.actions_cursor = self.journal.cursor("gold_orchestrator")
+        self.writer = self.fs
+        self.workers = max(1, workers)
+        self.claims = ClaimStore(self.needs_action, worker_id, claim_lease)
+        # Kept across cycles; each cycle only adds the files that are new or changed
+        self.scheduler = ActionScheduler(class_limits)
+        # Finished stages of files in flight, so a retried or reaped file does
+        # not get a second plan, notification or social draft
+        self.ledger = ActionLedger(self.vault_path)
+        # The gold configuration of the shared stage pipeline; each worker
+        # runs the file it claimed through it
+        self.pipeline = Pipeline("gold", [
+            Ingest("gold"),
+            Classify(),
+            Plan(self._create_plan),
+            Route({
+                'cross_domain': self._notify_cross_domain,
+                'social': lambda record: self._handle_social_media_request(record.content, record.path,
+                                                                           record.categories),
+            }),
+            # The cycle's WriteBatch, shared by the workers, holds the plan
+            # and drafts; they are committed before the action file moves to
+            # Done (the staging stages and Commit run one worker at a time)
+            Commit(lambda: self.writer),
+            Archive(self.archive, on_archived=self._index_archived),
+        ], on_error=self._action_failed, ledger=self.ledger)
 
         # Create necessary directories
         self.needs_action.mkdir(exist_ok=True)
@@ -115,109 +182,29 @@ class GoldTierOrchestrator:
                 parameters=event
             )
 
-        # Process each action file
-        action_files = list(self.needs_action.glob("*.md"))
-
-        processed_count = 0
-        for action_file in action_files:
-            if action_file.name.startswith('.'):
-                continue  # Skip hidden files
-
-            logger.info(f"Processing action file: {action_file.name}")
-
-            with error_handling_context(self.error_recovery, f"Processing {action_file.name}"):
-                try:
-                    # Log the start of processing
-                    self.audit_logger.log_event(
-                        event_type="action_processing_start",
-                        description=f"Starting processing of {action_file.name}",
-                        actor="orchestrator",
-                        result="in_progress",
-                        target=str(action_file)
-                    )
-
-                    # Read the action file
-                    content = action_file.read_text()
-
-                    # Create a plan based on the action
-                    plan_result = self.error_recovery.graceful_degrade(
-                        lambda: create_plan_file(
-                            objective=f"Process action file: {action_file.name}",
-                            tasks=["Review content", "Determine appropriate action", "Execute action", "Update status"],
-                            timeline="24 hours"
-                        ),
-                        lambda: create_plan_file(
-                            objective=f"Process action file: {action_file.name}",
-                            tasks=["Review content", "Update status"],
-                            timeline="48 hours"
-                        ),
-                        f"Creating plan for {action_file.name}"
-                    )
-
-                    # Check if this is a cross-domain request
-                    if any(keyword in content.lower() for keyword in ['personal', 'business', 'work', 'family']):
-                        self.cross_domain.process_cross_domain_notification({
-                            "id": action_file.stem,
-                            "title": f"Action: {action_file.name}",
-                            "content": content[:200] + "..." if len(content) > 200 else content,
-                            "source": str(action_file)
-                        })
-
-                    # Check for social media requests
-                    if any(keyword in content.lower() for keyword in ['facebook', 'instagram', 'social', 'post', 'tweet', 'twitter']):
-                        self._handle_social_media_request(content, action_file)
-
-                    # Move to Done folder
-                    done_file = self.done / action_file.name
-
-                    # Handle case where file already exists in Done folder
-                    if done_file.exists():
-                        # Add timestamp to make unique
-                        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-                        done_file = self.done / f"{action_file.stem}_{timestamp}{action_file.suffix}"
-
-                    action_file.rename(done_file)
-
-                    # Log successful completion
-                    self.audit_logger.log_event(
-                        event_type="action_processing_success",
-                        description=f"Successfully processed {action_file.name}",
-                        actor="orchestrator",
-                        result="success",
-                        target=str(done_file)
-                    )
-
-                    processed_count += 1
-
-                except Exception as e:
-                    # Log error and save failed action
-                    error_id = self.error_recovery.log_error(
-                        e, f"Error processing {action_file.name}", "high"
-                    )
-
-                    # Save failed action for later processing
-                    failed_action_data = {
-                        "id": action_file.stem,
-                        "original_path": str(action_file),
-                        "error_id": error_id,
-                        "timestamp": datetime.now().isoformat()
-                    }
-
-                    self.error_recovery.save_failed_action(failed_action_data, {
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                        "timestamp": datetime.now().isoformat()
-                    })
-
-                    # Log the failure
-                    self.audit_logger.log_event(
-                        event_type="action_processing_failed",
-                        description=f"Failed to process {action_file.name}",
-                        actor="orchestrator",
-                        result="failed",
-                        target=str(action_file),
-                        parameters={"error_id": error_id}
-                    )
+        # Process each action file (hidden files are never indexed; attachments
+        # are archived with their action file, and drops sent to another tier
+        # by their Inbox folder policy are left for it)
+        action_files = [f for f in self._action_files_to_process()
+                        if ".original." not in f.name and self._is_for_gold(f)]
+
+        # Files held by workers that died go back to Needs_Action first
+        for returned in self.claims.reap():
+            if returned not in action_files and ".original." not in returned.name:
+                action_files.append(returned)
+
+        # Most urgent first (priority, age, due date), each file claimed just
+        # before it is processed, so other orchestrator processes (on this host
+        # or others sharing the vault) can work through the same folder
+        self.scheduler.sync(action_files, complete=False)
+        processed_count = sum(self.scheduler.drain(self._claim_and_process, self.workers))
+        logger.info(f"Needs_Action queue by priority: {self.scheduler.stats()}")
+        logger.info(f"Pipeline stage timings: {self.pipeline.stats(reset=True)}")
+
+        # Action files that are still in Needs_Action are retried next cycle;
+        # the cursor is saved together with this cycle's outputs
+        self.actions_cursor.state["pending"] = [f.name for f in self.scheduler.waiting() if f.exists()]
+        self.actions_cursor.commit(self.writer)
 
         # Process any previously failed actions
         recovery_results = self.error_recovery.process_failed_actions()
@@ -225,16 +212,162 @@ class GoldTierOrchestrator:
 
         return processed_count
 
-    def _handle_social_media_request(self, content: str, source_file: Path):
+    def _is_for_gold(self, action_file: Path) -> bool:
+        """Whether an action file is for this tier (not sent elsewhere by its folder policy)."""
+        try:
+            return read_frontmatter(action_file).get("target_tier", "gold") == "gold"
+        except FileNotFoundError:
+            # Claimed by another worker since it was listed
+            return False
+
+    def _claim_and_process(self, action_file: Path) -> bool:
+        """Claim an action file and process it, returning True if it was processed."""
+        claimed = self.claims.claim(action_file)
+        if claimed is None:
+            logger.info(f"{action_file.name} was claimed by another worker")
+            return False
+        try:
+            return self._process_action_file(action_file, claimed)
+        finally:
+            # Whatever was not archived is handed back and retried next cycle
+            if claimed.exists():
+                self.claims.release(claimed)
+
+    def _process_action_file(self, action_file: Path, claimed: Path) -> bool:
+        """
+        Run one action file through the gold pipeline: plan creation,
+        cross-domain notification, social drafting and archiving.
+
+        Args:
+            action_file: The file's path in Needs_Action (for logs and the index)
+            claimed: Where it is while this worker holds it
+
+        Returns:
+            True if the file was processed and archived
+        """
+        with error_handling_context(self.error_recovery, f"Processing {action_file.name}"):
+            # Log the start of processing
+            self.audit_logger.log_event(
+                event_type="action_processing_start",
+                description=f"Starting processing of {action_file.name}",
+                actor="orchestrator",
+                result="in_progress",
+                target=str(action_file)
+            )
+
+            # Failures are recorded by _action_failed
+            for record in self.pipeline.run([ActionRecord(action_file, claimed)]):
+                # Log successful completion
+                self.audit_logger.log_event(
+                    event_type="action_processing_success",
+                    description=f"Successfully processed {action_file.name}",
+                    actor="orchestrator",
+                    result="success",
+                    target=str(record.done_file)
+                )
+                return True
+        return False
+
+    def _create_plan(self, record: ActionRecord):
+        """Create a plan for an action file, with a shorter fallback plan."""
+        return self.error_recovery.graceful_degrade(
+            lambda: create_plan_file(
+                objective=f"Process action file: {record.name}",
+                tasks=["Review content", "Determine appropriate action", "Execute action", "Update status"],
+                timeline="24 hours",
+                vault_path=self.vault_path,
+                writer=self.writer
+            ),
+            lambda: create_plan_file(
+                objective=f"Process action file: {record.name}",
+                tasks=["Review content", "Update status"],
+                timeline="48 hours",
+                vault_path=self.vault_path,
+                writer=self.writer
+            ),
+            f"Creating plan for {record.name}"
+        )
+
+    def _notify_cross_domain(self, record: ActionRecord):
+        """Pass a cross-domain request on to the cross-domain integrator."""
+        content = record.content
+        self.cross_domain.process_cross_domain_notification({
+            "id": record.path.stem,
+            "title": f"Action: {record.name}",
+            "content": content[:200] + "..." if len(content) > 200 else content,
+            "source": str(record.path)
+        })
+
+    def _index_archived(self, record: ActionRecord):
+        """Move an archived action file and its attachments in the vault index."""
+        self.index.move_file(record.path, record.done_file)
+        for attachment, archived_attachment in record.attachments.items():
+            self.index.move_file(self.needs_action / attachment.name, archived_attachment)
+
+    def _action_failed(self, record: ActionRecord, e: Exception):
+        """Log a failed action file and save it for the failed-action recovery."""
+        action_file = record.path
+        error_id = self.error_recovery.log_error(
+            e, f"Error processing {action_file.name}", "high"
+        )
+
+        # Save failed action for later processing
+        failed_action_data = {
+            "id": action_file.stem,
+            "original_path": str(action_file),
+            "error_id": error_id,
+            "timestamp": datetime.now().isoformat()
+        }
+
+        self.error_recovery.save_failed_action(failed_action_data, {
+            "error": str(e),
+            "error_type": type(e).__name__,
+            "timestamp": datetime.now().isoformat()
+        })
+
+        # Log the failure
+        self.audit_logger.log_event(
+            event_type="action_processing_failed",
+            description=f"Failed to process {action_file.name}",
+            actor="orchestrator",
+            result="failed",
+            target=str(action_file),
+            parameters={"error_id": error_id}
+        )
+
+    def _action_files_to_process(self) -> List[Path]:
+        """
+        Action files for this cycle.
+
+        The first cycle lists Needs_Action; later cycles take the files the
+        change journal reports as new or changed since the last cycle, plus
+        the ones earlier cycles did not finish.
+        """
+        cursor = self.actions_cursor
+        if cursor.is_new:
+            cursor.seek_end()
+            return self.index.list_files(self.needs_action, suffix=".md")
+
+        # Files dropped in by hand reach the journal when the folder is reconciled
+        self.index.sync_folder(self.needs_action)
+        changes = net_changes(cursor.read(), "Needs_Action", "*.md")
+        names = set(cursor.state.get("pending", []))
+        names.update(rel_path.rsplit('/', 1)[-1] for rel_path, exists in changes.items() if exists)
+        return [self.needs_action / name for name in sorted(names) if (self.needs_action / name).exists()]
+
+    def _handle_social_media_request(self, content: str, source_file: Path,
+                                     categories: Dict[str, Any] = None):
         """Handle social media related requests from action files."""
+        if categories is None:
+            categories = classify_text(content)
         try:
-            if 'twitter' in content.lower() or 'x' in content.lower():
+            if 'twitter' in categories:
                 # Create a Twitter post
                 self.twitter.create_tweet(content[:280])
-            elif 'facebook' in content.lower():
+            elif 'facebook' in categories:
                 # Create a Facebook post
                 self.social.create_facebook_post(content)
-            elif 'instagram' in content.lower():
+            elif 'instagram' in categories:
                 # Create an Instagram post
                 self.social.create_instagram_post(content, "images/default_social_image.jpg")
             else:
@@ -364,8 +497,44 @@ class GoldTierOrchestrator:
         except:
             return False
 
+    def _set_writer(self, writer):
+        """
+        Route the outputs of all components through writer.
+
+        Every component that writes vault files keeps a `writer` attribute,
+        initialised to its VaultFS, and makes all of its writes, renames and
+        deletes (and the reads that must see them) through it. Swapping in a
+        WriteBatch stages them until the batch is committed.
+
+        Args:
+            writer: The VaultFS (write now) or a WriteBatch (stage for commit)
+        """
+        self.writer = writer
+        for component in (self.audit_logger, self.error_recovery, self.briefing_generator,
+                          self.cross_domain, self.social, self.twitter, self.ledger):
+            component.writer = writer
+
     def run_complete_gold_tier_cycle(self):
-        """Run a complete cycle of all Gold Tier features."""
+        """
+        Run a complete cycle of all Gold Tier features.
+
+        Plans, cross-domain references, social drafts, dashboards, audit
+        summaries and failed-action records are staged on one WriteBatch and
+        committed together when the cycle ends, so none of them is ever left
+        half-written and files rewritten during the cycle are written once.
+        The batch is also committed before each action file moves to Done, so
+        an archived action always has its plan.
+        """
+        batch = WriteBatch(self.vault_path)
+        self._set_writer(batch)
+        try:
+            return self._run_gold_tier_cycle()
+        finally:
+            self._set_writer(self.fs)
+            stats = batch.commit()
+            logger.info(f"Gold Tier cycle write batch committed: {stats}")
+
+    def _run_gold_tier_cycle(self):
         logger.info("Starting complete Gold Tier processing cycle")
 
         # Log the start of the cycle
@@ -435,7 +604,7 @@ class GoldTierOrchestrator:
 
 def main():
     """Main function to demonstrate Gold Tier orchestrator"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
@@ -472,7 +641,13 @@ This action should trigger all Gold Tier features including Ralph Wiggum loops,
 4. All Gold Tier features should be demonstrated
 """)
 
-    orchestrator = GoldTierOrchestrator(str(vault_path))
+    orchestrator = GoldTierOrchestrator(
+        vault_path,
+        workers=int(get_env_variable('GOLD_WORKERS', str(DEFAULT_WORKERS))),
+        worker_id=get_env_variable('GOLD_WORKER_ID', None),
+        claim_lease=float(get_env_variable('GOLD_CLAIM_LEASE', str(DEFAULT_LEASE_SECONDS))),
+        class_limits=parse_limits(get_env_variable('GOLD_CLASS_LIMITS', ''))
+    )
 
     print("Running complete Gold Tier processing cycle...")
     results = orchestrator.run_complete_gold_tier_cycle()
@@ -489,6 +664,7 @@ This action should trigger all Gold Tier features including Ralph Wiggum loops,
     health_result = orchestrator.perform_system_health_check()
     print(f"System health: {health_result['overall_status']}")
 
+    orchestrator.claims.close()
     print("\nGold Tier Orchestrator demo completed!")
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""
+Ingest Marker for AI Employee
+
+This module keeps a persistent record of the drops a watcher has turned into
+action files, so a catch-up scan after a restart neither re-ingests a file
+that was already handled nor forgets one that was half done.
+
+The marker is an append-only JSONL file next to the watched folder
+(Inbox/.ingest_marker.jsonl). Ingesting a drop writes two lines:
+
+    {"op": "claim", "key": "scan.pdf:52311:1771500000123456789:942", "name": "scan.pdf",
+     "action": "ACTION_..._scan.pdf.md", "original": "ACTION_..._scan.pdf.original.pdf"}
+    {"op": "done", "action": "ACTION_..._scan.pdf.md"}
+
+A claim without a matching done line is an ingest that was interrupted. A done
+key whose file is still in the folder is a drop that was handled but could not
+be removed (e.g. a cross-device move whose unlink failed); it must not be
+ingested again. Files are keyed by name, size, mtime and inode, so dropping
+the same file again later is a new ingest.
+"""
+import os
+import sys
+import json
+import logging
+import threading
+from typing import Callable, Dict, List
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import VaultPath, get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+MARKER_FILENAME = ".ingest_marker.jsonl"
+
+
+def ingest_key(name: str, st: os.stat_result) -> str:
+    """Identity of a dropped file: name, size, mtime and inode (0 on backends without inodes)."""
+    return f"{name}:{st.st_size}:{st.st_mtime_ns}:{getattr(st, 'st_ino', 0)}"
+
+
+class IngestMarker:
+    """Append-only record of claimed and completed ingests for one folder"""
+
+    def __init__(self, folder: VaultPath, filename: str = MARKER_FILENAME):
+        self.fs = get_vault_fs(folder)
+        self.path = self.fs.path(folder) / filename
+        self._lock = threading.Lock()
+
+        # action file name -> claim record, for claims without a done line
+        self._claims: Dict[str, dict] = {}
+        # keys of completed ingests
+        self._done: Dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return
+        for line in data[:data.rfind(b'\n') + 1].splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError):
+                logger.warning(f"Skipping malformed line in {self.path.name}")
+
+    def _apply(self, record: dict):
+        if record["op"] == "claim":
+            self._claims[record["action"]] = record
+        elif record["op"] == "done":
+            claim = self._claims.pop(record["action"], None)
+            if claim is not None:
+                self._done[claim["key"]] = claim
+
+    def _append(self, record: dict):
+        # One appending write per line, so concurrent workers do not interleave
+        self.fs.append_bytes(self.path, (json.dumps(record) + "\n").encode('utf-8'))
+        self._apply(record)
+
+    def claim(self, name: str, st: os.stat_result, action: str, original: str):
+        """Record that a drop is about to be ingested as the given action file."""
+        with self._lock:
+            self._append({"op": "claim", "key": ingest_key(name, st), "name": name,
+                          "action": action, "original": original})
+
+    def done(self, action: str):
+        """Record that the action file for a claimed drop has been written."""
+        with self._lock:
+            self._append({"op": "done", "action": action})
+
+    def is_done(self, name: str, st: os.stat_result) -> bool:
+        """True if this exact file was ingested before."""
+        with self._lock:
+            return ingest_key(name, st) in self._done
+
+    def unfinished(self) -> List[dict]:
+        """Claims that never got their done line (oldest first)."""
+        with self._lock:
+            return list(self._claims.values())
+
+    def abandon(self, action: str):
+        """Forget an unfinished claim (its drop will be ingested afresh)."""
+        with self._lock:
+            self._claims.pop(action, None)
+
+    def compact(self, still_present: Callable[[str], bool]):
+        """
+        Rewrite the marker with only the records that still matter.
+
+        Args:
+            still_present: Returns True for a key whose file is still in the folder
+        """
+        with self._lock:
+            self._done = {key: claim for key, claim in self._done.items() if still_present(key)}
+            with self.fs.atomic_write(self.path, encoding='utf-8') as f:
+                for claim in self._claims.values():
+                    f.write(json.dumps(claim) + "\n")
+                for claim in self._done.values():
+                    f.write(json.dumps(claim) + "\n")
+                    f.write(json.dumps({"op": "done", "action": claim["action"]}) + "\n")
+        logger.info(f"Compacted {self.path.name}: {len(self._claims)} unfinished, {len(self._done)} handled")
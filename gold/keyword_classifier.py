@@ -0,0 +1,227 @@
+"""
+Keyword Classifier for AI Employee
+
+This module replaces the repeated `any(keyword in content.lower() ...)` scans
+used by the orchestrators and the cross-domain integrator with one precompiled
+multi-pattern matcher.
+
+Text is split into words and fed through an Aho-Corasick automaton whose
+alphabet is whole words, so:
+- a single pass over the text reports every matching category at once
+- keywords only match on word boundaries ('x' matches "X" but not "next")
+- multi-word keywords such as "bank transfer" are supported
+- files are classified in bounded chunks, so cost stays linear in file size
+"""
+import os
+import re
+import sys
+import logging
+from pathlib import Path
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import to_vault_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Words are runs of letters/digits; underscores separate words so that file
+# names like "test_payment.md" still match "payment"
+_WORD = re.compile(r'[^\W_]+')
+# Greedy match up to the last separator; anchored, so linear in the trailing run
+_UP_TO_LAST_SEPARATOR = re.compile(r'.*[\W_]', re.DOTALL)
+
+# Characters read per chunk when classifying a file
+CHUNK_SIZE = 64 * 1024
+
+# Keyword lists used across the tiers, grouped by category
+ACTION_CATEGORIES: Dict[str, List[str]] = {
+    # Sensitive financial actions that need an approval request (bronze tier)
+    "payment": ["payment", "invoice", "money", "bank", "financial"],
+    # Sensitive content that needs an approval request (silver tier)
+    "sensitive": ["payment", "invoice", "money", "financial", "salary", "confidential",
+                  "private", "sensitive", "urgent", "critical"],
+    # Social media requests
+    "social": ["social", "post", "tweet", "twitter", "facebook", "instagram", "linkedin"],
+    "twitter": ["twitter", "x", "tweet"],
+    "facebook": ["facebook"],
+    "instagram": ["instagram"],
+    "linkedin": ["linkedin"],
+    # Requests that touch both personal and business domains
+    "cross_domain": ["personal", "business", "work", "family"],
+    "cross_domain_notification": ["business", "work", "personal", "client", "private"],
+    "business_related": ["client", "project", "invoice", "payment", "business"],
+    "personal_related": ["personal", "family", "vacation", "doctor", "appointment"],
+    "business_finance": ["business", "work"],
+    "personal_finance": ["personal", "private"],
+    "business_task": ["client", "meeting", "work", "office", "project"],
+    "personal_task": ["personal", "family", "vacation", "appointment", "private"],
+    # Urgency markers
+    "urgency": ["urgent", "asap", "critical", "emergency"],
+    # Keywords the WhatsApp watcher flags
+    "whatsapp": ["urgent", "asap", "help", "invoice", "payment", "question"],
+}
+
+
+def _variants(keyword: str) -> List[Tuple[str, ...]]:
+    """Word sequences a keyword should match (the keyword itself and its plural)."""
+    words = tuple(_WORD.findall(keyword.lower()))
+    if not words:
+        return []
+    variants = [words]
+    last = words[-1]
+    if len(last) > 2 and last.isalpha() and not last.endswith('s'):
+        variants.append(words[:-1] + (last + 's',))
+    return variants
+
+
+class KeywordClassifier:
+    """Aho-Corasick matcher over words that maps matches to categories"""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories = {name: list(keywords) for name, keywords in categories.items()}
+
+        # keyword -> categories it belongs to
+        self._keyword_categories: Dict[str, Set[str]] = {}
+        for name, keywords in self.categories.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword.lower(), set()).add(name)
+
+        # Automaton: per-node transitions, failure links and output keywords
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Set[str]] = [set()]
+        self._longest_word = 1
+
+        for keyword in self._keyword_categories:
+            for words in _variants(keyword):
+                self._add(words, keyword)
+        self._build_failure_links()
+
+    def _add(self, words: Tuple[str, ...], keyword: str):
+        state = 0
+        for word in words:
+            self._longest_word = max(self._longest_word, len(word))
+            nxt = self._goto[state].get(word)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+                self._goto[state][word] = nxt
+            state = nxt
+        self._out[state].add(keyword)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(word, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def _feed(self, text: str, state: int, found: Set[str]) -> int:
+        """Advance the automaton over the words in text, collecting matched keywords."""
+        goto, fail, out = self._goto, self._fail, self._out
+        for word in _WORD.findall(text.lower()):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            if out[state]:
+                found |= out[state]
+        return state
+
+    def _categorize(self, found: Set[str]) -> Dict[str, Set[str]]:
+        result: Dict[str, Set[str]] = {}
+        for keyword in found:
+            for category in self._keyword_categories[keyword]:
+                result.setdefault(category, set()).add(keyword)
+        return result
+
+    def classify_text(self, text: str) -> Dict[str, Set[str]]:
+        """
+        Classify text in a single pass.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Mapping of matched category -> keywords that matched it
+        """
+        found: Set[str] = set()
+        self._feed(text, 0, found)
+        return self._categorize(found)
+
+    def classify_file(self, file_path: Path, chunk_size: int = CHUNK_SIZE) -> Dict[str, Set[str]]:
+        """
+        Classify a file in bounded chunks without loading it whole.
+
+        Args:
+            file_path: File to classify
+            chunk_size: Characters read per chunk
+
+        Returns:
+            Mapping of matched category -> keywords that matched it
+        """
+        found: Set[str] = set()
+        state = 0
+        carry = ''
+        in_long_word = False
+
+        with to_vault_path(file_path).open('r', encoding='utf-8', errors='replace') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                text = carry + chunk
+
+                if in_long_word:
+                    # Skip the rest of a word too long to be any keyword
+                    skip = _WORD.match(text)
+                    if skip and skip.end() == len(text):
+                        carry = ''
+                        continue
+                    text = text[skip.end():] if skip else text
+                    in_long_word = False
+
+                # Hold back a word that may continue in the next chunk
+                head = _UP_TO_LAST_SEPARATOR.match(text)
+                boundary = head.end() if head else 0
+                carry = text[boundary:]
+                text = text[:boundary]
+
+                state = self._feed(text, state, found)
+
+                if len(carry) > self._longest_word:
+                    carry = ''
+                    in_long_word = True
+                    state = 0
+
+        if carry:
+            self._feed(carry, state, found)
+        return self._categorize(found)
+
+
+# Shared classifier for action files, built once at import time
+ACTION_CLASSIFIER = KeywordClassifier(ACTION_CATEGORIES)
+
+
+def classify_text(text: str) -> Dict[str, Set[str]]:
+    """Classify text with the shared action classifier."""
+    return ACTION_CLASSIFIER.classify_text(text)
+
+
+def classify_file(file_path: Path) -> Dict[str, Set[str]]:
+    """Classify a file with the shared action classifier."""
+    return ACTION_CLASSIFIER.classify_file(file_path)
@@ -0,0 +1,185 @@
+"""
+Orchestrator Daemon for AI Employee
+
+This module keeps an orchestrator running and wakes it when work arrives,
+instead of waiting for cron to re-run it. A watchdog observer watches
+Needs_Action and Plans/Approved; when a file is created, written or moved
+in, the daemon waits for the folder to be quiet for a moment (so a burst of
+drops becomes one cycle and no file is read half-written) and runs a cycle:
+
+    daemon = OrchestratorDaemon(vault_path, lambda: run_cycle(vault_path, pace))
+    daemon.run()             # until Ctrl+C or daemon.stop()
+
+A cycle moves what it processed out of the watched folders, so the events it
+causes itself are recognised by their paths no longer existing and do not
+start another cycle. A cycle also runs at startup and every RESCAN_SECONDS,
+to pick up anything an observer restart may have missed. Pacing inside a
+cycle is the orchestrator's job (see gold/token_bucket.py).
+"""
+import os
+import sys
+import time
+import logging
+import threading
+from typing import Callable, Iterable, Set
+
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, get_vault_fs
+from snapshot_observer import SnapshotPollingObserver, is_network_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+WATCHED_FOLDERS = ("Needs_Action", "Plans/Approved")
+
+# Quiet time after the last event before a cycle runs, and the longest a
+# steady stream of events can hold a cycle back
+DEBOUNCE_SECONDS = 0.2
+MAX_DEBOUNCE_SECONDS = 1.0
+
+# Seconds between cycles when no events arrive
+RESCAN_SECONDS = 300.0
+
+
+class _WakeHandler(FileSystemEventHandler):
+    """Collects the paths of new and changed files and wakes the daemon"""
+
+    def __init__(self, daemon: 'OrchestratorDaemon'):
+        self.daemon = daemon
+
+    def _note(self, path: str):
+        if not os.path.basename(path).startswith('.'):
+            self.daemon._wake(path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._note(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._note(event.src_path)
+
+    def on_closed(self, event):
+        self._note(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._note(event.dest_path)
+
+
+class OrchestratorDaemon:
+    """Runs an orchestrator cycle whenever its folders receive work"""
+
+    def __init__(self, vault_path: PathLike, cycle: Callable[[], None],
+                 folders: Iterable[str] = WATCHED_FOLDERS, observer_mode: str = "auto",
+                 debounce: float = DEBOUNCE_SECONDS, rescan: float = RESCAN_SECONDS):
+        """
+        Args:
+            vault_path: Vault root
+            cycle: Runs one orchestrator cycle
+            folders: Folders to watch, relative to the vault root
+            observer_mode: "native" (inotify and friends), "polling" (for
+                network shares) or "auto" (polling when the vault is on NFS/SMB)
+            debounce: Quiet time after the last event before a cycle runs
+            rescan: Seconds between cycles when no events arrive
+        """
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.folders = [self.vault_path / folder for folder in folders]
+        self.cycle = cycle
+        self.observer_mode = observer_mode
+        self.debounce = debounce
+        self.rescan = rescan
+
+        self._paths: Set[str] = set()
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._stopping = threading.Event()
+        self._last_event = 0.0
+        self.cycles = 0
+
+    def _wake(self, path: str):
+        with self._lock:
+            self._paths.add(path)
+            self._last_event = time.monotonic()
+        self._event.set()
+
+    def _start_observer(self):
+        mode = self.observer_mode
+        if mode == "auto":
+            mode = "polling" if is_network_path(str(self.vault_path)) else "native"
+        observer = SnapshotPollingObserver() if mode == "polling" else Observer()
+        handler = _WakeHandler(self)
+        for folder in self.folders:
+            folder.mkdir(parents=True, exist_ok=True)
+            observer.schedule(handler, str(folder), recursive=True)
+        observer.start()
+        return observer
+
+    def _settle(self):
+        """Wait until no event arrived for the debounce time (or the maximum passed)."""
+        give_up = time.monotonic() + MAX_DEBOUNCE_SECONDS
+        while not self._stopping.is_set():
+            with self._lock:
+                quiet_at = self._last_event + self.debounce
+            now = time.monotonic()
+            if now >= quiet_at or now >= give_up:
+                return
+            time.sleep(min(quiet_at, give_up) - now)
+
+    def _take_paths(self) -> Set[str]:
+        with self._lock:
+            paths, self._paths = self._paths, set()
+            self._event.clear()
+        return paths
+
+    def _run_cycle(self):
+        try:
+            self.cycle()
+        except Exception as e:
+            # A bad file must not take the daemon down; the next event or rescan retries
+            logger.error(f"Orchestrator cycle failed: {e}")
+        self.cycles += 1
+
+    def run(self):
+        """Run cycles as work arrives until stop() is called or Ctrl+C is pressed."""
+        observer = self._start_observer()
+        logger.info(f"Orchestrator daemon watching {', '.join(f.name for f in self.folders)}")
+        # Whatever arrived while nobody was watching (the observer is already running)
+        self._run_cycle()
+        try:
+            while not self._stopping.is_set():
+                woken = self._event.wait(self.rescan)
+                if self._stopping.is_set():
+                    break
+                if not observer.is_alive():
+                    logger.warning("Observer stopped unexpectedly; restarting it and rescanning")
+                    observer = self._start_observer()
+                    woken = False
+                if woken:
+                    self._settle()
+                    # Events for files a cycle already moved on are its own
+                    if not any(os.path.exists(path) for path in self._take_paths()):
+                        continue
+                else:
+                    self._take_paths()
+                self._run_cycle()
+        except KeyboardInterrupt:
+            logger.info("Orchestrator daemon stopped by user")
+        finally:
+            observer.stop()
+            observer.join()
+
+    def stop(self):
+        """Stop run() after the current cycle."""
+        self._stopping.set()
+        self._event.set()
@@ -0,0 +1,458 @@
+"""
+Action Pipeline for AI Employee
+
+This module is the processing loop shared by the bronze, silver and gold
+orchestrators. An action file goes through a sequence of typed stages:
+
+    ingest -> classify -> plan -> approval gate -> route -> (commit) -> archive
+
+Each tier is a configuration of these stages rather than its own copy of the
+loop. The file is read once, by Ingest, and every later stage works on the
+same in-memory ActionRecord (content, frontmatter, keyword categories, plan,
+approval and archive results):
+
+    pipeline = Pipeline("bronze", [
+        Ingest("bronze"),
+        Pace(bucket),
+        Classify(),
+        Plan(lambda record: write_plan_file(record.path, record.content, plans_dir)),
+        ApprovalGate(lambda record: create_approval_request(...), dashboard),
+        Archive(DoneArchive(vault_path), BRONZE_LOG, dashboard),
+    ])
+    for batch in scheduler.batches(BATCH_SIZE):
+        pipeline.run(batch)
+    pipeline.stats()   # {"ingest": {"records": 12, "seconds": 0.004, "ms_per_record": 0.33}, ...}
+
+Records run through the pipeline a batch at a time, stage by stage, so a
+stage that can share work across files does (Archive puts a batch in one
+date partition). A record that is skipped (e.g. a drop meant for another
+tier) or fails leaves the batch; the others go on. Without an on_error
+callback the first failure is raised, as the loop it replaces did.
+
+With an ActionLedger (see action_ledger.py), the stages that write outputs
+(plan, approval gate, each route handler) are recorded as they finish, and a
+file that comes through again (after a crash, a failed cycle or a returned
+claim) skips the stages it already went through instead of writing a second
+plan or approval request.
+
+Several threads may run records through one pipeline at once (the gold
+orchestrator's workers). When the stages write through a shared WriteBatch,
+the stages that stage outputs on it are exclusive: one thread at a time runs
+them, together with their ledger entries, so a Commit by one thread never
+writes another thread's outputs without the entry that marks them done.
+"""
+import os
+import sys
+import time
+import logging
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, VaultPath, to_vault_path
+from frontmatter import Frontmatter, parse_frontmatter
+from keyword_classifier import classify_text
+from token_bucket import TokenBucket
+from done_archive import DoneArchive
+from action_ledger import ActionLedger
+from write_batch import WriteBatch
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Files run through a pipeline together by the sequential orchestrators
+BATCH_SIZE = 8
+
+
+@dataclass
+class ActionRecord:
+    """One action file on its way through a pipeline"""
+
+    path: VaultPath                       # The file's path in Needs_Action
+    source: Optional[VaultPath] = None    # Where it is read and archived from (a claim folder in gold)
+    content: str = ''
+    meta: Frontmatter = field(default_factory=Frontmatter)
+    categories: Dict[str, Any] = field(default_factory=dict)
+    plan: Any = None
+    needs_approval: bool = False
+    done_file: Optional[VaultPath] = None
+    attachments: Dict[VaultPath, VaultPath] = field(default_factory=dict)
+    skipped: Optional[str] = None         # Why the pipeline left the file alone
+    error: Optional[Exception] = None
+    finished: Optional[Dict[str, Any]] = None  # Stages the ledger has as done (None until looked up)
+
+    def __post_init__(self):
+        if self.source is None:
+            self.source = self.path
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+class Stage:
+    """A step of a pipeline; subclasses implement process() or, to batch, run()"""
+
+    name = "stage"
+    # Recorded in the pipeline's ledger, so it runs once per version of a file
+    durable = False
+    # Run by one thread at a time: stages that stage outputs on a writer
+    # other threads commit
+    exclusive = False
+    # Set by the pipeline
+    ledger: Optional[ActionLedger] = None
+
+    def finished(self, record: ActionRecord) -> Dict[str, Any]:
+        """Stages already done for a record, according to the ledger."""
+        if self.ledger is None:
+            return {}
+        if record.finished is None:
+            record.finished = self.ledger.load(record.path.stem, record.content)
+        return record.finished
+
+    def complete(self, record: ActionRecord, step: str, result: Any = True, new_content: str = None):
+        """Record in the ledger that a step of this stage is done for a record."""
+        if self.ledger is None:
+            return
+        self.ledger.complete(record.path.stem, record.content, step, result, new_content)
+        self.finished(record)[step] = result
+
+    def result(self, record: ActionRecord) -> Any:
+        """What a durable stage records, for restore() on a later run."""
+        return True
+
+    def restore(self, record: ActionRecord, result: Any):
+        """Put a durable stage's recorded result back on a record instead of running it."""
+
+    def run(self, records: List[ActionRecord]):
+        """Process a batch, recording each record's failure on the record."""
+        for record in records:
+            try:
+                self.process(record)
+            except Exception as e:
+                record.error = e
+
+    def process(self, record: ActionRecord):
+        raise NotImplementedError
+
+
+class Ingest(Stage):
+    """Read the file and its frontmatter; leave drops meant for another tier"""
+
+    name = "ingest"
+
+    def __init__(self, tier: str):
+        self.tier = tier
+
+    def process(self, record: ActionRecord):
+        logger.info(f"Processing action file in {self.tier} tier: {record.name}")
+        record.content = record.source.read_text()
+        record.meta = parse_frontmatter(record.content)
+        # Drops sent to another tier by their Inbox folder policy are left for it
+        target_tier = record.meta.get("target_tier", self.tier)
+        if target_tier != self.tier:
+            logger.info(f"Leaving {record.name} for the {target_tier} tier")
+            record.skipped = f"for the {target_tier} tier"
+
+
+class Pace(Stage):
+    """Hold records back to the rate a token bucket allows"""
+
+    name = "pace"
+
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+
+    def process(self, record: ActionRecord):
+        self.bucket.acquire()
+
+
+class Classify(Stage):
+    """Classify the content once for all keyword checks of later stages"""
+
+    name = "classify"
+
+    def process(self, record: ActionRecord):
+        record.categories = classify_text(record.content)
+
+
+class Plan(Stage):
+    """Create the file's plan"""
+
+    name = "plan"
+    durable = True
+    exclusive = True
+
+    def __init__(self, create: Callable[[ActionRecord], Any]):
+        """
+        Args:
+            create: Writes the plan for a record and returns it (kept as record.plan)
+        """
+        self.create = create
+
+    def process(self, record: ActionRecord):
+        record.plan = self.create(record)
+
+    def result(self, record: ActionRecord) -> Any:
+        return record.plan
+
+    def restore(self, record: ActionRecord, result: Any):
+        record.plan = result
+
+
+class ApprovalGate(Stage):
+    """Request human approval for files that need it"""
+
+    name = "approval"
+    durable = True
+    exclusive = True
+
+    def __init__(self, request: Callable[[ActionRecord], bool], dashboard=None):
+        """
+        Args:
+            request: Creates an approval request if the record needs one,
+                returning True if it did
+            dashboard: DashboardWriter whose "Approval Requests" count is raised
+        """
+        self.request = request
+        self.dashboard = dashboard
+
+    def process(self, record: ActionRecord):
+        if record.meta.get("auto_approve") == "true":
+            logger.info(f"{record.name} is auto-approved by its Inbox folder policy")
+            return
+        record.needs_approval = bool(self.request(record))
+        if record.needs_approval and self.dashboard is not None:
+            self.dashboard.increment("Approval Requests")
+
+    def result(self, record: ActionRecord) -> Any:
+        return record.needs_approval
+
+    def restore(self, record: ActionRecord, result: Any):
+        record.needs_approval = bool(result)
+
+
+class Route(Stage):
+    """Hand the file to the integrations its keyword categories call for"""
+
+    name = "route"
+    exclusive = True
+
+    def __init__(self, handlers: Dict[str, Callable[[ActionRecord], Any]]):
+        """
+        Args:
+            handlers: Keyword category -> handler, called in order for each
+                category the record has
+        """
+        self.handlers = handlers
+
+    def process(self, record: ActionRecord):
+        # Each handler is recorded on its own, so a retry after one of them
+        # failed does not repeat the ones that went through
+        for category, handler in self.handlers.items():
+            step = f"{self.name}.{category}"
+            if category in record.categories and step not in self.finished(record):
+                handler(record)
+                self.complete(record, step)
+
+
+class Commit(Stage):
+    """Commit the outputs staged for a batch before the batch is archived"""
+
+    name = "commit"
+    exclusive = True
+
+    def __init__(self, writer: Callable[[], Any]):
+        """
+        Args:
+            writer: Returns the writer the earlier stages wrote through (a
+                WriteBatch is committed; the plain VaultFS has nothing staged)
+        """
+        self.writer = writer
+
+    def run(self, records: List[ActionRecord]):
+        # Archiving moves the file right away, so its plan and ledger entry
+        # must be on disk first or a crash would leave it in Done without them
+        writer = self.writer()
+        if not isinstance(writer, WriteBatch):
+            return
+        try:
+            writer.commit()
+        except Exception as e:
+            for record in records:
+                record.error = e
+
+
+class Archive(Stage):
+    """Record the processing and move the file and its attachments to Done"""
+
+    name = "archive"
+
+    def __init__(self, archive: DoneArchive, log: Optional[str] = None, dashboard=None,
+                 activity: str = "Processed {name}",
+                 on_archived: Optional[Callable[[ActionRecord], Any]] = None):
+        """
+        Args:
+            archive: The vault's Done archive
+            log: Processing log appended to the file before it is archived,
+                with {time} for the processing time (none if None)
+            dashboard: DashboardWriter that records the activity and the
+                "Files Processed" count
+            activity: Dashboard activity line, with {name} for the file name
+            on_archived: Called with each archived record (e.g. to update an index)
+        """
+        self.archive = archive
+        self.log = log
+        self.dashboard = dashboard
+        self.activity = activity
+        self.on_archived = on_archived
+
+    def run(self, records: List[ActionRecord]):
+        # One completion time, so a batch lands in one date partition
+        when = datetime.now()
+        for record in records:
+            try:
+                self._archive(record, when)
+            except Exception as e:
+                record.error = e
+
+    def _archive(self, record: ActionRecord, when: datetime):
+        # A file whose processing log was written before a crash keeps that one
+        if self.log is not None and "log" not in self.finished(record):
+            logged = record.content + self.log.format(time=when.strftime('%Y-%m-%d %H:%M:%S'))
+            self.complete(record, "log", new_content=logged)
+            record.source.write_text(logged)
+        if self.dashboard is not None:
+            self.dashboard.add_activity(self.activity.format(name=record.name))
+            self.dashboard.increment("Files Processed")
+
+        record.done_file, record.attachments = self.archive.archive_action(record.source, when)
+        logger.info(f"Moved {record.name} to Done folder")
+        for original_file in record.attachments:
+            logger.info(f"Moved original file {original_file.name} to Done folder")
+        if self.ledger is not None:
+            self.ledger.forget(record.path.stem)
+        if self.on_archived is not None:
+            self.on_archived(record)
+
+
+class Pipeline:
+    """A tier's sequence of stages, with per-stage timings"""
+
+    def __init__(self, name: str, stages: List[Stage],
+                 on_error: Optional[Callable[[ActionRecord, Exception], Any]] = None,
+                 ledger: Optional[ActionLedger] = None):
+        """
+        Args:
+            name: Pipeline name (the tier)
+            stages: Stages in the order records go through them
+            on_error: Called with a record and its exception when a stage
+                fails on it; if None, the failure is raised
+            ledger: Records finished stages so they are not repeated for a file
+        """
+        self.name = name
+        self.stages = list(stages)
+        self.on_error = on_error
+        self.ledger = ledger
+        for stage in self.stages:
+            stage.ledger = ledger
+        self._timings: Dict[str, List[float]] = {stage.name: [0, 0.0] for stage in self.stages}
+        self._lock = threading.Lock()
+        self._exclusive = threading.RLock()
+
+    def run(self, items: Iterable[Union[ActionRecord, PathLike]]) -> List[ActionRecord]:
+        """
+        Run a batch of files through every stage.
+
+        Args:
+            items: Action files, or records prepared by the caller (e.g. with a source)
+
+        Returns:
+            The records that made it through all stages
+        """
+        live = [item if isinstance(item, ActionRecord) else ActionRecord(to_vault_path(item))
+                for item in items]
+        for stage in self.stages:
+            if not live:
+                break
+            pending = live
+            if self.ledger is not None and stage.durable:
+                pending = []
+                for record in live:
+                    try:
+                        finished = stage.finished(record)
+                    except Exception as e:
+                        record.error = e
+                        continue
+                    if stage.name in finished:
+                        logger.info(f"Skipping {stage.name} of {record.name}: done in an earlier run")
+                        stage.restore(record, finished[stage.name])
+                    else:
+                        pending.append(record)
+
+            with self._exclusive if stage.exclusive else nullcontext():
+                start = time.perf_counter()
+                stage.run(pending)
+                elapsed = time.perf_counter() - start
+
+                if self.ledger is not None and stage.durable:
+                    for record in pending:
+                        if record.error is None and record.skipped is None:
+                            try:
+                                stage.complete(record, stage.name, stage.result(record))
+                            except Exception as e:
+                                record.error = e
+            with self._lock:
+                timing = self._timings[stage.name]
+                timing[0] += len(pending)
+                timing[1] += elapsed
+
+            remaining = []
+            for record in live:
+                if record.error is not None:
+                    if self.on_error is None:
+                        raise record.error
+                    self.on_error(record, record.error)
+                elif record.skipped is None:
+                    remaining.append(record)
+            live = remaining
+        return live
+
+    def stats(self, reset: bool = False) -> Dict[str, Dict[str, float]]:
+        """
+        Records handled and time spent per stage.
+
+        Args:
+            reset: Start counting afresh afterwards (e.g. once per cycle)
+        """
+        with self._lock:
+            stats = {name: {"records": records, "seconds": round(seconds, 3),
+                            "ms_per_record": round(seconds * 1000 / records, 2) if records else 0.0}
+                     for name, (records, seconds) in self._timings.items()}
+            if reset:
+                self._timings = {name: [0, 0.0] for name in self._timings}
+        return stats
+
+
+def main():
+    """Read and classify a Needs_Action folder without changing it, and show the timings."""
+    folder = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.getcwd(), "AI_Employee_Vault", "Needs_Action")
+    pipeline = Pipeline("preview", [Ingest(sys.argv[2] if len(sys.argv) > 2 else "bronze"), Classify()])
+    files = sorted(to_vault_path(folder).glob("*.md"))
+    for start in range(0, len(files), BATCH_SIZE):
+        for record in pipeline.run(files[start:start + BATCH_SIZE]):
+            print(f"{record.name}: {', '.join(sorted(record.categories)) or '-'}")
+    print(pipeline.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Quiescence Tracker for AI Employee
+
+This module decides when a dropped file has been completely written. Scanners,
+browsers and sync clients create a file first and then fill it over seconds or
+minutes, so acting on the first "created" event picks up truncated files.
+
+Every filesystem event for a path is passed to touch(); the tracker then waits
+until the path has been quiet for a debounce window. A path is ready when:
+
+- its writer closed it (inotify IN_CLOSE_WRITE, delivered by watchdog as
+  FileClosedEvent on Linux) and nothing touched it during the window, or
+- without close events (macOS, Windows, polling observers), its size and
+  mtime did not change across a settle interval.
+
+Repeated events for a path are coalesced into one pending entry, so a burst of
+thousands of drops (or thousands of modify events for one large file) costs
+one dictionary update per event. One background thread checks due entries in
+deadline order and hands each ready file to the callback exactly once.
+"""
+import os
+import sys
+import time
+import heapq
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, VaultPath, get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Quiet time after the last event before a path is checked
+DEBOUNCE_SECONDS = 1.0
+
+# Interval over which size and mtime must stay unchanged without a close event
+SETTLE_SECONDS = 2.0
+
+STAT_KEYS = ("events", "coalesced_events", "close_events", "stability_checks",
+             "ready", "vanished", "callback_errors")
+
+ReadyCallback = Callable[[VaultPath, os.stat_result], None]
+
+
+class _Pending:
+    """A path waiting to become quiescent"""
+
+    __slots__ = ('path', 'due', 'closed', 'signature', 'scheduled')
+
+    def __init__(self, path: VaultPath, due: float):
+        self.path = path
+        self.due = due
+        self.closed = False
+        # (size, mtime_ns) at the last stability check
+        self.signature: Optional[Tuple[int, int]] = None
+        # Due time of this entry's heap item, or None if it has none
+        self.scheduled: Optional[float] = None
+
+
+class QuiescenceTracker:
+    """Hands files to a callback once they have stopped changing"""
+
+    def __init__(self, on_ready: ReadyCallback, vault_path: Optional[PathLike] = None,
+                 debounce: float = DEBOUNCE_SECONDS, settle: float = SETTLE_SECONDS):
+        """
+        Args:
+            on_ready: Called as on_ready(path, stat) for every completely written file
+            vault_path: Vault whose backend is used to stat files
+            debounce: Quiet time after the last event for a path
+            settle: Interval over which size and mtime must not change when the
+                path was not closed by its writer
+        """
+        self.fs = get_vault_fs(vault_path)
+        self.on_ready = on_ready
+        self.debounce = debounce
+        self.settle = settle
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: Dict[str, _Pending] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self.stats: Dict[str, int] = dict.fromkeys(STAT_KEYS, 0)
+
+    def _key(self, path: PathLike) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    def _schedule(self, entry: _Pending, key: str):
+        """Push a heap item unless one that fires no later is already queued."""
+        if entry.scheduled is not None and entry.scheduled <= entry.due:
+            return
+        self._counter += 1
+        heapq.heappush(self._heap, (entry.due, self._counter, key))
+        entry.scheduled = entry.due
+        self._wakeup.notify()
+
+    @property
+    def pending(self) -> int:
+        """Number of paths waiting to become quiescent."""
+        with self._lock:
+            return len(self._pending)
+
+    def touch(self, path: PathLike, closed: bool = False):
+        """
+        Record a filesystem event for a path.
+
+        Args:
+            path: File that was created, modified, moved in or closed
+            closed: The event was its writer closing the file
+        """
+        key = self._key(path)
+        now = time.monotonic()
+        with self._lock:
+            self.stats["events"] += 1
+            if closed:
+                self.stats["close_events"] += 1
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = _Pending(self.fs.path(path), now + self.debounce)
+                self._pending[key] = entry
+            else:
+                self.stats["coalesced_events"] += 1
+                entry.due = now + self.debounce
+            # A write after a close reopens the file; only the last event counts
+            entry.closed = closed
+            self._schedule(entry, key)
+
+    def forget(self, path: PathLike):
+        """Stop tracking a path (it was deleted or moved away)."""
+        with self._lock:
+            self._pending.pop(self._key(path), None)
+
+    def _check(self, entry: _Pending) -> Tuple[bool, Optional[os.stat_result]]:
+        """
+        Stat a due entry.
+
+        Returns:
+            (ready, stat); stat is None if the file is gone
+        """
+        try:
+            st = entry.path.stat()
+        except FileNotFoundError:
+            return False, None
+        if entry.closed:
+            return True, st
+        self.stats["stability_checks"] += 1
+        signature = (st.st_size, st.st_mtime_ns)
+        if signature == entry.signature:
+            return True, st
+        entry.signature = signature
+        return False, st
+
+    def _next_due(self) -> Optional[Tuple[str, _Pending]]:
+        """Wait for the next due entry (called with the lock held); None when stopping."""
+        while not self._stopping:
+            if not self._heap:
+                self._wakeup.wait()
+                continue
+            due, _, key = self._heap[0]
+            now = time.monotonic()
+            if due > now:
+                self._wakeup.wait(due - now)
+                continue
+            heapq.heappop(self._heap)
+            entry = self._pending.get(key)
+            if entry is None or entry.scheduled != due:
+                continue
+            entry.scheduled = None
+            if entry.due > now:
+                # Touched again since this item was queued
+                self._schedule(entry, key)
+                continue
+            return key, entry
+        return None
+
+    def _run(self):
+        while True:
+            with self._lock:
+                item = self._next_due()
+                if item is None:
+                    return
+                key, entry = item
+                ready, st = self._check(entry)
+                if st is None:
+                    self.stats["vanished"] += 1
+                    del self._pending[key]
+                    continue
+                if not ready:
+                    entry.due = time.monotonic() + self.settle
+                    self._schedule(entry, key)
+                    continue
+                self.stats["ready"] += 1
+                del self._pending[key]
+
+            try:
+                self.on_ready(entry.path, st)
+            except Exception as e:
+                self.stats["callback_errors"] += 1
+                logger.error(f"Error handling quiescent file {entry.path.name}: {e}")
+
+    def start(self):
+        """Start the background thread that checks due paths."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="QuiescenceTracker", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread; paths still pending are dropped."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._wakeup.notify_all()
+        if thread is not None:
+            thread.join()
+
+
+def main():
+    """Demonstrate quiescence detection on a file written in slow chunks."""
+    vault_path = get_vault_fs().root
+    scratch = vault_path / "Logs"
+    scratch.mkdir(parents=True, exist_ok=True)
+    target = scratch / "quiescence_demo.bin"
+
+    tracker = QuiescenceTracker(
+        lambda path, st: print(f"{path.name} is complete: {st.st_size} bytes"),
+        vault_path, debounce=0.2, settle=0.5)
+    tracker.start()
+
+    with target.open('wb') as f:
+        for _ in range(5):
+            f.write(b"x" * 4096)
+            f.flush()
+            tracker.touch(target)
+            time.sleep(0.1)
+
+    time.sleep(2)
+    tracker.stop()
+    print(f"Tracker stats: {tracker.stats}")
+    target.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,20 @@ Implements the persistence pattern that keeps the AI working autonomously
 until a task is complete by using a Stop hook that intercepts Claude's exit
 and feeds the prompt back.
 """
-import time
 import logging
-from pathlib import Path
 from datetime import datetime
 import json
 import re
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_index import get_vault_index
+from done_archive import DoneArchive
+from vault_fs import get_vault_fs
+from action_ids import new_id
 
 # Configure logging
 logging.basicConfig(
@@ -23,11 +31,14 @@ class RalphWiggumLoop:
     """Implements the Ralph Wiggum persistence pattern for autonomous task completion"""
 
     def __init__(self, vault_path: str, max_iterations: int = 10):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
         self.max_iterations = max_iterations
         self.needs_action = self.vault_path / "Needs_Action"
         self.done = self.vault_path / "Done"
         self.logs = self.vault_path / "Logs"
+        self.index = get_vault_index(self.vault_path)
+        self.archive = DoneArchive(self.vault_path)
 
         # Create necessary directories
         self.logs.mkdir(parents=True, exist_ok=True)
@@ -39,15 +50,12 @@ class RalphWiggumLoop:
         """
         # Check if specific task files have moved to Done
         if task_identifier:
-            # Look for files related to the specific task in Done folder
-            for done_file in self.done.glob(f"*{task_identifier}*"):
+            # Look up files related to the specific task in the Done archive index
+            if self.archive.is_done(task_identifier):
                 return True
 
         # Check if Needs_Action is empty (basic completion check)
-        action_files = list(self.needs_action.glob("*.md"))
-        needs_action_count = len([f for f in action_files if not f.name.startswith('.')])
-
-        return needs_action_count == 0
+        return self.index.count(self.needs_action, suffix=".md") == 0
 
     def check_completion_by_promise(self, output: str) -> bool:
         """
@@ -70,7 +78,7 @@ class RalphWiggumLoop:
             logger.info(f"Iteration {iteration}: Processing task")
 
             # Log the current state
-            needs_action_count = len(list(self.needs_action.glob("*.md")))
+            needs_action_count = self.index.count(self.needs_action, suffix=".md")
             logger.info(f"Files in Needs_Action: {needs_action_count}")
 
             # Check if task is complete (file movement strategy - Gold tier)
@@ -106,13 +114,11 @@ class RalphWiggumLoop:
         logger.info(f"Simulating Claude processing for iteration {iteration}")
 
         # Process any files in Needs_Action
-        action_files = list(self.needs_action.glob("*.md"))
+        action_files = [f for f in self.index.list_files(self.needs_action, suffix=".md")
+                        if ".original." not in f.name]
 
         processed_files = []
         for action_file in action_files:
-            if action_file.name.startswith('.'):
-                continue  # Skip hidden files
-
             # Read and process the action file
             content = action_file.read_text()
 
@@ -123,15 +129,10 @@ class RalphWiggumLoop:
             action_file.write_text(updated_content)
 
             # Move to Done folder (this would trigger completion in Gold tier)
-            done_file = self.done / action_file.name
-
-            # Handle case where file already exists in Done folder
-            if done_file.exists():
-                # Add timestamp to make unique
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-                done_file = self.done / f"{action_file.stem}_{timestamp}{action_file.suffix}"
-
-            action_file.rename(done_file)
+            done_file, archived = self.archive.archive_action(action_file)
+            self.index.move_file(action_file, done_file)
+            for attachment, archived_attachment in archived.items():
+                self.index.move_file(attachment, archived_attachment)
 
             processed_files.append(str(done_file))
             logger.info(f"Moved {action_file.name} to Done folder as {done_file.name}")
@@ -139,7 +140,7 @@ class RalphWiggumLoop:
         return {
             "output": f"Processed {len(processed_files)} files in iteration {iteration}",
             "processed_files": processed_files,
-            "needs_action_remaining": len(list(self.needs_action.glob("*.md")))
+            "needs_action_remaining": self.index.count(self.needs_action, suffix=".md")
         }
 
     def prepare_next_iteration_prompt(self, current_prompt: str, result: dict, iteration: int):
@@ -155,7 +156,7 @@ class RalphWiggumLoop:
         Create a state file that tracks the progress of a specific task.
         """
         if not task_id:
-            task_id = f"task_{int(time.time())}"
+            task_id = f"task_{new_id()}"
 
         state_file = self.logs / f"ralph_loop_state_{task_id}.json"
 
@@ -169,7 +170,7 @@ class RalphWiggumLoop:
             "progress_log": []
         }
 
-        with open(state_file, 'w') as f:
+        with state_file.open('w') as f:
             json.dump(state_data, f, indent=2)
 
         logger.info(f"Created task monitoring file: {state_file.name}")
@@ -177,7 +178,7 @@ class RalphWiggumLoop:
 
 def main():
     """Main function to demonstrate Ralph Wiggum loop functionality"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
@@ -212,7 +213,7 @@ The file should be moved to the Done folder through autonomous processing.
 """)
 
     # Create the Ralph Wiggum loop
-    ralph_loop = RalphWiggumLoop(str(vault_path), max_iterations=5)
+    ralph_loop = RalphWiggumLoop(vault_path, max_iterations=5)
 
     # Create a task monitoring file
     state_file = ralph_loop.create_task_monitoring_file(
@@ -230,7 +231,7 @@ The file should be moved to the Done folder through autonomous processing.
 
     # Update the state file with completion status
     if state_file.exists():
-        with open(state_file, 'r') as f:
+        with state_file.open('r') as f:
             state_data = json.load(f)
 
         state_data.update({
@@ -239,7 +240,7 @@ The file should be moved to the Done folder through autonomous processing.
             "completed_at": datetime.now().isoformat()
         })
 
-        with open(state_file, 'w') as f:
+        with state_file.open('w') as f:
             json.dump(state_data, f, indent=2)
 
     print(f"Ralph Wiggum loop completed: {result}")
@@ -0,0 +1,385 @@
+"""
+Snapshot Polling Observer for AI Employee
+
+This module is a watchdog observer for vaults on network shares (NFS, SMB),
+where inotify events never arrive. It polls, but unlike watchdog's generic
+PollingObserver it does not re-stat the whole tree on every tick:
+
+- Each directory is remembered with its mtime. A directory whose mtime did
+  not change since its last listing has no entries added, removed or renamed,
+  so it is not listed again; its subdirectories still get their own check.
+- A changed directory is listed with os.scandir. Entries keep their
+  (inode, size, mtime_ns) from the snapshot as long as their inode is the
+  same; only new or replaced entries are stat'ed.
+- Files that changed recently ("hot" files, e.g. a drop still being written)
+  are stat'ed every tick until they have been quiet for a few ticks, which
+  produces the modified events a writer would trigger through inotify.
+- Every FULL_SWEEP_SECONDS the whole tree is re-stat'ed once, to catch files
+  rewritten in place long after they went quiet.
+
+The tick interval adapts: it starts at min_interval, doubles on every tick
+that finds nothing (up to max_interval) and drops back as soon as anything
+changes. Renames are recognised by inode and reported as moved events, so a
+handler sees the same created/modified/moved/deleted events as with inotify
+(only close events have no polling equivalent).
+
+    observer = SnapshotPollingObserver(min_interval=1.0, max_interval=10.0)
+    observer.schedule(handler, "/mnt/share/AI_Employee_Vault/Inbox")
+    observer.start()
+"""
+import os
+import sys
+import time
+import logging
+from functools import partial
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from watchdog.events import (
+    DirCreatedEvent, DirDeletedEvent, DirModifiedEvent, DirMovedEvent,
+    FileCreatedEvent, FileDeletedEvent, FileModifiedEvent, FileMovedEvent
+)
+from watchdog.observers.api import BaseObserver, EventEmitter
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+MIN_INTERVAL = 1.0
+MAX_INTERVAL = 10.0
+
+# Ticks a changed file stays hot (stat'ed every tick) after its last change
+HOT_TICKS = 3
+
+# Seconds between ticks that re-stat every entry
+FULL_SWEEP_SECONDS = 60.0
+
+# Filesystem types (as in /proc/mounts) that do not deliver inotify events
+NETWORK_FS_TYPES = ("nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs", "9p", "afs", "ceph", "glusterfs")
+
+STAT_KEYS = ("ticks", "listings", "stats", "events")
+
+
+class Entry(NamedTuple):
+    """What the snapshot knows about a directory entry"""
+    ino: int
+    size: int
+    mtime_ns: int
+    is_dir: bool
+
+
+def is_network_path(path: str) -> bool:
+    """
+    Whether a path lives on a network filesystem (Linux; False elsewhere).
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if the longest matching mount point in /proc/mounts is a network filesystem
+    """
+    path = os.path.realpath(path)
+    best, best_type = "", ""
+    try:
+        with open("/proc/mounts", encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace('\\040', ' ')
+                if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) \
+                        and len(mount_point) > len(best):
+                    best, best_type = mount_point, fields[2]
+    except OSError:
+        return False
+    return best_type in NETWORK_FS_TYPES
+
+
+class SnapshotPollingEmitter(EventEmitter):
+    """Emitter that diffs a scandir snapshot, re-listing only changed directories"""
+
+    def __init__(self, event_queue, watch, timeout: float = MIN_INTERVAL, event_filter=None,
+                 min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL):
+        super().__init__(event_queue, watch, timeout=timeout, event_filter=event_filter)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.interval = min_interval
+
+        # directory -> mtime_ns at its last listing, and directory -> name -> entry
+        self._dir_mtimes: Dict[str, int] = {}
+        self._entries: Dict[str, Dict[str, Entry]] = {}
+        # file path -> ticks it stays hot; directories to re-list regardless of mtime
+        self._hot: Dict[str, int] = {}
+        self._hot_dirs: Dict[str, int] = {}
+        self._last_sweep = 0.0
+        self.stats: Dict[str, int] = dict.fromkeys(STAT_KEYS, 0)
+
+    def on_thread_start(self):
+        root = os.fspath(self.watch.path)
+        self._list_tree(root, [], emit=False)
+        self._last_sweep = time.monotonic()
+
+    # Snapshot maintenance
+    def _list(self, directory: str, full: bool) -> Optional[Dict[str, Entry]]:
+        """List a directory, stat'ing only entries that are new, replaced or hot."""
+        old = self._entries.get(directory, {})
+        new: Dict[str, Entry] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    ino = entry.inode()
+                    known = old.get(entry.name)
+                    if known is not None and known.ino == ino and not full and entry.path not in self._hot:
+                        new[entry.name] = known
+                        continue
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    self.stats["stats"] += 1
+                    new[entry.name] = Entry(ino, st.st_size, st.st_mtime_ns,
+                                            entry.is_dir(follow_symlinks=False))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        self.stats["listings"] += 1
+        return new
+
+    def _list_tree(self, directory: str, events: List, emit: bool):
+        """Add a directory (and, when recursive, its subdirectories) to the snapshot."""
+        pending = [directory]
+        while pending:
+            top = pending.pop()
+            try:
+                mtime_ns = os.stat(top).st_mtime_ns
+            except OSError:
+                continue
+            entries = self._list(top, full=True)
+            if entries is None:
+                continue
+            self._dir_mtimes[top] = mtime_ns
+            self._entries[top] = entries
+            for name, entry in entries.items():
+                path = os.path.join(top, name)
+                if emit:
+                    events.append(DirCreatedEvent(path) if entry.is_dir else FileCreatedEvent(path))
+                    if not entry.is_dir:
+                        self._hot[path] = HOT_TICKS
+                if entry.is_dir and self.watch.is_recursive:
+                    pending.append(path)
+
+    def _drop_tree(self, directory: str, events: List, emit: bool):
+        """Remove a directory's subtree from the snapshot."""
+        prefix = directory + os.sep
+        for top in [d for d in self._entries if d == directory or d.startswith(prefix)]:
+            for name, entry in self._entries.pop(top).items():
+                path = os.path.join(top, name)
+                self._hot.pop(path, None)
+                if emit and not entry.is_dir:
+                    events.append(FileDeletedEvent(path))
+            self._dir_mtimes.pop(top, None)
+            self._hot_dirs.pop(top, None)
+
+    def _move_tree(self, src: str, dst: str):
+        """Re-key a moved directory's subtree in the snapshot."""
+        prefix = src + os.sep
+        for table in (self._entries, self._dir_mtimes, self._hot_dirs):
+            for key in [k for k in table if k == src or k.startswith(prefix)]:
+                table[dst + key[len(src):]] = table.pop(key)
+        for key in [k for k in self._hot if k.startswith(prefix)]:
+            self._hot[dst + key[len(src):]] = self._hot.pop(key)
+
+    # Polling
+    def _tick(self) -> List:
+        self.stats["ticks"] += 1
+        now = time.monotonic()
+        full = now - self._last_sweep >= FULL_SWEEP_SECONDS
+        if full:
+            self._last_sweep = now
+
+        # (inode, is_dir) -> (path, entry) of names that disappeared or appeared
+        created: Dict[Tuple[int, bool], Tuple[str, Entry]] = {}
+        deleted: Dict[Tuple[int, bool], Tuple[str, Entry]] = {}
+        modified: List[str] = []
+        changed_dirs: List[str] = []
+        listed = set()
+
+        for directory in list(self._dir_mtimes):
+            if directory not in self._dir_mtimes:
+                # Dropped earlier in this tick along with its parent
+                continue
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            self.stats["stats"] += 1
+            if not full and mtime_ns == self._dir_mtimes[directory] and directory not in self._hot_dirs:
+                continue
+
+            old = self._entries.get(directory, {})
+            new = self._list(directory, full)
+            if new is None:
+                continue
+            listed.add(directory)
+            if mtime_ns != self._dir_mtimes[directory] or old.keys() != new.keys():
+                changed_dirs.append(directory)
+            self._dir_mtimes[directory] = mtime_ns
+            self._entries[directory] = new
+
+            for name in old.keys() - new.keys():
+                deleted[(old[name].ino, old[name].is_dir)] = (os.path.join(directory, name), old[name])
+            for name, entry in new.items():
+                known = old.get(name)
+                path = os.path.join(directory, name)
+                if known is None or known.ino != entry.ino:
+                    if known is not None:
+                        deleted[(known.ino, known.is_dir)] = (path, known)
+                    created[(entry.ino, entry.is_dir)] = (path, entry)
+                elif not entry.is_dir and (known.size, known.mtime_ns) != (entry.size, entry.mtime_ns):
+                    modified.append(path)
+
+        # Hot files in directories that were not listed: one stat each
+        for path in list(self._hot):
+            directory, name = os.path.split(path)
+            if directory in listed:
+                continue
+            known = self._entries.get(directory, {}).get(name)
+            if known is None:
+                continue
+            try:
+                st = os.stat(path, follow_symlinks=False)
+            except FileNotFoundError:
+                # The directory's mtime changes too; the next listing reports it
+                self._hot_dirs[directory] = HOT_TICKS
+                continue
+            self.stats["stats"] += 1
+            if st.st_ino == known.ino and (st.st_size, st.st_mtime_ns) != (known.size, known.mtime_ns):
+                self._entries[directory][name] = known._replace(size=st.st_size, mtime_ns=st.st_mtime_ns)
+                modified.append(path)
+
+        # A rename keeps inode, size and mtime
+        moves = []
+        for key in [key for key in deleted if key in created]:
+            (src, old_entry), (dst, new_entry) = deleted[key], created[key]
+            if (old_entry.size, old_entry.mtime_ns) == (new_entry.size, new_entry.mtime_ns) or key[1]:
+                moves.append((src, dst, key[1]))
+                del deleted[key], created[key]
+
+        events: List = []
+        touched = set()
+        for (_, is_dir), (path, _) in deleted.items():
+            if is_dir:
+                self._drop_tree(path, events, emit=True)
+                events.append(DirDeletedEvent(path))
+            else:
+                self._hot.pop(path, None)
+                events.append(FileDeletedEvent(path))
+        for path in modified:
+            touched.add(path)
+            events.append(FileModifiedEvent(path))
+        for (_, is_dir), (path, _) in created.items():
+            if is_dir:
+                events.append(DirCreatedEvent(path))
+                if self.watch.is_recursive:
+                    self._list_tree(path, events, emit=True)
+            else:
+                touched.add(path)
+                events.append(FileCreatedEvent(path))
+        for src, dst, is_dir in moves:
+            if is_dir:
+                if self.watch.is_recursive:
+                    self._move_tree(src, dst)
+                events.append(DirMovedEvent(src, dst))
+            else:
+                self._hot.pop(src, None)
+                touched.add(dst)
+                events.append(FileMovedEvent(src, dst))
+        for directory in changed_dirs:
+            events.append(DirModifiedEvent(directory))
+
+        # Changed paths stay hot for HOT_TICKS ticks; coarse directory mtimes
+        # (1-2 s on some shares) may hide a change made right after a listing
+        self._cool(self._hot, touched)
+        self._cool(self._hot_dirs, changed_dirs)
+        return events
+
+    @staticmethod
+    def _cool(hot: Dict[str, int], touched):
+        for path in list(hot):
+            hot[path] -= 1
+            if hot[path] <= 0:
+                del hot[path]
+        for path in touched:
+            hot[path] = HOT_TICKS
+
+    def queue_events(self, timeout: float):
+        # The tick interval plays the role of the timeout, as for watchdog's PollingEmitter
+        if self.stopped_event.wait(self.interval):
+            return
+        if not self.should_keep_running():
+            return
+        if not os.path.isdir(self.watch.path):
+            self.queue_event(DirDeletedEvent(os.fspath(self.watch.path)))
+            self.stop()
+            return
+
+        events = self._tick()
+        for event in events:
+            self.queue_event(event)
+        self.stats["events"] += len(events)
+
+        if events or self._hot:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * 2)
+
+
+class SnapshotPollingObserver(BaseObserver):
+    """Observer that polls with SnapshotPollingEmitter (for network shares)"""
+
+    def __init__(self, min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL):
+        """
+        Args:
+            min_interval: Seconds between ticks while things change
+            max_interval: Longest interval the observer backs off to when idle
+        """
+        emitter_class = partial(SnapshotPollingEmitter, min_interval=min_interval, max_interval=max_interval)
+        super().__init__(emitter_class, timeout=min_interval)
+
+    def stats(self) -> Dict[str, int]:
+        """Tick, listing, stat and event counters summed over all watches."""
+        totals = dict.fromkeys(STAT_KEYS, 0)
+        for emitter in self.emitters:
+            for key, value in emitter.stats.items():
+                totals[key] += value
+        return totals
+
+
+def main():
+    """Print the events for a directory (the vault's Inbox by default) until Ctrl+C."""
+    from watchdog.events import FileSystemEventHandler
+
+    class PrintingHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            print(f"{event.event_type}: {event.src_path}" + (f" -> {event.dest_path}" if event.dest_path else ""))
+
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.getcwd(), "AI_Employee_Vault", "Inbox")
+    observer = SnapshotPollingObserver()
+    observer.schedule(PrintingHandler(), path, recursive=True)
+    observer.start()
+    print(f"Polling {path} (network filesystem: {is_network_path(path)})")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        observer.stop()
+    observer.join()
+    print(f"Observer stats: {observer.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,10 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from frontmatter import parse_frontmatter, update_frontmatter
+from vault_fs import get_vault_fs
+from action_ids import create_new_file, new_id
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,7 +30,9 @@ class SocialMediaIntegrator:
     """Handles Facebook and Instagram integration with approval workflow"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.writer = self.fs
         self.needs_action = self.vault_path / "Needs_Action"
         self.social_posts = self.vault_path / "Social_Posts"
         self.pending_approval_dir = self.vault_path / "Plans" / "Pending_Approval" / "Social_Media"
@@ -47,7 +53,7 @@ class SocialMediaIntegrator:
         """
         logger.info(f"Creating Facebook post: {content[:50]}...")
 
-        post_filename = f"FB_POST_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        post_filename = f"FB_POST_{new_id()}.md"
         post_path = self.social_posts / post_filename
 
         post_content = f"""---
@@ -75,7 +81,7 @@ platform: facebook
 ## Notes
 This post was automatically generated by the AI Employee for Facebook.
 """
-        post_path.write_text(post_content, encoding='utf-8')
+        self.writer.write_text(post_path, post_content, encoding='utf-8')
 
         return {
             "success": True,
@@ -97,7 +103,7 @@ This post was automatically generated by the AI Employee for Facebook.
         """
         logger.info(f"Creating Instagram post: {content[:50]}...")
 
-        post_filename = f"IG_POST_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        post_filename = f"IG_POST_{new_id()}.md"
         post_path = self.social_posts / post_filename
 
         if not caption:
@@ -129,7 +135,7 @@ image_path: {image_path}
 ## Notes
 This post was automatically generated by the AI Employee for Instagram.
 """
-        post_path.write_text(post_content, encoding='utf-8')
+        self.writer.write_text(post_path, post_content, encoding='utf-8')
 
         return {
             "success": True,
@@ -152,16 +158,7 @@ This post was automatically generated by the AI Employee for Instagram.
         logger.info(f"Scheduling {platform} post: {post_file.name}")
 
         # Update the post file with scheduling information
-        content = post_file.read_text()
-        updated_content = content.replace(
-            'scheduled: null',
-            f'scheduled: {schedule_time}'
-        ).replace(
-            'status: draft',
-            'status: scheduled'
-        )
-
-        post_file.write_text(updated_content)
+        update_frontmatter(post_file, {'scheduled': schedule_time, 'status': 'scheduled'})
 
         return {
             "success": True,
@@ -205,7 +202,7 @@ The future is bright when innovation meets dedication. 🚀
                 result = self.create_instagram_post(content, f"images/{topic.replace(' ', '_').lower()}_image.jpg")
             else:  # Twitter would be handled separately
                 # Create a generic post for other platforms
-                post_filename = f"{platform.upper()}_POST_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+                post_filename = f"{platform.upper()}_POST_{new_id()}.md"
                 post_path = self.social_posts / post_filename
                 post_content = f"""---
 type: {platform}_post
@@ -228,7 +225,7 @@ platform: {platform}
 ## Notes
 This post was automatically generated by the AI Employee for {platform}.
 """
-                post_path.write_text(post_content, encoding='utf-8')
+                self.writer.write_text(post_path, post_content, encoding='utf-8')
                 result = {
                     "success": True,
                     "post_id": post_filename,
@@ -265,7 +262,7 @@ This post was automatically generated by the AI Employee for {platform}.
         }
 
         # Create a summary file
-        summary_filename = f"Social_Media_Summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        summary_filename = f"Social_Media_Summary_{new_id()}.md"
         summary_path = self.social_posts / summary_filename
 
         summary_content = f"""---
@@ -290,7 +287,7 @@ created: {datetime.now().isoformat()}
 ## Notes
 This summary was automatically generated by the AI Employee.
 """
-        summary_path.write_text(summary_content)
+        create_new_file(summary_path, summary_content)
 
         return summary
 
@@ -313,18 +310,13 @@ This summary was automatically generated by the AI Employee.
         content = post_file.read_text()
         
         # Extract platform from frontmatter
-        platform = 'unknown'
-        for line in content.split('\n'):
-            if line.startswith('platform:'):
-                platform = line.split(':', 1)[1].strip()
-                break
+        platform = parse_frontmatter(content).get('platform', 'unknown')
         
         # Extract post content
         post_text = self._extract_post_content(content)
         
         # Create approval request
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        approval_filename = f"SOCIAL_APPROVAL_{platform.upper()}_{timestamp}.md"
+        approval_filename = f"SOCIAL_APPROVAL_{platform.upper()}_{new_id()}.md"
         approval_path = self.pending_approval_dir / approval_filename
         
         approval_content = f"""---
@@ -372,12 +364,11 @@ reason: {reason}
 *Generated by AI Employee - Human-in-the-Loop Approval Required*
 """
         
-        approval_path.write_text(approval_content, encoding='utf-8')
+        create_new_file(approval_path, approval_content)
         logger.info(f"Created approval request: {approval_path.name}")
         
         # Update post status
-        updated_content = content.replace('status: draft', 'status: pending_approval')
-        post_file.write_text(updated_content, encoding='utf-8')
+        update_frontmatter(post_file, {'status': 'pending_approval'})
         
         return approval_path
 
@@ -400,12 +391,12 @@ reason: {reason}
 
 def main():
     """Main function to demonstrate social media integration with approval workflow"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
 
-    integrator = SocialMediaIntegrator(str(vault_path))
+    integrator = SocialMediaIntegrator(vault_path)
 
     print("=== Social Media Integration with Approval Workflow ===\n")
 
@@ -4,20 +4,23 @@ Social Media Approval Workflow for AI Employee
 This module handles the approval workflow for social media posts.
 Posts are created as drafts and require human approval before publishing.
 """
-import time
 import logging
 from pathlib import Path
 from datetime import datetime
 import json
 import sys
 import os
-import shutil
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gold'))
 
 from config_loader import get_env_variable
+from vault_index import get_vault_index
+from change_journal import get_change_journal, net_changes
+from frontmatter import read_frontmatter, update_frontmatter_field
+from vault_fs import get_vault_fs, to_vault_path
+from action_ids import create_new_file, new_id
 
 # Configure logging
 logging.basicConfig(
@@ -30,7 +33,8 @@ class SocialMediaApprovalWorkflow:
     """Handles approval workflow for social media posts"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
         
         # Directories for approval workflow
         self.social_posts_dir = self.vault_path / "Social_Posts"
@@ -44,6 +48,10 @@ class SocialMediaApprovalWorkflow:
                          self.rejected_dir, self.published_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
         
+        self.index = get_vault_index(self.vault_path)
+        self.journal = get_change_journal(self.vault_path)
+        self._approved_cursor = None
+
         # Platform integrations
         self.twitter_api_configured = self._check_twitter_credentials()
         self.linkedin_api_configured = self._check_linkedin_credentials()
@@ -83,8 +91,7 @@ class SocialMediaApprovalWorkflow:
         post_text = self._extract_post_content(post_content)
 
         # Create approval request file
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        approval_filename = f"SOCIAL_APPROVAL_{platform.upper()}_{timestamp}.md"
+        approval_filename = f"SOCIAL_APPROVAL_{platform.upper()}_{new_id()}.md"
         approval_path = self.pending_approval_dir / approval_filename
 
         approval_content = f"""---
@@ -133,11 +140,11 @@ requires_api: {self._platform_requires_api(platform)}
 *This approval request was automatically generated by the AI Employee*
 """
         
-        approval_path.write_text(approval_content)
+        create_new_file(approval_path, approval_content)
         logger.info(f"Created approval request: {approval_path.name}")
         
         # Update the original post status
-        self._update_post_status(post_file, 'pending_approval')
+        update_frontmatter_field(post_file, 'status', 'pending_approval')
         
         return approval_path
 
@@ -163,31 +170,12 @@ requires_api: {self._platform_requires_api(platform)}
         api_platforms = ['twitter', 'linkedin']
         return platform.lower() in api_platforms
 
-    def _update_post_status(self, post_file: Path, status: str):
-        """Update the status field in a post file"""
-        if not post_file.exists():
-            return
-
-        content = post_file.read_text(encoding='utf-8')
-
-        # Replace status line
-        if 'status:' in content:
-            content = content.replace(
-                f"status: {content.split('status:')[1].split('\n')[0].strip()}",
-                f"status: {status}"
-            )
-        else:
-            # Add status after type line
-            content = content.replace(
-                'type:',
-                f'type:\nstatus: {status}\noriginal_type:'
-            )
-        
-        post_file.write_text(content)
-
     def process_approved_posts(self) -> dict:
         """
         Process all approved posts and publish them.
+
+        Only approvals that arrived since the last run (per the change journal)
+        and approvals that could not be published before are looked at.
         
         Returns:
             Dictionary with processing results
@@ -200,19 +188,17 @@ requires_api: {self._platform_requires_api(platform)}
             'details': []
         }
         
-        # Get all approved files
-        approved_files = list(self.approved_dir.glob("SOCIAL_APPROVAL_*.md"))
+        # Get the approved files to publish
+        approved_files = self._approved_files_to_process()
         
         for approval_file in approved_files:
             results['processed'] += 1
 
             try:
-                # Read approval file
-                content = approval_file.read_text(encoding='utf-8')
-
-                # Extract metadata
-                platform = self._extract_metadata(content, 'platform')
-                source_file = Path(self._extract_metadata(content, 'source_file'))
+                # Read approval metadata (header only)
+                metadata = read_frontmatter(approval_file)
+                platform = metadata.get('platform')
+                source_file = to_vault_path(metadata.get('source_file'))
 
                 # Get post content
                 if source_file.exists():
@@ -227,7 +213,7 @@ requires_api: {self._platform_requires_api(platform)}
                         
                         # Move to published folder
                         published_file = self.published_dir / f"PUBLISHED_{source_file.name}"
-                        shutil.copy2(source_file, published_file)
+                        self.fs.copy(source_file, published_file)
                         
                         # Add publication record
                         self._add_publication_record(published_file, publish_result)
@@ -242,6 +228,7 @@ requires_api: {self._platform_requires_api(platform)}
                         # Move approval file to archived
                         archived_approval = self.approved_dir / f"ARCHIVED_{approval_file.name}"
                         approval_file.rename(archived_approval)
+                        self.index.move_file(approval_file, archived_approval)
                         
                     else:
                         results['failed'] += 1
@@ -269,9 +256,32 @@ requires_api: {self._platform_requires_api(platform)}
                     'error': str(e)
                 })
                 logger.error(f"Error processing approval {approval_file.name}: {e}")
+
+        # Approvals that were not published (and archived) are retried next run
+        cursor = self._approved_cursor
+        cursor.state["retry"] = [f.name for f in approved_files if f.exists()]
+        cursor.commit()
         
         return results
 
+    def _approved_files_to_process(self) -> list:
+        """Approved files that are new since the last run, plus the ones to retry."""
+        if self._approved_cursor is None:
+            self._approved_cursor = self.journal.cursor("social_approval")
+        cursor = self._approved_cursor
+
+        if cursor.is_new:
+            # First run: list the folder once, then follow the journal
+            cursor.seek_end()
+            return self.index.list_files(self.approved_dir, prefix="SOCIAL_APPROVAL_", suffix=".md")
+
+        # Approvals are usually moved here by hand; reconciling the folder journals them
+        self.index.sync_folder(self.approved_dir)
+        changes = net_changes(cursor.read(), "Plans/Approved/Social_Media", "SOCIAL_APPROVAL_*.md")
+        names = set(cursor.state.get("retry", []))
+        names.update(rel_path.rsplit('/', 1)[-1] for rel_path, exists in changes.items() if exists)
+        return [self.approved_dir / name for name in sorted(names) if (self.approved_dir / name).exists()]
+
     def _publish_post(self, platform: str, post_text: str, full_content: str) -> dict:
         """
         Publish a post to the specified platform.
@@ -395,7 +405,7 @@ requires_api: {self._platform_requires_api(platform)}
         return {
             'success': True,
             'platform': platform,
-            'post_id': f'SIMULATED_{int(time.time())}',
+            'post_id': f'SIMULATED_{new_id()}',
             'note': f'{platform} posting simulated - manual posting required'
         }
 
@@ -418,20 +428,13 @@ requires_api: {self._platform_requires_api(platform)}
         content += pub_info
         published_file.write_text(content, encoding='utf-8')
 
-    def _extract_metadata(self, content: str, field: str) -> str:
-        """Extract a metadata field from markdown frontmatter"""
-        for line in content.split('\n'):
-            if line.startswith(f'{field}:'):
-                return line.split(':', 1)[1].strip()
-        return ''
-
     def get_approval_status(self) -> dict:
         """Get current status of all approval requests"""
         return {
-            'pending': len(list(self.pending_approval_dir.glob("*.md"))),
-            'approved': len(list(self.approved_dir.glob("*.md"))),
-            'rejected': len(list(self.rejected_dir.glob("*.md"))),
-            'published': len(list(self.published_dir.glob("*.md")))
+            'pending': self.index.count(self.pending_approval_dir, suffix=".md"),
+            'approved': self.index.count(self.approved_dir, suffix=".md"),
+            'rejected': self.index.count(self.rejected_dir, suffix=".md"),
+            'published': self.index.count(self.published_dir, suffix=".md")
         }
 
     def create_approval_dashboard(self) -> Path:
@@ -477,14 +480,13 @@ generated: {datetime.now().isoformat()}
 
 """
 
-        # List pending approvals
-        pending_files = list(self.pending_approval_dir.glob("*.md"))
-        if pending_files:
-            for pf in pending_files:
-                content = pf.read_text(encoding='utf-8')
-                platform = self._extract_metadata(content, 'platform')
-                created = self._extract_metadata(content, 'created')
-                dashboard_content += f"- **{pf.name}** ({platform}) - Created: {created}\n"
+        # List pending approvals (platform and created come from the index)
+        pending_records = self.index.query(self.pending_approval_dir, suffix=".md")
+        if pending_records:
+            for record in pending_records:
+                platform = record['platform'] or ''
+                created = record['created'] or ''
+                dashboard_content += f"- **{record['name']}** ({platform}) - Created: {created}\n"
         else:
             dashboard_content += "*No pending approvals*\n"
 
@@ -498,9 +500,9 @@ generated: {datetime.now().isoformat()}
 
 def main():
     """Main function to demonstrate approval workflow"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
     
-    workflow = SocialMediaApprovalWorkflow(str(vault_path))
+    workflow = SocialMediaApprovalWorkflow(vault_path)
     
     print("=== Social Media Approval Workflow Demo ===\n")
     
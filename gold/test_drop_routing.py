@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for content sniffing in the drop routing table
+
+Each test sniffs a file name and header against the bundled drop_routes.json.
+
+    python -m unittest gold/test_drop_routing.py
+"""
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from drop_routing import RoutingTable
+
+BMP_HEADER = b'BM' + (70).to_bytes(4, 'little') + b'\0\0\0\0' + (54).to_bytes(4, 'little') + (40).to_bytes(4, 'little')
+MP3_HEADER = b'ID3\x04\x00\x00\x00\x00\x01\x0a' + b'\xff\xfb\x90\x00'
+
+
+class SniffTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = RoutingTable.from_file()
+
+    def test_text_extension_wins_over_short_signature(self):
+        self.assertEqual(self.table.sniff("patients.csv", b"BMI,age,weight\n24.1,38,71\n"), "csv")
+        self.assertEqual(self.table.sniff("tags.csv", b"ID3,title,artist\n1,Intro,Band\n"), "csv")
+        self.assertEqual(self.table.sniff("notes.txt", b"BM called about the invoice\n"), "text")
+
+    def test_short_signature_ignored_in_text_without_extension(self):
+        self.assertEqual(self.table.sniff("README", b"BM notes for the team\n"), "text")
+        self.assertEqual(self.table.sniff("ID3_tags", b"ID3 tags to fix\n"), "text")
+
+    def test_binary_header_still_sniffed(self):
+        self.assertEqual(self.table.sniff("image.bmp", BMP_HEADER), "bmp")
+        self.assertEqual(self.table.sniff("scan", BMP_HEADER), "bmp")
+        self.assertEqual(self.table.sniff("song.mp3", MP3_HEADER), "mp3")
+        # A binary file with a text extension is still routed by content
+        self.assertEqual(self.table.sniff("notes.txt", BMP_HEADER), "bmp")
+
+    def test_content_wins_over_binary_extension(self):
+        self.assertEqual(self.table.sniff("report.pdf", b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR"), "png")
+
+    def test_container_extension(self):
+        self.assertEqual(self.table.sniff("budget.xlsx", b"PK\x03\x04\x14\x00\x06\x00"), "xlsx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for the staged-state semantics of WriteBatch
+
+Each test stages operations on a batch over a scratch vault, checks what the
+batch reports before commit, and checks what is on disk after it.
+
+    python -m unittest gold/test_write_batch.py
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import get_vault_fs
+from write_batch import WriteBatch
+
+
+class WriteBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="write_batch_test_")
+        self.vault = get_vault_fs(self.root).root
+        self.batch = WriteBatch(self.vault, durable=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _files(self):
+        return sorted(entry.name for entry in os.scandir(self.root) if not entry.name.startswith('.'))
+
+    def _read(self, name):
+        with open(os.path.join(self.root, name), encoding='utf-8') as f:
+            return f.read()
+
+    def test_rename_over_existing(self):
+        (self.vault / "A").write_text("A")
+        (self.vault / "B").write_text("B")
+        self.batch.rename(self.vault / "A", self.vault / "B")
+        self.assertEqual(self.batch.read_text(self.vault / "B"), "A")
+        self.assertFalse(self.batch.exists(self.vault / "A"))
+
+        self.batch.commit()
+        self.assertEqual(self._files(), ["B"])
+        self.assertEqual(self._read("B"), "A")
+
+    def test_rename_over_existing_then_on(self):
+        (self.vault / "A").write_text("A")
+        (self.vault / "B").write_text("B")
+        self.batch.rename(self.vault / "A", self.vault / "B")
+        self.batch.rename(self.vault / "B", self.vault / "C")
+        self.assertFalse(self.batch.exists(self.vault / "B"))
+        self.assertEqual(self.batch.read_text(self.vault / "C"), "A")
+
+        self.batch.commit()
+        self.assertEqual(self._files(), ["C"])
+        self.assertEqual(self._read("C"), "A")
+
+    def test_write_then_rename_over_existing(self):
+        (self.vault / "B").write_text("B")
+        self.batch.write_text(self.vault / "A", "new")
+        self.batch.rename(self.vault / "A", self.vault / "B")
+
+        self.batch.commit()
+        self.assertEqual(self._files(), ["B"])
+        self.assertEqual(self._read("B"), "new")
+
+    def test_delete_after_move(self):
+        (self.vault / "A").write_text("A")
+        self.batch.rename(self.vault / "A", self.vault / "B")
+        self.batch.unlink(self.vault / "B")
+        self.assertFalse(self.batch.exists(self.vault / "A"))
+        self.assertFalse(self.batch.exists(self.vault / "B"))
+        self.assertEqual(self.batch.glob(self.vault, "*"), [])
+
+        self.batch.commit()
+        self.assertEqual(self._files(), [])
+
+    def test_write_after_delete(self):
+        (self.vault / "A").write_text("old")
+        self.batch.unlink(self.vault / "A")
+        self.batch.write_text(self.vault / "A", "new")
+        self.assertEqual(self.batch.read_text(self.vault / "A"), "new")
+
+        self.batch.commit()
+        self.assertEqual(self._read("A"), "new")
+
+    def test_glob_sees_staged_state(self):
+        (self.vault / "A.md").write_text("A")
+        (self.vault / "B.md").write_text("B")
+        self.batch.write_text(self.vault / "C.md", "C")
+        self.batch.unlink(self.vault / "B.md")
+        self.batch.rename(self.vault / "A.md", self.vault / "D.txt")
+        names = sorted(path.name for path in self.batch.glob(self.vault, "*.md"))
+        self.assertEqual(names, ["C.md"])
+
+    def test_coalesced_writes(self):
+        for i in range(5):
+            self.batch.write_text(self.vault / "A", f"revision {i}")
+        stats = self.batch.commit()
+        self.assertEqual(stats["files_written"], 1)
+        self.assertEqual(self._read("A"), "revision 4")
+
+    def test_commit_after_exception(self):
+        with self.assertRaises(RuntimeError):
+            with WriteBatch(self.vault, durable=False) as batch:
+                batch.write_text(self.vault / "A", "staged before the error")
+                raise RuntimeError("cycle failed")
+        self.assertEqual(self._read("A"), "staged before the error")
+        self.assertEqual(os.listdir(self.root), ["A"])
+
+    def test_failed_commit_keeps_unapplied_operations(self):
+        (self.vault / "D").write_text("D")
+        self.batch.write_text(self.vault / "A", "A")
+        self.batch.write_text(self.vault / "B", "B")
+        self.batch.rename(self.vault / "D", self.vault / "C")
+
+        rename = self.batch.fs.rename
+
+        def failing_rename(src, dst):
+            if os.path.basename(dst) == "B":
+                raise OSError("disk full")
+            return rename(src, dst)
+
+        self.batch.fs.rename = failing_rename
+        try:
+            with self.assertRaises(OSError):
+                self.batch.commit()
+        finally:
+            self.batch.fs.rename = rename
+
+        self.assertEqual(self._files(), ["A", "D"])
+        self.assertEqual(self.batch.pending, 2)
+        self.assertEqual(self.batch.read_text(self.vault / "B"), "B")
+        self.assertFalse(self.batch.exists(self.vault / "D"))
+
+        self.batch.commit()
+        self.assertEqual(self.batch.pending, 0)
+        self.assertEqual(sorted(os.listdir(self.root)), ["A", "B", "C"])
+        self.assertEqual(self._read("B"), "B")
+        self.assertEqual(self._read("C"), "D")
+
+    def test_rename_missing_source(self):
+        with self.assertRaises(FileNotFoundError):
+            self.batch.rename(self.vault / "A", self.vault / "B")
+
+
+if __name__ == "__main__":
+    unittest.main()
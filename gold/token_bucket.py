@@ -0,0 +1,110 @@
+"""
+Token Bucket for AI Employee
+
+This module paces work without fixed sleeps. A bucket holds up to `burst`
+tokens and gains `rate` tokens per second; taking a token when none is left
+waits exactly until the next one is due:
+
+    bucket = TokenBucket(rate=2.0, burst=10)
+    for item in items:
+        bucket.acquire()     # the first 10 go at once, then 2 per second
+        handle(item)
+
+An idle period refills the bucket, so a burst of new work after a quiet
+spell is handled immediately, while a long backlog is still spread out at
+the configured rate.
+"""
+import time
+import logging
+import threading
+from typing import Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate"""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: float = DEFAULT_BURST):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Most tokens the bucket holds (and the size of the first burst)
+
+        Raises:
+            ValueError: If rate is not positive or burst is below one token
+        """
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, not {rate}")
+        if burst < 1:
+            raise ValueError(f"Token bucket burst must be at least 1, not {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens: float) -> float:
+        """Take tokens if available; otherwise return the seconds until they are."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens without waiting, returning False if there are not enough."""
+        with self._lock:
+            return self._take(tokens) == 0.0
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting until they are available.
+
+        Args:
+            tokens: Tokens to take (at most burst)
+            timeout: Most seconds to wait (None waits as long as needed)
+
+        Returns:
+            True once the tokens were taken, False if that would exceed the timeout
+        """
+        if tokens > self.burst:
+            raise ValueError(f"Cannot take {tokens} tokens from a bucket of {self.burst}")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                wait = self._take(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def available(self) -> float:
+        """Tokens that could be taken right now."""
+        with self._lock:
+            now = time.monotonic()
+            return min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+
+
+def main():
+    """Show the pacing of a burst followed by a backlog."""
+    bucket = TokenBucket(rate=5.0, burst=3)
+    start = time.monotonic()
+    for i in range(8):
+        bucket.acquire()
+        print(f"item {i} at {time.monotonic() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,10 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from frontmatter import update_frontmatter
+from vault_fs import get_vault_fs
+from action_ids import create_new_file, new_id
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,7 +29,9 @@ class TwitterIntegrator:
     """Handles Twitter (X) integration"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
+        self.writer = self.fs
         self.needs_action = self.vault_path / "Needs_Action"
         self.social_posts = self.vault_path / "Social_Posts"
         self.social_posts.mkdir(exist_ok=True)
@@ -49,7 +55,7 @@ class TwitterIntegrator:
 
         logger.info(f"Creating Twitter post: {content[:50]}...")
 
-        tweet_filename = f"TWITTER_POST_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        tweet_filename = f"TWITTER_POST_{new_id()}.md"
         post_path = self.social_posts / tweet_filename
 
         post_content = f"""---
@@ -85,7 +91,7 @@ character_count: {len(content)}
 ## Notes
 This tweet was automatically generated by the AI Employee for Twitter/X.
 """
-        post_path.write_text(post_content, encoding='utf-8')
+        self.writer.write_text(post_path, post_content, encoding='utf-8')
 
         return {
             "success": True,
@@ -150,16 +156,7 @@ This tweet was automatically generated by the AI Employee for Twitter/X.
         logger.info(f"Scheduling tweet: {tweet_file.name} for {schedule_time}")
 
         # Update the tweet file with scheduling information
-        content = tweet_file.read_text()
-        updated_content = content.replace(
-            'status: draft',
-            'status: scheduled'
-        ).replace(
-            'scheduled: null',
-            f'scheduled: {schedule_time}'
-        )
-
-        tweet_file.write_text(updated_content)
+        update_frontmatter(tweet_file, {'status': 'scheduled', 'scheduled': schedule_time})
 
         return {
             "success": True,
@@ -195,7 +192,7 @@ This tweet was automatically generated by the AI Employee for Twitter/X.
             f"That's my take on {main_topic}. What's yours? #AI #Business"
         )
 
-        thread_filename = f"TWITTER_THREAD_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        thread_filename = f"TWITTER_THREAD_{new_id()}.md"
         thread_path = self.social_posts / thread_filename
 
         thread_text = "\n\n".join(thread_content)
@@ -230,7 +227,7 @@ tweet_count: {len(thread_content)}
 ## Notes
 This thread was automatically generated by the AI Employee for Twitter/X.
 """
-        thread_path.write_text(thread_content_md, encoding='utf-8')
+        self.writer.write_text(thread_path, thread_content_md, encoding='utf-8')
 
         return {
             "success": True,
@@ -371,7 +368,7 @@ This thread was automatically generated by the AI Employee for Twitter/X.
                 tweet_id = response.data['id']
 
             # Create a record of the posted tweet
-            tweet_filename = f"TWITTER_POSTED_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            tweet_filename = f"TWITTER_POSTED_{new_id()}.md"
             post_path = self.social_posts / tweet_filename
 
             post_content = f"""---
@@ -439,7 +436,7 @@ Tweet ID: {tweet_id}
         }
 
         # Create a Twitter summary file
-        summary_filename = f"Twitter_Summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        summary_filename = f"Twitter_Summary_{new_id()}.md"
         summary_path = self.social_posts / summary_filename
 
         summary_content = f"""---
@@ -466,18 +463,18 @@ created: {datetime.now().isoformat()}
 ## Notes
 This Twitter summary was automatically generated by the AI Employee.
 """
-        summary_path.write_text(summary_content)
+        create_new_file(summary_path, summary_content)
 
         return summary
 
 def main():
     """Main function to demonstrate Twitter integration"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
 
-    twitter = TwitterIntegrator(str(vault_path))
+    twitter = TwitterIntegrator(vault_path)
 
     # Create a sample tweet
     print("Creating sample tweet...")
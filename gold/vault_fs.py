@@ -0,0 +1,1100 @@
+"""
+Vault Filesystem for AI Employee
+
+This module is the one filesystem interface that every tier and agent skill
+goes through. A VaultFS backend hands out VaultPath objects, which behave like
+pathlib.Path (read_text, write_text, rename, glob, mkdir, ...) but route every
+operation through the backend they came from:
+
+- LocalVaultFS: the vault on disk. Directory listings use os.scandir and hand
+  back the DirEntry objects themselves, so their cached stat results are reused.
+- MemoryVaultFS: a vault held entirely in memory. Benchmarks and tests of the
+  orchestrators run on it without any disk I/O, which separates processing
+  overhead from filesystem cost.
+
+get_vault_fs() resolves a vault path to its backend. Memory vaults are
+registered under their root path, so code that is handed a plain string
+(e.g. GoldTierOrchestrator("/memory/AI_Employee_Vault")) uses the in-memory
+backend without knowing about it. Without an explicit path the vault comes
+from the VAULT_PATH environment variable, or AI_Employee_Vault at the
+repository root, so it no longer depends on the current working directory.
+
+Backends report every file they create, update, move or delete to the change
+listeners registered with add_change_listener() (see change_journal.py).
+Hidden files (temp siblings, indexes) are not reported, and an atomic replace
+through a hidden temp file is reported as a write of its target.
+
+relocate() moves a file and returns its size and SHA-256. A rename leaves the
+data where it is; a move across devices hashes the content while copying it,
+so large files are read exactly once either way.
+"""
+import io
+import os
+import re
+import sys
+import stat
+import errno
+import shutil
+import hashlib
+import fnmatch
+import logging
+import posixpath
+import tempfile
+import threading
+import time
+from pathlib import Path, PurePath
+from contextlib import contextmanager
+from collections import namedtuple
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_VAULT_NAME = "AI_Employee_Vault"
+
+# Root used for in-memory vaults when none is given
+DEFAULT_MEMORY_ROOT = "/memory/" + DEFAULT_VAULT_NAME
+
+_GLOB_MAGIC = re.compile(r'[*?[]')
+
+DiskUsage = namedtuple("DiskUsage", ["total", "used", "free"])
+
+PathLike = Union[str, os.PathLike]
+
+# Registered change listeners: (root prefix, excluded prefixes, callback)
+ChangeCallback = Callable[[str, str, Optional[str]], None]
+_change_listeners: List[Tuple[str, Tuple[str, ...], ChangeCallback]] = []
+
+
+class FileStat(NamedTuple):
+    """The subset of os.stat_result the in-memory backend reports"""
+    st_mode: int
+    st_size: int
+    st_mtime_ns: int
+
+    @property
+    def st_mtime(self) -> float:
+        return self.st_mtime_ns / 1e9
+
+    @property
+    def st_ctime(self) -> float:
+        return self.st_mtime
+
+    @property
+    def st_atime(self) -> float:
+        return self.st_mtime
+
+
+class Fingerprint(NamedTuple):
+    """Size and SHA-256 of a file's content, plus its first bytes"""
+    size: int
+    sha256: str
+    head: bytes
+
+
+# Buffer size for streaming hashes and copies
+COPY_BUFSIZE = 1024 * 1024
+
+
+def _stream(readinto: Callable[[memoryview], int], head: int = 0,
+            write: Callable[[memoryview], object] = None) -> Fingerprint:
+    """
+    Hash a stream in one pass through a reused buffer, optionally copying it.
+
+    Args:
+        readinto: Fills a buffer and returns the byte count (0 at end of file)
+        head: Leading bytes to keep
+        write: Called with every chunk that was read, e.g. to copy it
+    """
+    digest = hashlib.sha256()
+    buffer = memoryview(bytearray(COPY_BUFSIZE))
+    first = b''
+    size = 0
+    while True:
+        n = readinto(buffer)
+        if not n:
+            break
+        chunk = buffer[:n]
+        digest.update(chunk)
+        if write is not None:
+            write(chunk)
+        if len(first) < head:
+            first += bytes(chunk[:head - len(first)])
+        size += n
+    return Fingerprint(size, digest.hexdigest(), first)
+
+
+def _not_found(path) -> FileNotFoundError:
+    return FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(path))
+
+
+def _error(cls, code: int, path) -> OSError:
+    return cls(code, os.strerror(code), str(path))
+
+
+class VaultPath(type(PurePath())):
+    """pathlib-style path whose I/O goes through a VaultFS backend"""
+
+    __slots__ = ('fs',)
+
+    def __init__(self, *args, fs: 'VaultFS' = None):
+        super().__init__(*args)
+        if fs is None:
+            fs = args[0].fs if args and isinstance(args[0], VaultPath) else LOCAL_DISK
+        self.fs = fs
+
+    def with_segments(self, *args) -> 'VaultPath':
+        return type(self)(*args, fs=self.fs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_posix()!r}, fs={type(self.fs).__name__})"
+
+    # Queries
+    def stat(self):
+        return self.fs.stat(self)
+
+    def exists(self) -> bool:
+        return self.fs.exists(self)
+
+    def is_file(self) -> bool:
+        return self.fs.is_file(self)
+
+    def is_dir(self) -> bool:
+        return self.fs.is_dir(self)
+
+    def iterdir(self) -> Iterator['VaultPath']:
+        return iter(self.fs.iterdir(self))
+
+    def glob(self, pattern: str) -> Iterator['VaultPath']:
+        return iter(self.fs.glob(self, pattern))
+
+    def rglob(self, pattern: str) -> Iterator['VaultPath']:
+        return iter(self.fs.glob(self, "**/" + pattern))
+
+    def resolve(self, strict: bool = False) -> 'VaultPath':
+        return self.with_segments(self.fs.resolve(self))
+
+    def absolute(self) -> 'VaultPath':
+        return self.with_segments(self.fs.resolve(self))
+
+    # Reading and writing
+    def open(self, mode: str = 'r', buffering: int = -1, encoding: str = None,
+             errors: str = None, newline: str = None):
+        return self.fs.open(self, mode, buffering, encoding, errors, newline)
+
+    def read_bytes(self) -> bytes:
+        return self.fs.read_bytes(self)
+
+    def read_text(self, encoding: str = None, errors: str = None, newline: str = None) -> str:
+        return self.fs.read_text(self, encoding, errors, newline)
+
+    def write_bytes(self, data: bytes) -> int:
+        return self.fs.write_bytes(self, data)
+
+    def write_text(self, data: str, encoding: str = None, errors: str = None, newline: str = None) -> int:
+        return self.fs.write_text(self, data, encoding, errors, newline)
+
+    def touch(self, mode: int = 0o666, exist_ok: bool = True):
+        self.fs.touch(self, exist_ok)
+
+    # Directory and name operations
+    def mkdir(self, mode: int = 0o777, parents: bool = False, exist_ok: bool = False):
+        self.fs.mkdir(self, parents, exist_ok)
+
+    def rmdir(self):
+        self.fs.rmdir(self)
+
+    def unlink(self, missing_ok: bool = False):
+        self.fs.unlink(self, missing_ok)
+
+    def rename(self, target: PathLike) -> 'VaultPath':
+        target = self.with_segments(target)
+        self.fs.rename(self, target)
+        return target
+
+    def replace(self, target: PathLike) -> 'VaultPath':
+        return self.rename(target)
+
+
+class VaultFS:
+    """
+    Filesystem interface every vault backend implements.
+
+    Backends provide the primitives (open, stat, scandir, mkdir, rename,
+    rename_no_clobber, link, unlink, rmdir); everything else is built on top of them.
+    All methods accept str, Path or VaultPath arguments.
+    """
+
+    # True when paths are real paths on the local disk
+    is_local = False
+
+    def __init__(self, root: PathLike):
+        self.root = VaultPath(root, fs=self)
+
+    def path(self, *parts: PathLike) -> VaultPath:
+        """Bind a path to this backend (relative parts are joined as given, not to root)."""
+        return VaultPath(*parts, fs=self)
+
+    def contains(self, path: PathLike) -> bool:
+        """Whether a path lies inside this backend's vault."""
+        root = str(self.root)
+        path = self.resolve(path)
+        return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+    # Change notification
+    def _absolute(self, path: PathLike) -> str:
+        return os.path.abspath(path)
+
+    def _watched(self, *paths: PathLike) -> bool:
+        """Whether any change listener covers one of these (non-hidden) paths."""
+        if not _change_listeners:
+            return False
+        for path in paths:
+            path = self._absolute(path)
+            if os.path.basename(path).startswith('.'):
+                continue
+            for root, exclude, _ in _change_listeners:
+                if path.startswith(root) and not path.startswith(exclude):
+                    return True
+        return False
+
+    def _write_kind(self, path: PathLike) -> Optional[str]:
+        """'create' or 'update' for a write about to happen, or None when nobody listens."""
+        if not self._watched(path):
+            return None
+        return 'update' if self.exists(path) else 'create'
+
+    def _rename_kind(self, src: PathLike, dst: PathLike) -> Optional[str]:
+        if os.path.basename(src).startswith('.'):
+            # Atomic replace through a hidden temp file: a write of dst
+            return self._write_kind(dst)
+        return 'move' if self._watched(src, dst) else None
+
+    def _notify(self, kind: Optional[str], path: PathLike, src: PathLike = None):
+        """Report a completed change ('create', 'update', 'move' or 'delete') to the listeners."""
+        if kind is None:
+            return
+        path = self._absolute(path)
+        src = self._absolute(src) if kind == 'move' else None
+        for root, exclude, callback in list(_change_listeners):
+            for candidate in (path, src):
+                if candidate and candidate.startswith(root) and not candidate.startswith(exclude):
+                    try:
+                        callback(kind, path, src)
+                    except Exception as e:
+                        logger.error(f"Change listener failed for {path}: {e}")
+                    break
+
+    # Primitives
+    def open(self, path: PathLike, mode: str = 'r', buffering: int = -1, encoding: str = None,
+             errors: str = None, newline: str = None):
+        raise NotImplementedError
+
+    def stat(self, path: PathLike):
+        raise NotImplementedError
+
+    def scandir(self, path: PathLike) -> List:
+        """List a directory as DirEntry-like objects whose stat() is cached."""
+        raise NotImplementedError
+
+    def mkdir(self, path: PathLike, parents: bool = False, exist_ok: bool = False):
+        raise NotImplementedError
+
+    def rename(self, src: PathLike, dst: PathLike):
+        """Rename src to dst, replacing dst if it exists (os.replace semantics)."""
+        raise NotImplementedError
+
+    def rename_no_clobber(self, src: PathLike, dst: PathLike) -> bool:
+        """Rename src to dst unless dst exists. Returns False on a name collision."""
+        raise NotImplementedError
+
+    def link(self, src: PathLike, dst: PathLike):
+        """Give src's content a second name (a hard link). Raises FileExistsError if dst exists."""
+        raise NotImplementedError
+
+    def unlink(self, path: PathLike, missing_ok: bool = False):
+        raise NotImplementedError
+
+    def rmdir(self, path: PathLike):
+        raise NotImplementedError
+
+    def resolve(self, path: PathLike) -> str:
+        """Absolute, normalised form of a path."""
+        raise NotImplementedError
+
+    def disk_usage(self, path: PathLike) -> DiskUsage:
+        raise NotImplementedError
+
+    def sync_file(self, f):
+        """Flush an open file's data to stable storage (no-op for backends without one)."""
+
+    def sync_dir(self, path: PathLike):
+        """Make renames and new entries in a directory durable (no-op for backends without one)."""
+
+    # Derived operations
+    def exists(self, path: PathLike) -> bool:
+        try:
+            self.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return True
+
+    def is_file(self, path: PathLike) -> bool:
+        try:
+            return stat.S_ISREG(self.stat(path).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def is_dir(self, path: PathLike) -> bool:
+        try:
+            return stat.S_ISDIR(self.stat(path).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def read_bytes(self, path: PathLike) -> bytes:
+        with self.open(path, 'rb') as f:
+            return f.read()
+
+    def read_text(self, path: PathLike, encoding: str = None, errors: str = None,
+                  newline: str = None) -> str:
+        with self.open(path, 'r', encoding=encoding, errors=errors, newline=newline) as f:
+            return f.read()
+
+    def write_bytes(self, path: PathLike, data: bytes) -> int:
+        with self.open(path, 'wb') as f:
+            return f.write(data)
+
+    def write_text(self, path: PathLike, data: str, encoding: str = None, errors: str = None,
+                   newline: str = None) -> int:
+        with self.open(path, 'w', encoding=encoding, errors=errors, newline=newline) as f:
+            return f.write(data)
+
+    def append_bytes(self, path: PathLike, data: bytes):
+        """Append data to a file in one write, creating the file if needed."""
+        with self.open(path, 'ab') as f:
+            f.write(data)
+
+    def touch(self, path: PathLike, exist_ok: bool = True):
+        if self.exists(path):
+            if not exist_ok:
+                raise _error(FileExistsError, errno.EEXIST, path)
+            return
+        self.open(path, 'ab').close()
+
+    def move(self, src: PathLike, dst: PathLike):
+        """Move a file; unlike rename this also works across devices."""
+        self.rename(src, dst)
+
+    def copy(self, src: PathLike, dst: PathLike):
+        """Copy a file's contents."""
+        with self.open(src, 'rb') as fsrc, self.open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst)
+
+    def fingerprint(self, path: PathLike, head: int = 0) -> Fingerprint:
+        """
+        Size and SHA-256 of a file, read once.
+
+        Args:
+            path: File to fingerprint
+            head: Leading bytes to return along with the hash
+        """
+        with self.open(path, 'rb') as f:
+            return _stream(f.readinto, head)
+
+    def relocate(self, src: PathLike, dst: PathLike, head: int = 0) -> Optional[Fingerprint]:
+        """
+        Move a file unless dst exists, and fingerprint it on the way.
+
+        Backends that have to copy the data (a move across devices) hash it
+        while copying, so the content is never read a second time.
+
+        Args:
+            src: File to move
+            dst: New name, which must not exist
+            head: Leading bytes to return along with the hash
+
+        Returns:
+            Fingerprint of the moved file, or None on a name collision
+        """
+        if not self.rename_no_clobber(src, dst):
+            return None
+        return self.fingerprint(dst, head)
+
+    @contextmanager
+    def atomic_write(self, path: PathLike, mode: str = 'w', encoding: str = None,
+                     errors: str = None, newline: str = None):
+        """
+        Write a file through a hidden sibling that replaces it only on success.
+
+        Args:
+            path: File to write
+            mode: 'w' for text or 'wb' for bytes
+
+        Yields:
+            Open file object for the new content
+        """
+        path = self.path(path)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with self.open(tmp, mode, encoding=encoding, errors=errors, newline=newline) as f:
+                yield f
+            self.rename(tmp, path)
+        except BaseException:
+            self.unlink(tmp, missing_ok=True)
+            raise
+
+    def iterdir(self, path: PathLike) -> List[VaultPath]:
+        path = self.path(path)
+        return [path / entry.name for entry in self.scandir(path)]
+
+    def walk(self, path: PathLike) -> Iterator[Tuple[VaultPath, List[str], List[str]]]:
+        """Top-down os.walk equivalent; prune dirnames in place to skip subtrees."""
+        pending = [self.path(path)]
+        while pending:
+            top = pending.pop()
+            try:
+                entries = self.scandir(top)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            dirnames = [entry.name for entry in entries if entry.is_dir()]
+            filenames = [entry.name for entry in entries if not entry.is_dir()]
+            yield top, dirnames, filenames
+            pending.extend(top / name for name in reversed(dirnames))
+
+    def glob(self, path: PathLike, pattern: str) -> List[VaultPath]:
+        """pathlib-style glob relative to path ('*', '?', '[...]' and '**' components)."""
+        matches = [self.path(path)]
+        for part in pattern.split('/'):
+            if part == '**':
+                matches = [top for base in matches for top, _, _ in self.walk(base)]
+            elif _GLOB_MAGIC.search(part):
+                expanded = []
+                for base in matches:
+                    try:
+                        entries = self.scandir(base)
+                    except (FileNotFoundError, NotADirectoryError):
+                        continue
+                    expanded.extend(base / entry.name for entry in entries
+                                    if fnmatch.fnmatchcase(entry.name, part))
+                matches = expanded
+            elif part:
+                matches = [base / part for base in matches if self.exists(base / part)]
+        return matches
+
+
+class LocalVaultFS(VaultFS):
+    """Vault on the local disk"""
+
+    is_local = True
+
+    def __init__(self, root: PathLike):
+        super().__init__(os.path.abspath(root))
+
+    def open(self, path, mode='r', buffering=-1, encoding=None, errors=None, newline=None):
+        if 'b' not in mode:
+            encoding = io.text_encoding(encoding)
+        kind = self._write_kind(path) if mode != 'r' and mode != 'rb' else None
+        f = open(path, mode, buffering, encoding, errors, newline)
+        self._notify(kind, path)
+        return f
+
+    def stat(self, path):
+        return os.stat(path)
+
+    def scandir(self, path) -> List[os.DirEntry]:
+        with os.scandir(path) as entries:
+            return list(entries)
+
+    def mkdir(self, path, parents=False, exist_ok=False):
+        if parents:
+            os.makedirs(path, exist_ok=exist_ok)
+            return
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not exist_ok or not os.path.isdir(path):
+                raise
+
+    def rename(self, src, dst):
+        kind = self._rename_kind(src, dst)
+        os.replace(src, dst)
+        self._notify(kind, dst, src)
+
+    def rename_no_clobber(self, src, dst) -> bool:
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            return False
+        except OSError:
+            # Hard links unsupported (or cross-device): fall back to a checked move
+            if os.path.lexists(dst):
+                return False
+            shutil.move(os.fspath(src), os.fspath(dst))
+        else:
+            os.unlink(src)
+        self._notify(self._rename_kind(src, dst), dst, src)
+        return True
+
+    def link(self, src, dst):
+        kind = self._write_kind(dst)
+        os.link(src, dst)
+        self._notify(kind, dst)
+
+    def unlink(self, path, missing_ok=False):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            if not missing_ok:
+                raise
+            return
+        self._notify('delete' if self._watched(path) else None, path)
+
+    def rmdir(self, path):
+        os.rmdir(path)
+
+    def resolve(self, path) -> str:
+        return os.path.realpath(path)
+
+    def disk_usage(self, path) -> DiskUsage:
+        return DiskUsage(*shutil.disk_usage(path))
+
+    def sync_file(self, f):
+        f.flush()
+        os.fsync(f.fileno())
+
+    def sync_dir(self, path):
+        # Directories cannot be opened for fsync on Windows
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def append_bytes(self, path, data: bytes):
+        kind = self._write_kind(path)
+        # O_APPEND keeps concurrent writers from interleaving within one write
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        self._notify(kind, path)
+
+    def move(self, src, dst):
+        kind = self._rename_kind(src, dst)
+        shutil.move(os.fspath(src), os.fspath(dst))
+        self._notify(kind, dst, src)
+
+    def copy(self, src, dst):
+        kind = self._write_kind(dst)
+        shutil.copy2(src, dst)
+        self._notify(kind, dst)
+
+    def relocate(self, src, dst, head=0) -> Optional[Fingerprint]:
+        try:
+            os.link(src, dst)
+        except FileExistsError:
+            return None
+        except OSError as e:
+            if os.path.lexists(dst):
+                return None
+            if e.errno == errno.EXDEV:
+                return self._relocate_by_copy(src, dst, head)
+            # Hard links unsupported: a plain rename, checked above
+            try:
+                os.rename(src, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                return self._relocate_by_copy(src, dst, head)
+        else:
+            os.unlink(src)
+        self._notify(self._rename_kind(src, dst), dst, src)
+        # Renamed without touching the data; it is read once, for the hash
+        return self.fingerprint(dst, head)
+
+    def _relocate_by_copy(self, src, dst, head) -> Optional[Fingerprint]:
+        """Copy across devices and hash in the same pass, then remove src."""
+        kind = self._rename_kind(src, dst)
+        try:
+            fd_out = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o644)
+        except FileExistsError:
+            return None
+        try:
+            with open(src, 'rb', buffering=0) as fsrc, open(fd_out, 'wb', buffering=0) as fdst:
+                def write(chunk):
+                    while chunk:
+                        chunk = chunk[fdst.write(chunk):]
+                fingerprint = _stream(fsrc.readinto, head, write)
+                os.fsync(fdst.fileno())
+            shutil.copystat(src, dst)
+        except BaseException:
+            os.unlink(dst)
+            raise
+        os.unlink(src)
+        self._notify(kind, dst, src)
+        logger.info(f"Copied {os.path.basename(src)} across devices ({fingerprint.size} bytes)")
+        return fingerprint
+
+    def glob(self, path, pattern) -> List[VaultPath]:
+        return [self.path(match) for match in Path(path).glob(pattern)]
+
+    @contextmanager
+    def atomic_write(self, path, mode='w', encoding=None, errors=None, newline=None):
+        path = self.path(path)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            if 'b' not in mode:
+                encoding = io.text_encoding(encoding)
+            with os.fdopen(fd, mode, encoding=encoding, errors=errors, newline=newline) as f:
+                yield f
+            kind = self._write_kind(path)
+            if os.path.exists(path):
+                shutil.copymode(path, tmp_name)
+            os.replace(tmp_name, path)
+            self._notify(kind, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+
+class _MemoryFile(io.BytesIO):
+    """Writable buffer that stores its content in a MemoryVaultFS when closed"""
+
+    def __init__(self, fs: 'MemoryVaultFS', key: str, initial: bytes = b'', append: bool = False):
+        super().__init__(initial)
+        self.name = key
+        self._fs = fs
+        self._key = key
+        self._append = append
+        if append:
+            self.seek(0, io.SEEK_END)
+
+    def close(self):
+        if not self.closed:
+            self._fs._store(self._key, self.getvalue(), self._append)
+        super().close()
+
+
+class MemoryDirEntry:
+    """os.DirEntry equivalent for MemoryVaultFS listings"""
+
+    __slots__ = ('name', 'path', '_fs', '_is_dir', '_stat')
+
+    def __init__(self, fs: 'MemoryVaultFS', path: str, name: str, is_dir: bool):
+        self.name = name
+        self.path = path
+        self._fs = fs
+        self._is_dir = is_dir
+        self._stat = None
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._is_dir
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return not self._is_dir
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def stat(self, follow_symlinks: bool = True) -> FileStat:
+        if self._stat is None:
+            self._stat = self._fs.stat(self.path)
+        return self._stat
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<MemoryDirEntry {self.name!r}>"
+
+
+class MemoryVaultFS(VaultFS):
+    """
+    Vault held entirely in memory.
+
+    Files are byte buffers keyed by absolute posix path; relative paths are
+    taken relative to the vault root. File and directory mtimes advance on
+    every change, so mtime-based change detection (e.g. VaultIndex) works the
+    same as on disk. Writes become visible when the file object is closed.
+    """
+
+    def __init__(self, root: PathLike = DEFAULT_MEMORY_ROOT):
+        self._lock = threading.RLock()
+        self._files: Dict[str, bytearray] = {}
+        self._dirs: Dict[str, Set[str]] = {'/': set()}
+        self._mtimes: Dict[str, int] = {'/': time.time_ns()}
+        self._last_ns = 0
+        self._root_key = '/'
+        super().__init__(self._key(root))
+        self._root_key = self._key(self.root)
+        self.mkdir(self.root, parents=True, exist_ok=True)
+
+    def _key(self, path: PathLike) -> str:
+        raw = os.fspath(path).replace(os.sep, '/')
+        if not raw.startswith('/'):
+            raw = posixpath.join(self._root_key, raw)
+        return posixpath.normpath(raw).replace('//', '/')
+
+    _absolute = _key
+
+    def _now(self) -> int:
+        # Strictly increasing, so two changes never share an mtime
+        self._last_ns = max(time.time_ns(), self._last_ns + 1)
+        return self._last_ns
+
+    def _parent(self, key: str, path) -> str:
+        parent = posixpath.dirname(key)
+        if parent not in self._dirs:
+            raise (_error(NotADirectoryError, errno.ENOTDIR, path) if parent in self._files
+                   else _not_found(path))
+        return parent
+
+    def _store(self, key: str, data, append: bool = False):
+        with self._lock:
+            if key in self._dirs:
+                raise _error(IsADirectoryError, errno.EISDIR, key)
+            parent = self._parent(key, key)
+            now = self._now()
+            if append and key in self._files:
+                self._files[key].extend(data)
+            else:
+                if key not in self._files:
+                    self._dirs[parent].add(posixpath.basename(key))
+                    self._mtimes[parent] = now
+                self._files[key] = bytearray(data)
+            self._mtimes[key] = now
+
+    def open(self, path, mode='r', buffering=-1, encoding=None, errors=None, newline=None):
+        key = self._key(path)
+        kind = mode.replace('b', '').replace('t', '')
+        with self._lock:
+            if key in self._dirs:
+                raise _error(IsADirectoryError, errno.EISDIR, path)
+            exists = key in self._files
+            if kind == 'r':
+                if not exists:
+                    raise _not_found(path)
+                buffer = io.BytesIO(bytes(self._files[key]))
+                buffer.name = key
+            elif kind == 'r+':
+                if not exists:
+                    raise _not_found(path)
+                buffer = _MemoryFile(self, key, bytes(self._files[key]))
+            elif kind in ('w', 'w+', 'x', 'x+'):
+                if exists and kind.startswith('x'):
+                    raise _error(FileExistsError, errno.EEXIST, path)
+                self._store(key, b'')
+                buffer = _MemoryFile(self, key)
+            elif kind in ('a', 'a+'):
+                if not exists:
+                    self._store(key, b'')
+                buffer = _MemoryFile(self, key, append=True)
+            else:
+                raise ValueError(f"invalid mode: {mode!r}")
+
+        if kind != 'r' and self._watched(key):
+            self._notify('update' if exists else 'create', key)
+        if 'b' in mode:
+            return buffer
+        return io.TextIOWrapper(buffer, encoding=io.text_encoding(encoding), errors=errors,
+                                newline=newline)
+
+    def stat(self, path) -> FileStat:
+        key = self._key(path)
+        with self._lock:
+            if key in self._files:
+                return FileStat(stat.S_IFREG | 0o644, len(self._files[key]), self._mtimes[key])
+            if key in self._dirs:
+                return FileStat(stat.S_IFDIR | 0o755, 0, self._mtimes[key])
+        raise _not_found(path)
+
+    def scandir(self, path) -> List[MemoryDirEntry]:
+        key = self._key(path)
+        with self._lock:
+            if key not in self._dirs:
+                raise (_error(NotADirectoryError, errno.ENOTDIR, path) if key in self._files
+                       else _not_found(path))
+            return [MemoryDirEntry(self, posixpath.join(key, name), name,
+                                   posixpath.join(key, name) in self._dirs)
+                    for name in self._dirs[key]]
+
+    def mkdir(self, path, parents=False, exist_ok=False):
+        key = self._key(path)
+        with self._lock:
+            if key in self._dirs:
+                if not exist_ok:
+                    raise _error(FileExistsError, errno.EEXIST, path)
+                return
+            if key in self._files:
+                raise _error(FileExistsError, errno.EEXIST, path)
+            parent = posixpath.dirname(key)
+            if parent not in self._dirs and parents:
+                self.mkdir(parent, parents=True, exist_ok=True)
+            parent = self._parent(key, path)
+            now = self._now()
+            self._dirs[key] = set()
+            self._mtimes[key] = now
+            self._dirs[parent].add(posixpath.basename(key))
+            self._mtimes[parent] = now
+
+    def _detach(self, key: str, now: int):
+        parent = posixpath.dirname(key)
+        self._dirs[parent].discard(posixpath.basename(key))
+        self._mtimes[parent] = now
+
+    def _attach(self, key: str, now: int):
+        parent = posixpath.dirname(key)
+        self._dirs[parent].add(posixpath.basename(key))
+        self._mtimes[parent] = now
+
+    def rename(self, src, dst):
+        kind = self._rename_kind(src, dst)
+        self._rename(src, dst)
+        self._notify(kind, dst, src)
+
+    def _rename(self, src, dst):
+        src_key, dst_key = self._key(src), self._key(dst)
+        with self._lock:
+            if src_key == dst_key:
+                if src_key not in self._files and src_key not in self._dirs:
+                    raise _not_found(src)
+                return
+            self._parent(dst_key, dst)
+            now = self._now()
+
+            if src_key in self._files:
+                if dst_key in self._dirs:
+                    raise _error(IsADirectoryError, errno.EISDIR, dst)
+                if dst_key not in self._files:
+                    self._attach(dst_key, now)
+                self._files[dst_key] = self._files.pop(src_key)
+                self._mtimes[dst_key] = self._mtimes.pop(src_key)
+                self._detach(src_key, now)
+                return
+
+            if src_key not in self._dirs:
+                raise _not_found(src)
+            if dst_key in self._files:
+                raise _error(NotADirectoryError, errno.ENOTDIR, dst)
+            if dst_key.startswith(src_key + '/'):
+                raise _error(OSError, errno.EINVAL, dst)
+            if self._dirs.get(dst_key):
+                raise _error(OSError, errno.ENOTEMPTY, dst)
+            if dst_key not in self._dirs:
+                self._attach(dst_key, now)
+            self._dirs.pop(dst_key, None)
+
+            prefix = src_key + '/'
+            for table in (self._files, self._dirs, self._mtimes):
+                for key in [k for k in table if k == src_key or k.startswith(prefix)]:
+                    table[dst_key + key[len(src_key):]] = table.pop(key)
+            self._detach(src_key, now)
+
+    def rename_no_clobber(self, src, dst) -> bool:
+        dst_key = self._key(dst)
+        kind = self._rename_kind(src, dst)
+        with self._lock:
+            if dst_key in self._files or dst_key in self._dirs:
+                return False
+            self._rename(src, dst)
+        # Listeners run outside the lock; they may use the backend themselves
+        self._notify(kind, dst, src)
+        return True
+
+    def link(self, src, dst):
+        src_key, dst_key = self._key(src), self._key(dst)
+        with self._lock:
+            if src_key not in self._files:
+                raise _not_found(src)
+            if dst_key in self._files or dst_key in self._dirs:
+                raise _error(FileExistsError, errno.EEXIST, dst)
+            self._parent(dst_key, dst)
+            self._attach(dst_key, self._now())
+            # Both names share one buffer, as hard links share an inode
+            self._files[dst_key] = self._files[src_key]
+            self._mtimes[dst_key] = self._mtimes[src_key]
+        self._notify('create' if self._watched(dst_key) else None, dst_key)
+
+    def unlink(self, path, missing_ok=False):
+        key = self._key(path)
+        with self._lock:
+            if key in self._dirs:
+                raise _error(IsADirectoryError, errno.EISDIR, path)
+            if key not in self._files:
+                if missing_ok:
+                    return
+                raise _not_found(path)
+            del self._files[key]
+            del self._mtimes[key]
+            self._detach(key, self._now())
+        self._notify('delete' if self._watched(key) else None, key)
+
+    def rmdir(self, path):
+        key = self._key(path)
+        with self._lock:
+            if key not in self._dirs:
+                raise _not_found(path)
+            if self._dirs[key]:
+                raise _error(OSError, errno.ENOTEMPTY, path)
+            if key == '/':
+                raise _error(PermissionError, errno.EBUSY, path)
+            del self._dirs[key]
+            del self._mtimes[key]
+            self._detach(key, self._now())
+
+    def resolve(self, path) -> str:
+        return self._key(path)
+
+    def disk_usage(self, path) -> DiskUsage:
+        with self._lock:
+            used = sum(len(data) for data in self._files.values())
+        free = 1 << 40
+        return DiskUsage(used + free, used, free)
+
+    def append_bytes(self, path, data: bytes):
+        key = self._key(path)
+        kind = self._write_kind(key)
+        with self._lock:
+            self._store(key, data, append=True)
+        self._notify(kind, key)
+
+    def contains(self, path) -> bool:
+        key = self._key(path)
+        return key == self._root_key or key.startswith(self._root_key.rstrip('/') + '/')
+
+
+# Shared backend for paths that are not inside a registered vault
+LOCAL_DISK = LocalVaultFS(os.sep)
+
+_backends: Dict[str, VaultFS] = {}
+_memory_backends: List[MemoryVaultFS] = []
+_backends_lock = threading.Lock()
+
+
+def add_change_listener(root: PathLike, callback: ChangeCallback, exclude: Tuple[PathLike, ...] = ()):
+    """
+    Call callback(kind, path, src) after every file change below root.
+
+    kind is 'create', 'update', 'move' (src is the old path) or 'delete'; paths
+    are absolute. Changes to hidden files are not reported.
+
+    Args:
+        root: Vault root (or any folder) to listen below
+        callback: Function called with each change
+        exclude: Folders below root whose changes are not reported
+    """
+    fs = root.fs if isinstance(root, VaultPath) else get_vault_fs(root)
+    sep = '/' if isinstance(fs, MemoryVaultFS) else os.sep
+    prefix = fs._absolute(root).rstrip(sep) + sep
+    excluded = tuple(fs._absolute(path).rstrip(sep) + sep for path in exclude)
+    with _backends_lock:
+        _change_listeners.append((prefix, excluded, callback))
+
+
+def remove_change_listener(callback: ChangeCallback):
+    """Stop calling a callback registered with add_change_listener()."""
+    with _backends_lock:
+        _change_listeners[:] = [entry for entry in _change_listeners if entry[2] != callback]
+
+
+def default_vault_path() -> str:
+    """The vault from VAULT_PATH, or AI_Employee_Vault at the repository root."""
+    return os.environ.get("VAULT_PATH") or os.path.join(REPO_ROOT, DEFAULT_VAULT_NAME)
+
+
+def register_vault_fs(fs: VaultFS) -> VaultFS:
+    """
+    Make get_vault_fs() return this backend for its root path.
+
+    Args:
+        fs: Backend to register (typically a MemoryVaultFS)
+
+    Returns:
+        The registered backend
+    """
+    with _backends_lock:
+        _backends[fs.resolve(fs.root)] = fs
+        if isinstance(fs, MemoryVaultFS) and fs not in _memory_backends:
+            _memory_backends.append(fs)
+    return fs
+
+
+def unregister_vault_fs(fs: VaultFS):
+    """Forget a backend registered with register_vault_fs()."""
+    with _backends_lock:
+        key = fs.resolve(fs.root)
+        if _backends.get(key) is fs:
+            del _backends[key]
+        if fs in _memory_backends:
+            _memory_backends.remove(fs)
+
+
+def get_vault_fs(vault_path: Optional[PathLike] = None) -> VaultFS:
+    """
+    Return the backend for a vault, creating a local one on first use.
+
+    Args:
+        vault_path: Vault root (str, Path or VaultPath). Defaults to VAULT_PATH
+            or AI_Employee_Vault at the repository root.
+
+    Returns:
+        Registered backend for that root, or a LocalVaultFS
+    """
+    if isinstance(vault_path, VaultPath):
+        return vault_path.fs
+    raw = os.fspath(vault_path) if vault_path is not None else default_vault_path()
+
+    with _backends_lock:
+        for fs in _memory_backends:
+            if fs.resolve(raw) == fs.resolve(fs.root):
+                return fs
+        key = os.path.abspath(raw)
+        fs = _backends.get(key)
+        if fs is None:
+            fs = _backends[key] = LocalVaultFS(key)
+        return fs
+
+
+def to_vault_path(path: PathLike) -> VaultPath:
+    """
+    Bind any path to the backend of the vault it lives in.
+
+    Paths inside a registered in-memory vault go to that backend; everything
+    else goes to the local disk.
+    """
+    if isinstance(path, VaultPath):
+        return path
+    with _backends_lock:
+        memory = list(_memory_backends)
+    for fs in memory:
+        if fs.contains(path):
+            return fs.path(path)
+    return LOCAL_DISK.path(path)
+
+
+def main():
+    """Show which backend serves the default vault and what it contains."""
+    fs = get_vault_fs()
+    print(f"Vault: {fs.root} ({type(fs).__name__})")
+    if not fs.is_dir(fs.root):
+        print("Vault folder does not exist yet")
+        return
+    for entry in sorted(fs.scandir(fs.root), key=lambda e: e.name):
+        if entry.is_dir() and not entry.name.startswith('.'):
+            print(f"{entry.name}: {len(fs.scandir(fs.path(entry.path)))} entries")
+
+
+if __name__ == "__main__":
+    main()
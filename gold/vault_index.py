@@ -0,0 +1,461 @@
+"""
+Vault Index for AI Employee
+
+This module keeps a persistent SQLite index of every file in the vault together
+with its parsed frontmatter (type, status, priority, platform, created), so that
+components can query a folder instead of listing it and re-reading every file.
+
+All file access goes through the vault's VaultFS backend. For an in-memory
+vault the index itself is an in-memory database as well.
+
+The index is kept current in three ways:
+- Writes made in this process through any VaultFS backend mark the files they
+  touch as stale (a change listener, see vault_fs.py), so a file whose
+  frontmatter was rewritten in place is re-read by the next query.
+- A watchdog observer (see VaultIndex.watch) does the same for changes made
+  by other processes, e.g. a status edited by hand (local vaults only). It is
+  opt-in for long-running processes: it handles every event the vault sees,
+  including the process's own writes.
+- Each folder is reconciled against disk the first time it is queried, but only
+  when the directory mtime has changed since the last reconciliation or one
+  of its files is stale.
+
+Differences a reconciliation finds in a previously synced folder are changes
+made outside the tiers (e.g. an approval moved by hand), so they are recorded
+in the change journal when journaling is active.
+"""
+import os
+import sys
+import sqlite3
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
+
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from frontmatter import read_frontmatter
+from vault_fs import VaultFS, VaultPath, add_change_listener, get_vault_fs, remove_change_listener
+from change_journal import active_change_journal
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".vault_index.db"
+
+# Frontmatter fields that get their own indexed column
+INDEXED_FIELDS = ["type", "status", "priority", "platform", "created"]
+
+# A directory modified this close to the last sync may have changed again within
+# the same timestamp tick, so its mtime is not trusted for skipping a re-list
+RACY_WINDOW_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    type TEXT,
+    status TEXT,
+    priority TEXT,
+    platform TEXT,
+    created TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_files_folder ON files(folder, name);
+CREATE TABLE IF NOT EXISTS folders (
+    folder TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    synced_ns INTEGER NOT NULL
+);
+"""
+
+PathLike = Union[str, Path, VaultPath]
+
+
+class VaultIndex:
+    """Persistent index of vault files and their frontmatter"""
+
+    def __init__(self, vault_path: str, db_path: str = None):
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root.resolve()
+        if db_path:
+            self.db_path = db_path
+        elif self.fs.is_local:
+            self.db_path = str(self.vault_path / INDEX_FILENAME)
+        else:
+            self.db_path = ":memory:"
+        self._lock = threading.RLock()
+        self._observer = None
+        # Folder -> names of files changed since the folder was last synced
+        self._stale: Dict[str, Set[str]] = {}
+
+        self.vault_path.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # Only files in folders synced before can go stale; others are listed in full
+        self._synced: Set[str] = {r['folder'] for r in self._conn.execute("SELECT folder FROM folders")}
+
+        add_change_listener(self.fs.root, self._on_change)
+
+    def _relative(self, path: PathLike) -> str:
+        """Convert a path (absolute or vault-relative) to a vault-relative posix string."""
+        path = self.vault_path.with_segments(path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.vault_path)
+        else:
+            try:
+                path = path.resolve().relative_to(self.vault_path)
+            except ValueError:
+                pass  # Already relative to the vault
+        rel = path.as_posix()
+        return '' if rel == '.' else rel
+
+    def _is_ignored(self, rel_path: str) -> bool:
+        """Skip hidden files and the index database itself."""
+        return any(part.startswith('.') for part in rel_path.split('/'))
+
+    def _upsert(self, rel_path: str, size: int, mtime_ns: int):
+        """Insert or refresh a single file row, parsing its frontmatter."""
+        folder, _, name = rel_path.rpartition('/')
+        fields = read_frontmatter(self.vault_path / rel_path).fields if name.endswith('.md') else {}
+        self._conn.execute(
+            """INSERT OR REPLACE INTO files
+               (path, folder, name, size, mtime_ns, type, status, priority, platform, created)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (rel_path, folder, name, size, mtime_ns, *[fields.get(f) for f in INDEXED_FIELDS])
+        )
+
+    def sync_folder(self, folder: PathLike, force: bool = False) -> int:
+        """
+        Reconcile one folder with disk.
+
+        The folder is only re-listed when its directory mtime differs from the
+        one recorded at the last sync (or when force is set, when one of its
+        files was marked stale, or when the last sync happened within the same
+        timestamp tick as the change). Files whose size and mtime are unchanged
+        are not re-read unless they are stale.
+
+        Args:
+            folder: Folder to reconcile (absolute or relative to the vault)
+            force: Re-list even if the directory mtime is unchanged
+
+        Returns:
+            Number of rows inserted, updated or removed
+        """
+        rel_folder = self._relative(folder)
+        dir_path = self.vault_path / rel_folder
+
+        with self._lock:
+            try:
+                dir_mtime = self.fs.stat(dir_path).st_mtime_ns
+            except FileNotFoundError:
+                cur = self._conn.execute("DELETE FROM files WHERE folder = ?", (rel_folder,))
+                self._conn.execute("DELETE FROM folders WHERE folder = ?", (rel_folder,))
+                self._conn.commit()
+                self._synced.discard(rel_folder)
+                self._stale.pop(rel_folder, None)
+                return cur.rowcount
+
+            row = self._conn.execute(
+                "SELECT mtime_ns, synced_ns FROM folders WHERE folder = ?", (rel_folder,)
+            ).fetchone()
+            stale = self._stale.pop(rel_folder, set())
+            if (row and not force and not stale and row['mtime_ns'] == dir_mtime
+                    and row['synced_ns'] - dir_mtime > RACY_WINDOW_NS):
+                return 0
+            synced_ns = time.time_ns()
+
+            known = {
+                r['name']: (r['size'], r['mtime_ns'])
+                for r in self._conn.execute(
+                    "SELECT name, size, mtime_ns FROM files WHERE folder = ?", (rel_folder,)
+                )
+            }
+
+            changes = 0
+            seen = set()
+            # (op, name) of the differences, journaled unless this is the first sync
+            found: List[Tuple[str, str]] = []
+            for entry in self.fs.scandir(dir_path):
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                st = entry.stat()
+                if entry.name in stale or known.get(entry.name) != (st.st_size, st.st_mtime_ns):
+                    rel_path = f"{rel_folder}/{entry.name}" if rel_folder else entry.name
+                    self._upsert(rel_path, st.st_size, st.st_mtime_ns)
+                    found.append(('update' if entry.name in known else 'create', entry.name))
+                    changes += 1
+
+            for name in set(known) - seen:
+                self._conn.execute(
+                    "DELETE FROM files WHERE folder = ? AND name = ?", (rel_folder, name)
+                )
+                found.append(('delete', name))
+                changes += 1
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO folders (folder, mtime_ns, synced_ns) VALUES (?, ?, ?)",
+                (rel_folder, dir_mtime, synced_ns)
+            )
+            self._conn.commit()
+            self._synced.add(rel_folder)
+
+        journal = active_change_journal(self.fs.root) if row and found else None
+        if journal is not None:
+            for op, name in found:
+                journal.record(op, self.fs.root / rel_folder / name)
+
+        if changes:
+            logger.debug(f"Vault index synced {rel_folder or '.'}: {changes} change(s)")
+        return changes
+
+    def _select(self, folder: PathLike, prefix: str = None, suffix: str = None,
+                contains: str = None, columns: str = "*", filters: Dict[str, Any] = None) -> List[sqlite3.Row]:
+        """Run a filtered query against one folder after syncing it."""
+        self.sync_folder(folder)
+        clauses = ["folder = ?"]
+        params = [self._relative(folder)]
+        if prefix:
+            clauses.append("substr(name, 1, ?) = ?")
+            params += [len(prefix), prefix]
+        if suffix:
+            clauses.append("substr(name, -?) = ?")
+            params += [len(suffix), suffix]
+        if contains:
+            clauses.append("instr(name, ?) > 0")
+            params.append(contains)
+        for field, value in (filters or {}).items():
+            if field not in INDEXED_FIELDS:
+                raise ValueError(f"Field '{field}' is not indexed")
+            clauses.append(f"{field} = ?")
+            params.append(value)
+
+        sql = f"SELECT {columns} FROM files WHERE {' AND '.join(clauses)} ORDER BY name"
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def list_files(self, folder: PathLike, prefix: str = None, suffix: str = None,
+                   contains: str = None) -> List[Path]:
+        """
+        List files in a folder.
+
+        Args:
+            folder: Folder to list (absolute or relative to the vault)
+            prefix: Only include names starting with this string
+            suffix: Only include names ending with this string
+            contains: Only include names containing this string
+
+        Returns:
+            List of absolute file paths, sorted by name
+        """
+        rows = self._select(folder, prefix, suffix, contains, columns="path")
+        return [self.vault_path / r['path'] for r in rows]
+
+    def query(self, folder: PathLike, prefix: str = None, suffix: str = None,
+              contains: str = None, **filters) -> List[Dict[str, Any]]:
+        """
+        Return index records for a folder, optionally filtered by frontmatter fields.
+
+        Example:
+            index.query("Plans/Pending_Approval/Social_Media", suffix=".md", platform="twitter")
+
+        Returns:
+            List of dictionaries with path, name, size, mtime_ns and the indexed fields
+        """
+        rows = self._select(folder, prefix, suffix, contains, filters=filters)
+        records = []
+        for r in rows:
+            record = dict(r)
+            record['path'] = self.vault_path / r['path']
+            records.append(record)
+        return records
+
+    def count(self, folder: PathLike, prefix: str = None, suffix: str = None,
+              contains: str = None, **filters) -> int:
+        """Count files in a folder matching the given filters."""
+        rows = self._select(folder, prefix, suffix, contains, columns="COUNT(*) AS n", filters=filters)
+        return rows[0]['n']
+
+    def get(self, path: PathLike) -> Optional[Dict[str, Any]]:
+        """Return the index record for a single file, or None if it is not indexed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM files WHERE path = ?", (self._relative(path),)
+            ).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        record['path'] = self.vault_path / row['path']
+        return record
+
+    def update_file(self, path: PathLike):
+        """Re-index a single file after it was created or modified."""
+        rel_path = self._relative(path)
+        if self._is_ignored(rel_path):
+            return
+        with self._lock:
+            try:
+                st = self.fs.stat(self.vault_path / rel_path)
+            except FileNotFoundError:
+                self._conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+            else:
+                self._upsert(rel_path, st.st_size, st.st_mtime_ns)
+            self._conn.commit()
+
+    def invalidate(self, path: PathLike):
+        """
+        Make the next query of a file's folder re-read the file.
+
+        A file rewritten in place keeps its folder's mtime, so sync_folder()
+        alone would go on returning its old frontmatter.
+        """
+        try:
+            rel_path = self._relative(path)
+        except ValueError:
+            return  # Outside the vault
+        self._mark_stale(rel_path)
+
+    def _mark_stale(self, rel_path: str):
+        if self._is_ignored(rel_path):
+            return
+        folder, _, name = rel_path.rpartition('/')
+        with self._lock:
+            if folder in self._synced:
+                self._stale.setdefault(folder, set()).add(name)
+
+    def _on_change(self, kind: str, path: str, src: Optional[str]):
+        # Backends report absolute, normalised paths: no need to resolve them
+        for changed in (path, src):
+            if changed:
+                try:
+                    self._mark_stale(self.fs.root.with_segments(changed).relative_to(self.fs.root).as_posix())
+                except ValueError:
+                    continue
+
+    def remove_file(self, path: PathLike):
+        """Drop a single file from the index after it was deleted."""
+        with self._lock:
+            self._conn.execute("DELETE FROM files WHERE path = ?", (self._relative(path),))
+            self._conn.commit()
+
+    def move_file(self, src: PathLike, dest: PathLike):
+        """Record that a file was moved or renamed."""
+        with self._lock:
+            self._conn.execute("DELETE FROM files WHERE path = ?", (self._relative(src),))
+            self._conn.commit()
+        self.update_file(dest)
+
+    def watch(self) -> Optional[Observer]:
+        """
+        Start a watchdog observer that keeps the index current.
+
+        Returns:
+            The running observer (call stop_watching() to stop it), or None for
+            a vault that is not on the local disk
+        """
+        if not self.fs.is_local:
+            return None
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.schedule(VaultIndexEventHandler(self), str(self.vault_path), recursive=True)
+            self._observer.start()
+            logger.info(f"Vault index watching {self.vault_path}")
+        return self._observer
+
+    def stop_watching(self):
+        """Stop the watchdog observer if it is running."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def close(self):
+        """Stop watching, close the database connection and drop the shared instance."""
+        self.stop_watching()
+        remove_change_listener(self._on_change)
+        with self._lock:
+            self._conn.close()
+        with _indexes_lock:
+            for key in [key for key, index in _indexes.items() if index is self]:
+                del _indexes[key]
+
+
+class VaultIndexEventHandler(FileSystemEventHandler):
+    """Applies watchdog events to a VaultIndex"""
+
+    def __init__(self, index: VaultIndex):
+        self.index = index
+
+    def _in_vault(self, path: str) -> bool:
+        try:
+            rel = Path(path).relative_to(self.index.vault_path).as_posix()
+        except ValueError:
+            return False
+        return not self.index._is_ignored(rel)
+
+    def on_created(self, event):
+        if not event.is_directory and self._in_vault(event.src_path):
+            self.index.invalidate(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory and self._in_vault(event.src_path):
+            self.index.invalidate(event.src_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory and self._in_vault(event.src_path):
+            self.index.remove_file(event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
+            return
+        if self._in_vault(event.src_path):
+            self.index.remove_file(event.src_path)
+        if self._in_vault(event.dest_path):
+            self.index.invalidate(event.dest_path)
+
+
+# Keyed by backend as well as root, so a new in-memory vault at the same root
+# does not reuse the index of an old one
+_indexes: Dict[Tuple[VaultFS, VaultPath], VaultIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_vault_index(vault_path: str) -> VaultIndex:
+    """Return the shared VaultIndex for a vault, creating it on first use."""
+    fs = get_vault_fs(vault_path)
+    key = (fs, fs.root.resolve())
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = VaultIndex(fs.root)
+        return _indexes[key]
+
+
+def main():
+    """Rebuild the index for the default vault and print folder counts"""
+    index = get_vault_index(get_vault_fs().root)
+
+    for folder in ["Needs_Action", "Done", "Plans", "Plans/Pending_Approval", "Social_Posts"]:
+        index.sync_folder(folder, force=True)
+        print(f"{folder}: {index.count(folder)} file(s)")
+
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Worker Pool for AI Employee
+
+This module runs file work on a fixed set of threads fed by a bounded queue,
+so the thread that notices work (a watchdog observer, a quiescence tracker)
+never does the work itself:
+
+    pool = WorkerPool(handle_file, workers=4, max_queue=256)
+    pool.start()
+    pool.submit(path)        # blocks while the queue is full
+    pool.stop()              # finishes queued work, then joins the workers
+
+A full queue makes submit() block, which pushes back on the producer instead
+of letting a backlog grow without limit in memory. metrics() reports queue
+depth, in-flight and completed counts, and per-item latency from submit() to
+completion (overall and time spent in the handler).
+"""
+import os
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+DEFAULT_QUEUE_SIZE = 256
+
+# Latency samples kept for the percentiles in metrics()
+LATENCY_SAMPLES = 1024
+
+_STOP = object()
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    """Count, mean and percentiles (in milliseconds) of latency samples in seconds."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "max_ms": round(ordered[-1] * 1000, 3)
+    }
+
+
+class WorkerPool:
+    """Fixed number of worker threads fed by a bounded queue"""
+
+    def __init__(self, handler: Callable[[Any], Any], workers: int = DEFAULT_WORKERS,
+                 max_queue: int = DEFAULT_QUEUE_SIZE, name: str = "worker"):
+        """
+        Args:
+            handler: Called with each submitted item on a worker thread
+            workers: Number of worker threads
+            max_queue: Items that may wait before submit() blocks
+            name: Thread name prefix (shows up in logs)
+        """
+        if workers < 1 or max_queue < 1:
+            raise ValueError("workers and max_queue must be at least 1")
+        self.handler = handler
+        self.workers = workers
+        self.max_queue = max_queue
+        self.name = name
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._in_flight = 0
+        self._blocked_submits = 0
+        self._max_depth = 0
+        self._latency: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._service: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def start(self):
+        """Start the worker threads."""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"{self.name}-{i + 1}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"Started {self.workers} {self.name} threads (queue size {self.max_queue})")
+
+    def submit(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Queue an item for a worker.
+
+        Blocks while the queue is full.
+
+        Args:
+            item: Passed to the handler
+            timeout: Seconds to wait for room in the queue (None waits forever)
+
+        Returns:
+            True if the item was queued, False if the timeout expired
+        """
+        entry = (time.monotonic(), item)
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self._blocked_submits += 1
+            try:
+                self._queue.put(entry, timeout=timeout)
+            except queue.Full:
+                return False
+        with self._lock:
+            self._submitted += 1
+            self._max_depth = max(self._max_depth, self._queue.qsize())
+        return True
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is _STOP:
+                    return
+                queued_at, item = entry
+                with self._lock:
+                    self._in_flight += 1
+                started = time.monotonic()
+                failed = False
+                try:
+                    self.handler(item)
+                except Exception as e:
+                    failed = True
+                    logger.error(f"{self.name} failed on {item}: {e}")
+                finished = time.monotonic()
+                with self._lock:
+                    self._in_flight -= 1
+                    self._completed += 1
+                    self._failed += failed
+                    self._latency.append(finished - queued_at)
+                    self._service.append(finished - started)
+            finally:
+                self._queue.task_done()
+
+    def join(self):
+        """Wait until every submitted item has been processed."""
+        self._queue.join()
+
+    def stop(self):
+        """Process what is queued, then stop the worker threads."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(_STOP)
+        for thread in threads:
+            thread.join()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Current queue and latency metrics.
+
+        Returns:
+            Queue depth, counters, and latency summaries in milliseconds:
+            `latency` from submit() to completion, `service_time` in the handler
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_depth,
+                "queue_capacity": self.max_queue,
+                "in_flight": self._in_flight,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "blocked_submits": self._blocked_submits,
+                "latency": _summary(list(self._latency)),
+                "service_time": _summary(list(self._service))
+            }
+
+
+def main():
+    """Demonstrate backpressure with a slow handler."""
+    pool = WorkerPool(lambda item: time.sleep(0.01), workers=4, max_queue=16, name="demo")
+    pool.start()
+
+    start = time.monotonic()
+    for i in range(200):
+        pool.submit(i)
+    pool.join()
+    print(f"Processed 200 items in {time.monotonic() - start:.2f}s")
+
+    pool.stop()
+    print(f"Pool metrics: {pool.metrics()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+Write Batch for AI Employee
+
+This module group-commits vault mutations. A gold cycle writes dozens of small
+files (plans, cross-domain references, social drafts, the integration
+dashboard, audit summaries, failed-action records); written one by one with
+write_text, a crash can leave any of them half-written, and a file that is
+rewritten several times per cycle (the daily audit summary) costs a full
+read and write every time.
+
+Components stage their writes, moves and deletes on a WriteBatch instead.
+Reads, existence checks and globs through the batch see the staged state, so
+read-modify-write code keeps working. commit() then:
+
+1. writes each staged file once, to a hidden temp sibling (fsync'd),
+2. renames the temp files over their targets and applies moves and deletes
+   in the order they were staged,
+3. fsyncs every touched directory once.
+
+Every file therefore either keeps its old content or gets its complete new
+content. The batch is a group commit, not an all-or-nothing transaction: if
+the process dies halfway through step 2, some targets are already replaced.
+If an operation fails, it and everything staged after it stay on the batch and
+are applied by the next commit.
+
+Staging coalesces work: rewriting a file replaces the staged content, moving
+a staged file retargets it, and deleting it drops the write altogether.
+
+WriteBatch mirrors the VaultFS methods components use for their outputs
+(write_text, read_text, exists, glob, rename, unlink, ...), so a component can
+hold either its VaultFS or a WriteBatch as its `writer`:
+
+    with WriteBatch(vault_path) as batch:
+        integrator.writer = batch
+        integrator.create_integration_dashboard()
+"""
+import io
+import os
+import sys
+import errno
+import fnmatch
+import logging
+import threading
+from typing import Dict, List, Optional, Set
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vault_fs import PathLike, VaultPath, get_vault_fs
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+STAT_KEYS = ("staged_writes", "coalesced_writes", "files_written", "bytes_written",
+             "renames", "unlinks", "file_fsyncs", "dir_fsyncs")
+
+
+class _Op:
+    """One staged mutation: write (data -> path), move (source -> path) or unlink (path)"""
+
+    __slots__ = ('kind', 'path', 'data', 'source')
+
+    def __init__(self, kind: str, path: VaultPath, data: bytes = None, source: VaultPath = None):
+        self.kind = kind
+        self.path = path
+        self.data = data
+        self.source = source
+
+
+def _not_found(path) -> FileNotFoundError:
+    return FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(path))
+
+
+def _encode(data: str, encoding: str = None, errors: str = None, newline: str = None) -> bytes:
+    """Encode text exactly as a file opened in text mode would."""
+    buffer = io.BytesIO()
+    with io.TextIOWrapper(buffer, encoding=io.text_encoding(encoding), errors=errors,
+                          newline=newline, write_through=True) as f:
+        f.write(data)
+        return buffer.getvalue()
+
+
+def _decode(data: bytes, encoding: str = None, errors: str = None, newline: str = None) -> str:
+    with io.TextIOWrapper(io.BytesIO(data), encoding=io.text_encoding(encoding), errors=errors,
+                          newline=newline) as f:
+        return f.read()
+
+
+class WriteBatch:
+    """Stages vault writes, moves and deletes and commits them as a group"""
+
+    def __init__(self, vault_path: Optional[PathLike] = None, durable: bool = True):
+        """
+        Args:
+            vault_path: Vault whose backend the batch writes through
+            durable: fsync written files and touched directories on commit
+        """
+        self.fs = get_vault_fs(vault_path)
+        self.root = self.fs.root
+        self.durable = durable
+        self._lock = threading.RLock()
+
+        self._ops: List[_Op] = []
+        self._writes: Dict[str, _Op] = {}   # target key -> pending write
+        self._moves: Dict[str, _Op] = {}    # target key -> pending move
+        self._removed: Set[str] = set()     # keys that no longer exist once committed
+
+        self.stats: Dict[str, int] = dict.fromkeys(STAT_KEYS, 0)
+
+    def _key(self, path: PathLike) -> str:
+        return os.path.abspath(os.fspath(path))
+
+    @property
+    def pending(self) -> int:
+        """Number of staged operations still to be committed."""
+        return sum(1 for op in self._ops if op.kind != 'dead')
+
+    # Staging
+    def write_bytes(self, path: PathLike, data: bytes) -> int:
+        """Stage the complete new content of a file."""
+        key = self._key(path)
+        data = bytes(data)
+        with self._lock:
+            self.stats["staged_writes"] += 1
+            op = self._writes.get(key)
+            if op is not None:
+                self.stats["coalesced_writes"] += 1
+                op.data = data
+            else:
+                self._drop_move(key)
+                op = _Op('write', self.fs.path(path), data)
+                self._ops.append(op)
+                self._writes[key] = op
+            self._removed.discard(key)
+        return len(data)
+
+    def write_text(self, path: PathLike, data: str, encoding: str = None, errors: str = None,
+                   newline: str = None) -> int:
+        self.write_bytes(path, _encode(data, encoding, errors, newline))
+        return len(data)
+
+    def rename(self, src: PathLike, dst: PathLike):
+        """Stage a rename of src to dst, replacing dst (os.replace semantics)."""
+        src_key, dst_key = self._key(src), self._key(dst)
+        if src_key == dst_key:
+            return
+        with self._lock:
+            if not self.exists(src):
+                raise _not_found(src)
+            self._drop_write(dst_key)
+            self._drop_move(dst_key)
+
+            write = self._writes.pop(src_key, None)
+            if write is not None:
+                # Write the content straight to its final name; whatever was
+                # under the old name on disk still has to go
+                write.path = self.fs.path(dst)
+                self._writes[dst_key] = write
+                if self.fs.exists(src) and src_key not in self._removed:
+                    self._ops.append(_Op('unlink', self.fs.path(src)))
+            else:
+                move = self._moves.pop(src_key, None)
+                if move is None:
+                    move = _Op('move', self.fs.path(dst), source=self.fs.path(src))
+                    self._ops.append(move)
+                else:
+                    # Retarget the staged move; the file it was going to
+                    # replace under the old name on disk still has to go
+                    move.path = self.fs.path(dst)
+                    if self.fs.exists(src):
+                        self._ops.append(_Op('unlink', self.fs.path(src)))
+                self._moves[dst_key] = move
+
+            self._removed.add(src_key)
+            self._removed.discard(dst_key)
+
+    def replace(self, src: PathLike, dst: PathLike):
+        self.rename(src, dst)
+
+    def unlink(self, path: PathLike, missing_ok: bool = False):
+        """Stage the removal of a file."""
+        key = self._key(path)
+        with self._lock:
+            if not self.exists(path):
+                if missing_ok:
+                    return
+                raise _not_found(path)
+            self._drop_write(key)
+            move = self._moves.pop(key, None)
+            if move is not None:
+                # A moved file that is then deleted: delete it where it is now
+                move.kind, move.path, move.source = 'unlink', move.source, None
+            elif self.fs.exists(path):
+                self._ops.append(_Op('unlink', self.fs.path(path)))
+            self._removed.add(key)
+
+    def _drop_write(self, key: str):
+        op = self._writes.pop(key, None)
+        if op is not None:
+            op.kind = 'dead'
+            op.data = None
+
+    def _drop_move(self, key: str):
+        """Turn a move onto key into a plain delete of its source (key is being overwritten)."""
+        op = self._moves.pop(key, None)
+        if op is not None:
+            op.kind, op.path, op.source = 'unlink', op.source, None
+
+    # Reads through the staged state
+    def read_bytes(self, path: PathLike) -> bytes:
+        key = self._key(path)
+        with self._lock:
+            if key in self._writes:
+                return self._writes[key].data
+            if key in self._moves:
+                return self.fs.read_bytes(self._moves[key].source)
+            if key in self._removed:
+                raise _not_found(path)
+        return self.fs.read_bytes(path)
+
+    def read_text(self, path: PathLike, encoding: str = None, errors: str = None,
+                  newline: str = None) -> str:
+        return _decode(self.read_bytes(path), encoding, errors, newline)
+
+    def exists(self, path: PathLike) -> bool:
+        key = self._key(path)
+        with self._lock:
+            if key in self._writes or key in self._moves:
+                return True
+            if key in self._removed:
+                return False
+        return self.fs.exists(path)
+
+    def is_file(self, path: PathLike) -> bool:
+        key = self._key(path)
+        with self._lock:
+            if key in self._writes or key in self._moves:
+                return True
+            if key in self._removed:
+                return False
+        return self.fs.is_file(path)
+
+    def glob(self, path: PathLike, pattern: str) -> List[VaultPath]:
+        """
+        Glob on the backend, adjusted for staged files.
+
+        Staged files are matched against the last pattern component when they
+        sit directly in path (or anywhere below it for '**/' patterns).
+        """
+        folder = self._key(path)
+        recursive = pattern.startswith('**/')
+        name_pattern = pattern.rsplit('/', 1)[-1]
+
+        with self._lock:
+            matches = [match for match in self.fs.glob(path, pattern)
+                       if self._key(match) not in self._removed]
+            seen = {self._key(match) for match in matches}
+            for key in list(self._writes) + list(self._moves):
+                parent, name = os.path.split(key)
+                inside = parent == folder or (recursive and parent.startswith(folder.rstrip(os.sep) + os.sep))
+                if inside and key not in seen and fnmatch.fnmatchcase(name, name_pattern):
+                    matches.append(self.fs.path(key))
+                    seen.add(key)
+        return matches
+
+    # Commit
+    def _temp_path(self, path: VaultPath) -> VaultPath:
+        return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.batch.tmp")
+
+    def commit(self) -> Dict[str, int]:
+        """
+        Apply the staged operations.
+
+        Returns:
+            Counters for this batch (cumulative over all commits)
+        """
+        with self._lock:
+            ops = [op for op in self._ops if op.kind != 'dead']
+            if not ops:
+                self.discard()
+                return dict(self.stats)
+
+            temps: Dict[int, VaultPath] = {}
+            touched: Dict[str, VaultPath] = {}
+            applied = 0
+            try:
+                # 1. Complete new contents next to their targets
+                for op in ops:
+                    if op.kind != 'write':
+                        continue
+                    tmp = self._temp_path(op.path)
+                    with self.fs.open(tmp, 'wb') as f:
+                        f.write(op.data)
+                        if self.durable:
+                            self.fs.sync_file(f)
+                            self.stats["file_fsyncs"] += 1
+                    temps[id(op)] = tmp
+                    self.stats["files_written"] += 1
+                    self.stats["bytes_written"] += len(op.data)
+
+                # 2. Swap them in, in staging order
+                for op in ops:
+                    if op.kind == 'write':
+                        self.fs.rename(temps.pop(id(op)), op.path)
+                        self.stats["renames"] += 1
+                    elif op.kind == 'move':
+                        self.fs.rename(op.source, op.path)
+                        self.stats["renames"] += 1
+                        touched[str(op.source.parent)] = op.source.parent
+                    else:
+                        self.fs.unlink(op.path, missing_ok=True)
+                        self.stats["unlinks"] += 1
+                    touched[str(op.path.parent)] = op.path.parent
+                    applied += 1
+
+                # 3. One fsync per directory makes the renames durable
+                if self.durable:
+                    for folder in touched.values():
+                        self.fs.sync_dir(folder)
+                        self.stats["dir_fsyncs"] += 1
+            finally:
+                for tmp in temps.values():
+                    self.fs.unlink(tmp, missing_ok=True)
+                # On failure the operations not yet applied stay staged, so
+                # the next commit picks them up where this one stopped
+                self._drop_applied(ops[:applied])
+
+        logger.info(f"Committed write batch: {len(ops)} operations in {len(touched)} directories")
+        return dict(self.stats)
+
+    def _drop_applied(self, applied: List[_Op]):
+        """Forget operations that reached the backend."""
+        done = {id(op) for op in applied}
+        self._ops = [op for op in self._ops if op.kind != 'dead' and id(op) not in done]
+        if not self._ops:
+            self.discard()
+            return
+        for staged in (self._writes, self._moves):
+            for key in [key for key, op in staged.items() if id(op) in done]:
+                del staged[key]
+
+    def discard(self):
+        """Drop everything staged since the last commit."""
+        with self._lock:
+            self._ops = []
+            self._writes.clear()
+            self._moves.clear()
+            self._removed.clear()
+
+    def __enter__(self) -> 'WriteBatch':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Commit even when the block failed: work staged before the error is
+        # complete, and every file is still replaced atomically
+        self.commit()
+        return False
+
+
+def main():
+    """Main function to demonstrate the write batch."""
+    vault_path = get_vault_fs().root
+    scratch = vault_path / "Logs"
+    scratch.mkdir(parents=True, exist_ok=True)
+
+    with WriteBatch(vault_path) as batch:
+        summary = scratch / "write_batch_demo.md"
+        for i in range(10):
+            batch.write_text(summary, f"# Write Batch Demo\n\nRevision {i + 1}\n")
+        batch.rename(summary, scratch / "write_batch_demo_final.md")
+        print(f"Staged {batch.stats['staged_writes']} writes, {batch.pending} operations pending")
+
+    print(f"Commit stats: {batch.stats}")
+    (scratch / "write_batch_demo_final.md").unlink()
+
+
+if __name__ == "__main__":
+    main()
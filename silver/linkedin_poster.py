@@ -3,7 +3,6 @@ LinkedIn Poster for AI Employee
 
 This module handles automatic LinkedIn post generation and posting.
 """
-import time
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -16,6 +15,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gold'))
 
 from config_loader import get_env_variable
+from frontmatter import update_frontmatter_field
+from vault_fs import get_vault_fs
+from action_ids import create_new_file, new_id
 
 # Configure logging
 logging.basicConfig(
@@ -28,7 +30,8 @@ class LinkedInPoster:
     """Handles LinkedIn posting functionality"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
         self.needs_action = self.vault_path / "Needs_Action"
         self.posts_dir = self.vault_path / "LinkedIn_Posts"
         self.posts_dir.mkdir(exist_ok=True)
@@ -62,7 +65,7 @@ What are your thoughts on these trends?
         if not content:
             content = self.generate_business_update(topic)
 
-        post_filename = f"LINKEDIN_POST_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        post_filename = f"LINKEDIN_POST_{new_id()}.md"
         post_path = self.posts_dir / post_filename
 
         post_content = f"""---
@@ -87,7 +90,7 @@ topic: {topic}
 ## Notes
 This post was automatically generated by the AI Employee.
 """
-        post_path.write_text(post_content)
+        create_new_file(post_path, post_content)
         logger.info(f"Created LinkedIn post draft: {post_path.name}")
         return post_path
 
@@ -98,12 +101,7 @@ This post was automatically generated by the AI Employee.
             scheduled_time = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
 
         # Update the post file with scheduled time
-        content = post_file.read_text()
-        updated_content = content.replace(
-            'scheduled: null',
-            f'scheduled: {scheduled_time.isoformat()}'
-        )
-        post_file.write_text(updated_content)
+        update_frontmatter_field(post_file, 'scheduled', scheduled_time.isoformat())
 
         logger.info(f"Scheduled post {post_file.name} for {scheduled_time}")
         return True
@@ -179,7 +177,7 @@ This post was automatically generated by the AI Employee.
             if response.status_code in [200, 201]:
                 # Success
                 response_data = response.json()
-                post_id = response_data.get('id', f"post_{int(time.time())}")
+                post_id = response_data.get('id', f"post_{new_id()}")
 
                 logger.info(f"Successfully posted to LinkedIn. Post ID: {post_id}")
 
@@ -264,12 +262,12 @@ This post was automatically generated by the AI Employee.
 
 def main():
     """Main function to demonstrate LinkedIn posting capability"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
 
-    poster = LinkedInPoster(str(vault_path))
+    poster = LinkedInPoster(vault_path)
 
     # Generate and create a sample post
     post_path = poster.create_post_draft(topic="achievement")
@@ -8,9 +8,14 @@ import logging
 import schedule
 import threading
 from datetime import datetime, timedelta
-from pathlib import Path
 import subprocess
 import sys
+import os
+
+# Add the gold tier directory to path for shared modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gold'))
+from vault_fs import get_vault_fs
+from action_ids import create_new_file, new_id
 
 # Configure logging
 logging.basicConfig(
@@ -23,7 +28,8 @@ class ScheduleManager:
     """Manages scheduled tasks for the AI Employee"""
 
     def __init__(self, vault_path: str):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
         self.dashboard_path = self.vault_path / "Dashboard.md"
         self.needs_action = self.vault_path / "Needs_Action"
 
@@ -140,8 +146,7 @@ created: {datetime.now().isoformat()}
 This post was automatically generated and scheduled by AI Employee based on optimal posting times.
 """
 
-        post_file = self.needs_action / f"LinkedIn_Post_Request_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-        post_file.write_text(post_content)
+        post_file = create_new_file(self.needs_action / f"LinkedIn_Post_Request_{new_id()}.md", post_content)
         logger.info(f"Created LinkedIn post request: {post_file.name}")
 
     def generate_sample_post(self):
@@ -177,12 +182,12 @@ Looking forward to next week's opportunities!
 
 def main():
     """Main function to demonstrate scheduling capabilities"""
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure if needed
     (vault_path / "Needs_Action").mkdir(exist_ok=True)
 
-    scheduler = ScheduleManager(str(vault_path))
+    scheduler = ScheduleManager(vault_path)
 
     # Instead of starting the actual scheduler (which would run forever),
     # let's just run one task to demonstrate functionality
@@ -6,14 +6,34 @@ components (Gmail, WhatsApp, LinkedIn watchers) and provides unified
 workflow management similar to the bronze tier but with silver tier
 capabilities like social media integration, scheduling, and human-in-the-loop
 approval workflows.
+
+Like the bronze orchestrator it runs one cycle by default, or keeps running
+with --daemon (or ORCHESTRATOR_MODE=daemon) and handles items as they arrive,
+paced by an ORCHESTRATOR_RATE / ORCHESTRATOR_BURST token bucket.
 """
 
-import time
 import logging
 from pathlib import Path
 from datetime import datetime
 import json
-import re
+import sys
+import os
+
+# Add the gold tier directory to path for shared modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gold'))
+from keyword_classifier import classify_text
+from dashboard_writer import DashboardWriter
+from done_archive import DoneArchive
+from vault_fs import get_vault_fs
+from change_journal import get_change_journal
+from action_ids import create_new_file, new_id
+from frontmatter import parse_frontmatter
+from config_loader import get_env_variable
+from token_bucket import DEFAULT_BURST, DEFAULT_RATE, TokenBucket
+from action_scheduler import ActionScheduler
+from orchestrator_daemon import OrchestratorDaemon
+from action_ledger import ActionLedger
+from pipeline import BATCH_SIZE, ApprovalGate, Archive, Classify, Ingest, Pace, Pipeline, Plan
 
 # Configure logging
 logging.basicConfig(
@@ -22,10 +42,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def process_needs_action_files(vault_path: Path):
-    """Process all files in the Needs_Action folder, prioritizing social media related actions"""
+# Appended to an action file before it is moved to Done
+SILVER_PROCESSING_LOG = "\n\n## Silver Tier Processing Log\n- [x] Processed at {time}\n- [x] Silver plan created and managed"
+
+def process_needs_action_files(vault_path: Path, dashboard: DashboardWriter = None,
+                               pace: TokenBucket = None, scheduler: ActionScheduler = None):
+    """Process all files in the Needs_Action folder, prioritizing social media related actions
+
+    Dashboard updates are collected in `dashboard` and written when the caller
+    flushes it; without one, a writer is created and flushed here. Files are
+    processed at the rate `pace` allows (a default token bucket without one),
+    most urgent first by priority, age and due date; a `scheduler` kept across
+    cycles only reads the frontmatter of new files. Files go through the silver
+    configuration of the shared stage pipeline (see gold/pipeline.py) in batches.
+    """
+    vault_path = get_vault_fs(vault_path).root
+    # Journal the moves to Done so the gold consumers see them
+    get_change_journal(vault_path)
+    owns_dashboard = dashboard is None
+    if owns_dashboard:
+        dashboard = DashboardWriter(vault_path)
+
     needs_action_dir = vault_path / "Needs_Action"
-    done_dir = vault_path / "Done"
+    archive = DoneArchive(vault_path)
     plans_dir = vault_path / "Plans"
     linkedin_posts_dir = vault_path / "LinkedIn_Posts"
     social_posts_dir = vault_path / "Social_Posts"
@@ -38,81 +77,54 @@ def process_needs_action_files(vault_path: Path):
     # Only process files that start with "ACTION_" and are .md files (not the .original files)
     action_files = [f for f in needs_action_dir.glob("*.md") if (f.name.startswith("ACTION_") or f.name.startswith("EMAIL_") or "social" in f.name.lower()) and ".original." not in f.name]
 
+    if scheduler is None:
+        scheduler = ActionScheduler()
+    scheduler.sync(action_files)
+
     if not action_files:
         logger.info("No action files to process in silver tier")
         return
 
-    for action_file in action_files:
-        logger.info(f"Processing action file in silver tier: {action_file.name}")
-
-        # Read the action file
-        content = action_file.read_text()
-
-        # Check if this is a social media related action
-        is_social_action = any(keyword in content.lower() for keyword in
-                              ['linkedin', 'social', 'post', 'tweet', 'facebook', 'instagram'])
-
-        # Create a Plan.md file based on the action file content
-        create_silver_plan_file(action_file, content, plans_dir, is_social_action)
-
-        # Update the content to mark as processed
-        updated_content = content + f"\n\n## Silver Tier Processing Log\n- [x] Processed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n- [x] Silver plan created and managed"
-
-        # Update Dashboard.md with this activity
-        dashboard_path = vault_path / "Dashboard.md"
-        if dashboard_path.exists():
-            dashboard_content = dashboard_path.read_text()
-            activity_marker = "## Recent Activity"
-            if activity_marker in dashboard_content:
-                activity_section_start = dashboard_content.find(activity_marker)
-                next_section_start = dashboard_content.find("\n## ", activity_section_start + len(activity_marker))
-                if next_section_start == -1:  # If it's the last section
-                    next_section_start = len(dashboard_content)
-
-                current_activity = dashboard_content[activity_section_start:next_section_start]
-
-                # Add new activity
-                new_activity = f"- [x] {datetime.now().strftime('%Y-%m-%d %H:%M')} - Silver Tier processed {action_file.name}"
-
-                if new_activity not in current_activity:
-                    updated_dashboard = (
-                        dashboard_content[:activity_section_start + len(activity_marker)] +
-                        f"\n{new_activity}" +
-                        dashboard_content[activity_section_start + len(activity_marker):]
-                    )
-                    dashboard_path.write_text(updated_dashboard)
-                    logger.info(f"Updated Dashboard.md with silver tier activity: {new_activity}")
-
-        # Write the updated content back to the file
-        action_file.write_text(updated_content)
-
-        # Look for associated original file (with .original extension)
-        original_extensions = ['.original.txt', '.original.md', '.original.pdf', '.original.doc', '.original.docx',
-                              '.original.jpg', '.original.png', '.original.gif', '.original.csv', '.original.xlsx']
-        original_file = None
-        for ext in original_extensions:
-            potential_file = action_file.with_suffix(ext)
-            if potential_file.exists():
-                original_file = potential_file
-                break
-
-        # Move the action file to Done folder
-        done_file = done_dir / action_file.name
-        action_file.rename(done_file)
-        logger.info(f"Moved {action_file.name} to Done folder")
-
-        # Move the original file to Done folder if it exists
-        if original_file and original_file.exists():
-            final_done_file = done_dir / original_file.name
-            original_file.rename(final_done_file)
-            logger.info(f"Moved original file {original_file.name} to Done folder")
-
-        # Add a delay to simulate processing time
-        time.sleep(0.5)
-
-def create_silver_plan_file(action_file: Path, content: str, plans_dir: Path, is_social_action: bool):
-    """Create a silver tier Plan.md file based on the action file content"""
-    plan_filename = f"PLAN_SILVER_{action_file.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+    if pace is None:
+        pace = TokenBucket(DEFAULT_RATE, DEFAULT_BURST)
+
+    # Stages that already went through for a file (before a crash or a failed
+    # run) are not repeated, so no second plan or approval request is written
+    pipeline = Pipeline("silver", [
+        Ingest("silver"),
+        # Paced by the token bucket rather than a fixed delay per file
+        Pace(pace),
+        Classify(),
+        # Social media related actions get a social media plan
+        Plan(lambda record: write_silver_plan_file(record.path, record.content, plans_dir,
+                                                   'social' in record.categories)),
+        ApprovalGate(lambda record: create_silver_approval_request(record.path, plans_dir, record.content,
+                                                                   record.categories), dashboard),
+        Archive(archive, SILVER_PROCESSING_LOG, dashboard, activity="Silver Tier processed {name}"),
+    ], ledger=ActionLedger(vault_path))
+    for batch in scheduler.batches(BATCH_SIZE):
+        pipeline.run(batch)
+
+    logger.info(f"Needs_Action queue by priority: {scheduler.stats()}")
+    logger.info(f"Pipeline stage timings: {pipeline.stats()}")
+
+    if owns_dashboard:
+        dashboard.flush()
+
+def create_silver_plan_file(action_file: Path, content: str, plans_dir: Path, is_social_action: bool,
+                            categories: dict = None) -> bool:
+    """Create a silver tier Plan.md file based on the action file content
+
+    Returns True if an approval request was also created.
+    """
+    write_silver_plan_file(action_file, content, plans_dir, is_social_action)
+
+    # Create approval request for sensitive actions
+    return create_silver_approval_request(action_file, plans_dir, content, categories)
+
+def write_silver_plan_file(action_file: Path, content: str, plans_dir: Path, is_social_action: bool) -> Path:
+    """Write the silver tier Plan.md file for an action file, returning its path"""
+    plan_filename = f"PLAN_SILVER_{action_file.stem}_{new_id()}.md"
     plan_path = plans_dir / plan_filename
 
     # Determine plan type based on action content
@@ -184,21 +196,22 @@ Process the request from the action file: {action_file.name}
 This plan was automatically generated by the Silver Tier Orchestrator based on the action file {action_file.name}.
 This tier focuses on multi-channel integration and social media management.
 """
-    plan_path.write_text(plan_content)
+    create_new_file(plan_path, plan_content)
     logger.info(f"Created silver tier plan file: {plan_path.name}")
+    return plan_path
 
-    # Create approval request for sensitive actions
-    create_silver_approval_request(action_file, plans_dir, content)
-
-def create_silver_approval_request(action_file: Path, plans_dir: Path, content: str):
-    """Create an approval request for sensitive silver tier actions"""
+def create_silver_approval_request(action_file: Path, plans_dir: Path, content: str, categories: dict = None) -> bool:
+    """Create an approval request for sensitive silver tier actions, returning True if one was created"""
     # Check if this is a sensitive action that requires approval
-    requires_approval = any(keyword in content.lower() for keyword in
-                           ['payment', 'invoice', 'money', 'financial', 'salary', 'confidential',
-                            'private', 'sensitive', 'urgent', 'critical'])
+    if categories is None:
+        categories = classify_text(content)
+    requires_approval = 'sensitive' in categories
+    if requires_approval and parse_frontmatter(content).get("auto_approve") == "true":
+        logger.info(f"{action_file.name} is auto-approved by its Inbox folder policy")
+        requires_approval = False
 
     if requires_approval:
-        approval_filename = f"APPROVAL_SILVER_{action_file.stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        approval_filename = f"APPROVAL_SILVER_{action_file.stem}_{new_id()}.md"
         approval_path = plans_dir / "Pending_Approval" / approval_filename
 
         # Create Pending_Approval directory if it doesn't exist
@@ -236,11 +249,14 @@ Move this file to the /Rejected folder with reasons.
 This silver tier action involves multi-channel integration and requires human approval before proceeding.
 Please review the source file and determine if the planned action is appropriate across all channels.
 """
-        approval_path.write_text(approval_content)
+        create_new_file(approval_path, approval_content)
         logger.info(f"Created silver tier approval request: {approval_path.name}")
 
+    return requires_approval
+
 def monitor_watchers_status(vault_path: Path):
     """Monitor the status of active watchers and log any issues"""
+    vault_path = get_vault_fs(vault_path).root
     logger.info("Monitoring silver tier watchers status...")
 
     # In a real implementation, this would check the status of running watchers
@@ -267,7 +283,7 @@ def monitor_watchers_status(vault_path: Path):
     logger.info(f"Watchers status logged to {status_file}")
 
 def main():
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     logger.info(f"Starting silver tier orchestrator for vault: {vault_path}")
 
@@ -283,50 +299,34 @@ def main():
     (vault_path / "Social_Posts").mkdir(exist_ok=True)
     (vault_path / "Logs").mkdir(exist_ok=True)
 
+    pace = TokenBucket(float(get_env_variable('ORCHESTRATOR_RATE', str(DEFAULT_RATE))),
+                       float(get_env_variable('ORCHESTRATOR_BURST', str(DEFAULT_BURST))))
+    if '--daemon' in sys.argv[1:] or get_env_variable('ORCHESTRATOR_MODE', 'once') == 'daemon':
+        scheduler = ActionScheduler()
+        daemon = OrchestratorDaemon(vault_path, lambda: run_silver_cycle(vault_path, pace, scheduler),
+                                    observer_mode=get_env_variable('INBOX_OBSERVER', 'auto'))
+        daemon.run()
+        return
+
+    run_silver_cycle(vault_path, pace)
+    logger.info("Silver tier orchestrator completed one cycle")
+
+def run_silver_cycle(vault_path: Path, pace: TokenBucket = None, scheduler: ActionScheduler = None):
+    """Process Needs_Action and check the watchers once, then update the dashboard"""
+    # Collect dashboard updates for the whole cycle
+    dashboard = DashboardWriter(vault_path)
+
     # Process any existing action files in the silver tier manner
-    process_needs_action_files(vault_path)
+    process_needs_action_files(vault_path, dashboard, pace, scheduler)
 
     # Monitor watcher status
     monitor_watchers_status(vault_path)
 
-    # Update system status in dashboard
-    dashboard_path = vault_path / "Dashboard.md"
-    if dashboard_path.exists():
-        dashboard_content = dashboard_path.read_text()
-        status_marker = "## System Status"
-        if status_marker in dashboard_content:
-            # Find the "Last Update:" part and replace the entire line
-            updated_dashboard = re.sub(
-                r'Last Update:.*$',
-                f'Last Update: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} (Silver Tier Orchestrator)',
-                dashboard_content,
-                flags=re.MULTILINE
-            )
-            # Update watchers status if needed
-            if "- Watchers: Active" in updated_dashboard:
-                # If watchers are already active, add silver tier info
-                updated_dashboard = updated_dashboard.replace(
-                    "- Watchers: Active",
-                    "- Watchers: Active (Gmail, WhatsApp, LinkedIn)\n- Silver Tier: Active"
-                )
-            elif "Watchers:" in updated_dashboard:
-                # Update the existing watchers status
-                updated_dashboard = re.sub(
-                    r'- Watchers:.*$',
-                    '- Watchers: Active (Gmail, WhatsApp, LinkedIn)\n- Silver Tier: Active',
-                    updated_dashboard,
-                    flags=re.MULTILINE
-                )
-            else:
-                # Add watchers status if not present
-                updated_dashboard = updated_dashboard.replace(
-                    "## System Status",
-                    "## System Status\n- Watchers: Active (Gmail, WhatsApp, LinkedIn)\n- Silver Tier: Active"
-                )
-
-            dashboard_path.write_text(updated_dashboard)
-
-    logger.info("Silver tier orchestrator completed one cycle")
+    # Update system status in dashboard and write it once
+    dashboard.set_status("Last Update", f'{datetime.now().strftime("%Y-%m-%d %H:%M:%S")} (Silver Tier Orchestrator)')
+    dashboard.set_status("Watchers", "Active (Gmail, WhatsApp, LinkedIn)")
+    dashboard.set_status("Silver Tier", "Active")
+    dashboard.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
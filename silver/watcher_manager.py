@@ -3,10 +3,15 @@ Watcher Manager for AI Employee
 
 This script manages multiple watchers and runs them concurrently.
 """
+import os
+import sys
 import logging
 import threading
 import time
-from pathlib import Path
+
+# Add the gold tier directory to path for shared modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gold'))
+from vault_fs import get_vault_fs
 
 # Configure logging
 logging.basicConfig(
@@ -16,7 +21,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 def main():
-    vault_path = Path("../AI_Employee_Vault")
+    vault_path = get_vault_fs().root
 
     # Create vault structure
     (vault_path / "Inbox").mkdir(exist_ok=True)
@@ -34,9 +39,9 @@ def main():
         from watchers.linkedin_watcher import LinkedInWatcher
 
         # Create instances of watchers
-        gmail_watcher = GmailWatcher(str(vault_path))
-        whatsapp_watcher = WhatsAppWatcher(str(vault_path))
-        linkedin_watcher = LinkedInWatcher(str(vault_path))
+        gmail_watcher = GmailWatcher(vault_path)
+        whatsapp_watcher = WhatsAppWatcher(vault_path)
+        linkedin_watcher = LinkedInWatcher(vault_path)
 
         # Run watchers in separate threads
         threads = []
@@ -3,12 +3,20 @@ Base Watcher class for AI Employee
 
 This provides a common interface for all watcher implementations.
 """
+import os
+import sys
 import time
 import logging
 from pathlib import Path
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+# Add the gold tier directory to path for shared modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'gold'))
+from vault_fs import get_vault_fs
+from change_journal import get_change_journal
+from action_ids import create_new_file, new_id
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,7 +27,8 @@ class BaseWatcher(ABC):
     """Abstract base class for all watchers"""
 
     def __init__(self, vault_path: str, check_interval: int = 60):
-        self.vault_path = Path(vault_path)
+        self.fs = get_vault_fs(vault_path)
+        self.vault_path = self.fs.root
         self.needs_action = self.vault_path / 'Needs_Action'
         self.check_interval = check_interval
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -27,6 +36,9 @@ class BaseWatcher(ABC):
         # Create necessary directories
         self.needs_action.mkdir(parents=True, exist_ok=True)
 
+        # New action files are journaled for the gold consumers
+        self.journal = get_change_journal(self.vault_path)
+
     @abstractmethod
     def check_for_updates(self) -> list:
         """Return list of new items to process"""
@@ -37,6 +49,14 @@ class BaseWatcher(ABC):
         """Create .md file in Needs_Action folder"""
         pass
 
+    def new_item_id(self, prefix: str) -> str:
+        """Unique, time-sortable ID for an item picked up by this watcher"""
+        return f"{prefix}_{new_id()}"
+
+    def write_new_action_file(self, filename: str, content: str) -> Path:
+        """Create a file in Needs_Action; raises FileExistsError instead of replacing one"""
+        return create_new_file(self.needs_action / filename, content)
+
     def run(self):
         """Main run loop for the watcher"""
         self.logger.info(f'Starting {self.__class__.__name__}')
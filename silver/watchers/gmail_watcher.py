@@ -53,7 +53,7 @@ class GmailWatcher(BaseWatcher):
         # snippet = email_message.get('snippet', '')
 
         # For demo, we'll create a sample action file
-        email_id = f"demo_{int(time.time())}"
+        email_id = self.new_item_id("demo")
 
         content = f"""---
 type: email
@@ -86,8 +86,7 @@ email_id: {email_id}
 ## Notes
 This is a demo email for Silver Tier implementation.
 """
-        filepath = self.needs_action / f'EMAIL_{email_id}.md'
-        filepath.write_text(content)
+        filepath = self.write_new_action_file(f'EMAIL_{email_id}.md', content)
         self.processed_ids.add(email_id)
         self.logger.info(f"Created action file: {filepath.name}")
         return filepath
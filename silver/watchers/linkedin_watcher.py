@@ -39,7 +39,7 @@ class LinkedInWatcher(BaseWatcher):
         """
         Create action file for a LinkedIn activity.
         """
-        activity_id = f"linkedin_{int(time.time())}"
+        activity_id = self.new_item_id("linkedin")
 
         content = f"""---
 type: linkedin
@@ -78,8 +78,7 @@ activity_id: {activity_id}
 ## Notes
 LinkedIn activities can contain business opportunities - prioritize accordingly.
 """
-        filepath = self.needs_action / f'LINKEDIN_{activity_id}.md'
-        filepath.write_text(content)
+        filepath = self.write_new_action_file(f'LINKEDIN_{activity_id}.md', content)
         self.logger.info(f"Created LinkedIn action file: {filepath.name}")
         return filepath
 
@@ -41,7 +41,7 @@ class WhatsAppWatcher(BaseWatcher):
         """
         Create action file for a WhatsApp message.
         """
-        message_id = f"whatsapp_{int(time.time())}"
+        message_id = self.new_item_id("whatsapp")
 
         content = f"""---
 type: whatsapp
@@ -74,8 +74,7 @@ message_id: {message_id}
 ## Notes
 Priority: High - WhatsApp messages typically require quick responses.
 """
-        filepath = self.needs_action / f'WHATSAPP_{message_id}.md'
-        filepath.write_text(content)
+        filepath = self.write_new_action_file(f'WHATSAPP_{message_id}.md', content)
         self.logger.info(f"Created WhatsApp action file: {filepath.name}")
         return filepath
 